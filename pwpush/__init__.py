@@ -1,11 +1,14 @@
 # mypy: disable-error-code="attr-defined"
 """Command Line Interface to Password Pusher - secure information distribution with automatic expiration controls."""
 
-from importlib import metadata as importlib_metadata
+from typing import Any
+
 from pathlib import Path
 
 
 def get_version() -> str:
+    from importlib import metadata as importlib_metadata
+
     try:
         return importlib_metadata.version(__name__)
     except importlib_metadata.PackageNotFoundError:
@@ -42,4 +45,13 @@ def get_version() -> str:
         return "unknown"
 
 
-version: str = get_version()
+# Resolved on first access: importing importlib.metadata is a noticeable part
+# of CLI start-up, and most commands never print the version.
+version: str
+
+
+def __getattr__(name: str) -> Any:
+    if name == "version":
+        globals()["version"] = get_version()
+        return globals()["version"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
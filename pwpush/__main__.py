@@ -1,27 +1,70 @@
 # mypy: disable-error-code="attr-defined"
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator, List, TypeVar
 
 import json
+import threading
 import time
 from enum import Enum
+from pathlib import Path
 
 import typer
 from rich import print as rprint
 from rich.console import Console
 
-from pwpush import version
-from pwpush.api.capabilities import detect_api_profile
-from pwpush.api.client import normalize_base_url, send_request
-from pwpush.commands import config
+import pwpush
+from pwpush.api.capabilities import (
+    API_PROFILE_LEGACY,
+    API_PROFILE_V2,
+    detect_api_profile,
+)
+from pwpush.api.client import (
+    DEFAULT_POOL_SIZE,
+    get_session,
+    normalize_base_url,
+    perform_request,
+    send_request,
+)
+from pwpush.api.concurrency import DEFAULT_MAX_CONCURRENCY, adaptive_concurrency
+from pwpush.api.retry import (
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_RETRY_STATUSES,
+    JITTER_MODES,
+    RETRY_METHOD_MODES,
+    RetryBudget,
+    RetryPolicy,
+    parse_retry_statuses,
+)
+from pwpush.commands import config, ledger
 from pwpush.commands.auth import login_cmd, logout_cmd
+from pwpush.commands.batch import HELP_TEXT as PUSH_BATCH_HELP_TEXT
+from pwpush.commands.batch import push_batch_cmd
 from pwpush.commands.config import save_config, user_config
-from pwpush.commands.manage import audit_cmd, expire_cmd, list_cmd
+from pwpush.commands.generate import HELP_TEXT as GENERATE_HELP_TEXT
+from pwpush.commands.generate import generate_cmd
+from pwpush.commands.manage import (
+    SWEEP_HELP_TEXT,
+    audit_cmd,
+    expire_cmd,
+    list_cmd,
+    sweep_cmd,
+)
 from pwpush.commands.push import HELP_TEXT as PUSH_HELP_TEXT
 from pwpush.commands.push import push_cmd, push_file_cmd
 from pwpush.commands.request import HELP_TEXT as REQUEST_HELP_TEXT
 from pwpush.commands.request import request_cmd
-from pwpush.options import cli_options, config_file_exists
-from pwpush.utils import parse_boolean
+from pwpush.commands.serve import HELP_TEXT as SERVE_HELP_TEXT
+from pwpush.commands.serve import serve_cmd
+from pwpush.options import (
+    cli_options,
+    config_file_exists,
+    config_lock,
+    ensure_config_loaded,
+    retry_overrides,
+)
+from pwpush.utils import map_bounded, parse_boolean
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 class Color(str, Enum):
@@ -43,12 +86,19 @@ app = typer.Typer(
 )
 console = Console()
 
+_profile_refresh_lock = threading.Lock()
+_profile_refresh_thread: threading.Thread | None = None
+_speculative_profiles: set[str] = set()
+# Retry budget shared by every request of the current command
+_retry_budget: RetryBudget | None = None
+_retry_budget_lock = threading.Lock()
+
 
 def show_welcome_screen() -> None:
     """Display a helpful welcome screen with basic usage information."""
     console.print()
     console.print("[bold blue]🔐 Password Pusher CLI[/bold blue]")
-    console.print(f"[dim]Version {version}[/dim]")
+    console.print(f"[dim]Version {pwpush.version}[/dim]")
     console.print(f"[dim]Server: {user_config['instance']['url']}[/dim]")
     console.print(
         "[dim]Setup or change defaults: " "[cyan]pwpush config wizard[/cyan][/dim]"
@@ -91,7 +141,7 @@ def show_help_with_config() -> None:
     """Display help with configuration information."""
     console.print()
     console.print("[bold blue]🔐 Password Pusher CLI[/bold blue]")
-    console.print(f"[dim]Version {version}[/dim]")
+    console.print(f"[dim]Version {pwpush.version}[/dim]")
     console.print()
     console.print(
         "Command Line Interface to Password Pusher - securely share passwords, secrets, and files with expiration controls."
@@ -135,15 +185,28 @@ def show_help_with_config() -> None:
     )
     console.print("  [cyan]push[/cyan]        Push a new password, secret note or text")
     console.print("  [cyan]push-file[/cyan]   Push a new file")
+    console.print(
+        "  [cyan]push-batch[/cyan]  Create many pushes from JSONL or CSV records"
+    )
+    console.print("  [cyan]generate[/cyan]    Generate secure random secrets locally")
     console.print(
         "  [cyan]request[/cyan]     Create a request for someone to send you a secret (Pro)"
     )
     console.print("  [cyan]expire[/cyan]      Expire a push")
+    console.print(
+        "  [cyan]sweep[/cyan]       Expire every active push matching filters"
+    )
     console.print("  [cyan]audit[/cyan]       Show the audit log for the given push")
     console.print("  [cyan]list[/cyan]        List active pushes (if logged in)")
+    console.print(
+        "  [cyan]ledger[/cyan]      Find pushes in the local ledger by name or note"
+    )
     console.print(
         "  [cyan]config[/cyan]      Setup, show, and modify CLI configuration"
     )
+    console.print(
+        "  [cyan]serve[/cyan]       Run a local daemon that keeps the CLI warm"
+    )
     console.print()
     console.print("[bold]Global Options:[/bold]")
     console.print("  [cyan]--json, -j[/cyan]     Output results in JSON format")
@@ -160,6 +223,17 @@ def show_help_with_config() -> None:
     console.print()
 
 
+def api_profile_ttl_seconds() -> int:
+    """Return how long cached profile and capability data may be trusted."""
+    try:
+        ttl_seconds = int(
+            user_config["instance"].get("api_profile_ttl_seconds", "3600")
+        )
+    except ValueError:
+        ttl_seconds = 3600
+    return max(ttl_seconds, 0)
+
+
 def current_api_profile(
     *, base_url: str | None = None, email: str | None = None, token: str | None = None
 ) -> str:
@@ -179,22 +253,38 @@ def current_api_profile(
     except ValueError:
         persisted_checked_at = 0
 
-    try:
-        ttl_seconds = int(instance_settings.get("api_profile_ttl_seconds", "3600"))
-    except ValueError:
-        ttl_seconds = 3600
-    ttl_seconds = max(ttl_seconds, 0)
+    ttl_seconds = api_profile_ttl_seconds()
 
     now = int(time.time())
     within_ttl = (now - persisted_checked_at) < ttl_seconds
-    can_use_persisted = (
+    has_persisted = (
         resolved_base_url == configured_base_url
         and persisted_profile in ("v2", "legacy")
         and persisted_checked_at > 0
-        and within_ttl
     )
 
-    if can_use_persisted:
+    if has_persisted and within_ttl:
+        return persisted_profile
+
+    # Nothing recorded yet: optionally guess v2 and let the first request confirm it.
+    if (
+        base_url is None
+        and persisted_checked_at <= 0
+        and parse_boolean(instance_settings.get("api_profile_speculative", "False"))
+    ):
+        _speculative_profiles.add(resolved_base_url)
+        return API_PROFILE_V2
+
+    # Serve the stale profile now and refresh it alongside the command's request.
+    if has_persisted and parse_boolean(
+        instance_settings.get("api_profile_background_refresh", "False")
+    ):
+        _start_background_profile_refresh(
+            base_url=resolved_base_url,
+            email=resolved_email,
+            token=resolved_token,
+            ttl_seconds=ttl_seconds,
+        )
         return persisted_profile
 
     detected_profile = detect_api_profile(
@@ -202,16 +292,124 @@ def current_api_profile(
         email=resolved_email,
         token=resolved_token,
         debug=debug_output(),
+        ttl_seconds=ttl_seconds,
     )
 
     if resolved_base_url == configured_base_url:
-        instance_settings["api_profile"] = detected_profile
-        instance_settings["api_profile_checked_at"] = str(now)
-        save_config()
+        _record_api_profile(detected_profile, now)
 
     return detected_profile
 
 
+def _record_api_profile(profile: str, checked_at: int) -> None:
+    """Persist a detected profile for the configured instance.
+
+    Runs on the background refresh thread too, so the change and the save
+    happen under config_lock, which save_config also takes.
+    """
+    with config_lock:
+        user_config["instance"]["api_profile"] = profile
+        user_config["instance"]["api_profile_checked_at"] = str(checked_at)
+        save_config()
+
+
+def _start_background_profile_refresh(
+    *, base_url: str, email: str, token: str, ttl_seconds: int
+) -> None:
+    """Re-detect the API profile on a worker thread and persist the result.
+
+    The thread is non-daemon so the interpreter waits for the config write
+    to finish before exiting; at most one refresh runs at a time.
+    """
+    global _profile_refresh_thread
+
+    def refresh() -> None:
+        detected_profile = detect_api_profile(
+            base_url=base_url,
+            email=email,
+            token=token,
+            debug=debug_output(),
+            ttl_seconds=ttl_seconds,
+        )
+        _record_api_profile(detected_profile, int(time.time()))
+
+    with _profile_refresh_lock:
+        if _profile_refresh_thread is not None and _profile_refresh_thread.is_alive():
+            return
+        _profile_refresh_thread = threading.Thread(
+            target=refresh, name="pwpush-profile-refresh"
+        )
+        _profile_refresh_thread.start()
+
+
+def wait_for_profile_refresh(timeout: float | None = None) -> None:
+    """Block until a pending background profile refresh has finished."""
+    thread = _profile_refresh_thread
+    if thread is not None:
+        thread.join(timeout)
+
+
+def request_with_profile_fallback(
+    method: str,
+    api_profile: str,
+    build_request: Callable[
+        [str], tuple[str, dict[str, Any] | None, dict[str, Any] | None]
+    ],
+    *,
+    on_rate_limit_retry: Any | None = None,
+    on_upload_progress: Callable[[int, int], None] | None = None,
+    raise_errors: bool = False,
+) -> tuple[Any, str]:
+    """Send a profile-dependent request, falling back to legacy on a v2 404.
+
+    build_request maps a profile to (path, post_data, upload_files). When the
+    profile was guessed by speculative resolution, a 404 from the v2 endpoint
+    is retried with the legacy path and payload shape. Whichever profile the
+    server accepted is recorded so later invocations skip the guess.
+    raise_errors is passed on to make_request.
+
+    Returns:
+        The final response and the profile it was sent with.
+    """
+    instance_url = normalize_base_url(user_config["instance"]["url"])
+    path, post_data, upload_files = build_request(api_profile)
+    response = make_request(
+        method,
+        path,
+        post_data=post_data,
+        upload_files=upload_files,
+        on_rate_limit_retry=on_rate_limit_retry,
+        on_upload_progress=on_upload_progress,
+        raise_errors=raise_errors,
+    )
+
+    if instance_url not in _speculative_profiles or api_profile != API_PROFILE_V2:
+        return response, api_profile
+
+    if response.status_code != 404:
+        _speculative_profiles.discard(instance_url)
+        _record_api_profile(API_PROFILE_V2, int(time.time()))
+        return response, API_PROFILE_V2
+
+    path, post_data, upload_files = build_request(API_PROFILE_LEGACY)
+    legacy_response = make_request(
+        method,
+        path,
+        post_data=post_data,
+        upload_files=upload_files,
+        on_rate_limit_retry=on_rate_limit_retry,
+        on_upload_progress=on_upload_progress,
+        raise_errors=raise_errors,
+    )
+    # A legacy 404 too means the resource is missing, not the v2 API.
+    if legacy_response.status_code == 404:
+        return response, API_PROFILE_V2
+
+    _speculative_profiles.discard(instance_url)
+    _record_api_profile(API_PROFILE_LEGACY, int(time.time()))
+    return legacy_response, API_PROFILE_LEGACY
+
+
 def require_api_token(operation: str) -> None:
     """Require a configured API token before authenticated operations."""
     token = user_config["instance"]["token"].strip()
@@ -260,6 +458,31 @@ def load_cli_options(
         "-d",
         help="Enable debug mode with detailed request/response logging.",
     ),
+    retries: int | None = typer.Option(
+        None,
+        "--retries",
+        help="Retries per request for rate limits, server errors and connection resets.",
+    ),
+    retry_on: str | None = typer.Option(
+        None,
+        "--retry-on",
+        help="Comma-separated HTTP statuses to retry (e.g. 429,502,503,504).",
+    ),
+    retry_methods: str | None = typer.Option(
+        None,
+        "--retry-methods",
+        help="Retry server errors and resets for 'idempotent' requests only, or 'all' (including creating pushes).",
+    ),
+    retry_budget: int | None = typer.Option(
+        None,
+        "--retry-budget",
+        help="Most retries for the whole command, e.g. a batch (0 = no limit).",
+    ),
+    retry_deadline: float | None = typer.Option(
+        None,
+        "--retry-deadline",
+        help="Seconds after which a request is no longer retried (0 = no deadline).",
+    ),
     version: bool = typer.Option(
         False,
         "--version",
@@ -274,6 +497,8 @@ def load_cli_options(
     instances with automatic expiration controls. All pushes expire after a set
     number of days or views, ensuring your sensitive data doesn't linger.
     """
+    ensure_config_loaded()
+
     # Only show welcome screen when no subcommand is invoked
     if ctx.invoked_subcommand is None:
         if config_file_exists():
@@ -299,11 +524,66 @@ def load_cli_options(
     cli_options["pretty"] = pretty
     cli_options["debug"] = debug
 
+    set_retry_overrides(
+        retries=retries,
+        retry_on=retry_on,
+        retry_methods=retry_methods,
+        retry_budget=retry_budget,
+        retry_deadline=retry_deadline,
+    )
+
+
+def set_retry_overrides(
+    retries: int | None = None,
+    retry_on: str | None = None,
+    retry_methods: str | None = None,
+    retry_budget: int | None = None,
+    retry_deadline: float | None = None,
+) -> None:
+    """Apply the command line retry options and start a new retry budget."""
+    global _retry_budget
+
+    overrides: dict[str, str] = {}
+    if retries is not None:
+        if retries < 0:
+            error_json("--retries must be 0 or more.")
+            raise typer.Exit(1)
+        overrides["max_retries"] = str(retries)
+    if retry_on is not None:
+        try:
+            parse_retry_statuses(retry_on)
+        except ValueError as e:
+            error_json(f"Invalid --retry-on value '{retry_on}': {e}")
+            raise typer.Exit(1)
+        overrides["retry_statuses"] = retry_on
+    if retry_methods is not None:
+        if retry_methods not in RETRY_METHOD_MODES:
+            error_json(
+                f"Invalid --retry-methods '{retry_methods}'. Must be one of: "
+                f"{', '.join(RETRY_METHOD_MODES)}"
+            )
+            raise typer.Exit(1)
+        overrides["retry_methods"] = retry_methods
+    if retry_budget is not None:
+        if retry_budget < 0:
+            error_json("--retry-budget must be 0 or more.")
+            raise typer.Exit(1)
+        overrides["retry_budget"] = str(retry_budget)
+    if retry_deadline is not None:
+        if retry_deadline < 0:
+            error_json("--retry-deadline must be 0 or more.")
+            raise typer.Exit(1)
+        overrides["retry_deadline"] = str(retry_deadline)
+
+    retry_overrides.clear()
+    retry_overrides.update(overrides)
+    _retry_budget = None
+
 
 def version_callback(print_version: bool) -> None:
     """Print the version of the package."""
     if print_version:
-        console.print(f"[yellow]pwpush[/] version: [bold blue]{version}[/]")
+        console.print(f"[yellow]pwpush[/] version: [bold blue]{pwpush.version}[/]")
         raise typer.Exit()
 
 
@@ -354,7 +634,16 @@ def make_request(
     token=None,
     timeout=None,
     on_rate_limit_retry=None,
+    on_upload_progress=None,
+    headers=None,
+    raise_errors=False,
 ):
+    """Send a request to the configured instance.
+
+    Connection failures are reported and end the command, unless
+    raise_errors is set: then they raise PwpushError, so that commands
+    handling many requests can report them per item and carry on.
+    """
     request_timeout = (
         timeout if timeout is not None else (5 if method == "DELETE" else 30)
     )
@@ -369,7 +658,8 @@ def make_request(
     ):
         resolved_post_data = {**post_data, "account_id": account_id}
 
-    return send_request(
+    send = perform_request if raise_errors else send_request
+    return send(
         method,
         base_url=base_url or user_config["instance"]["url"],
         path=path,
@@ -380,6 +670,12 @@ def make_request(
         timeout=request_timeout,
         debug=debug_output(),
         on_rate_limit_retry=on_rate_limit_retry,
+        pool_size=connection_pool_size(),
+        on_upload_progress=on_upload_progress,
+        extra_headers=headers,
+        rate_limit=rate_limit(),
+        rate_burst=rate_burst(),
+        retry_policy=retry_policy(),
     )
 
 
@@ -403,6 +699,116 @@ def pretty_output() -> bool:
     return cli_options["pretty"] or user_config_pretty
 
 
+def connection_pool_size() -> int:
+    """Return the configured keep-alive pool size per instance."""
+    try:
+        pool_size = int(user_config["cli"].get("pool_size", str(DEFAULT_POOL_SIZE)))
+    except ValueError:
+        pool_size = DEFAULT_POOL_SIZE
+    return max(pool_size, 1)
+
+
+def rate_limit() -> float:
+    """Return the configured client-side requests per second (0 = unlimited)."""
+    try:
+        rate = float(user_config["cli"].get("rate_limit", "0"))
+    except ValueError:
+        return 0.0
+    return rate if rate > 0 and rate != float("inf") else 0.0
+
+
+def rate_burst() -> int:
+    """Return how many requests may be sent back to back before pacing."""
+    try:
+        burst = int(user_config["cli"].get("rate_burst", "5"))
+    except ValueError:
+        burst = 5
+    return max(burst, 1)
+
+
+def _retry_setting(name: str, default: str) -> str:
+    """Return a retry setting from the command line, else from config.ini."""
+    if name in retry_overrides:
+        return retry_overrides[name]
+    return user_config["cli"].get(name, default)
+
+
+def retry_policy() -> RetryPolicy:
+    """Build the retry policy from config.ini and the command line options.
+
+    Invalid config values fall back to their defaults. A retry budget is
+    shared by every request until the next command starts.
+    """
+    global _retry_budget
+
+    try:
+        max_retries = max(int(_retry_setting("max_retries", "3")), 0)
+    except ValueError:
+        max_retries = DEFAULT_MAX_RETRIES
+    try:
+        statuses = parse_retry_statuses(
+            _retry_setting("retry_statuses", "429,502,503,504")
+        )
+    except ValueError:
+        statuses = DEFAULT_RETRY_STATUSES
+    try:
+        deadline = float(_retry_setting("retry_deadline", "0"))
+    except ValueError:
+        deadline = 0.0
+    try:
+        budget_total = int(_retry_setting("retry_budget", "0"))
+    except ValueError:
+        budget_total = 0
+    jitter = _retry_setting("retry_jitter", "decorrelated")
+
+    budget = None
+    if budget_total > 0:
+        with _retry_budget_lock:
+            if _retry_budget is None or _retry_budget.total != budget_total:
+                _retry_budget = RetryBudget(budget_total)
+            budget = _retry_budget
+
+    return RetryPolicy(
+        max_retries=max_retries,
+        statuses=statuses,
+        idempotent_only=_retry_setting("retry_methods", "idempotent") != "all",
+        deadline=deadline if 0 < deadline < float("inf") else 0.0,
+        budget=budget,
+        jitter=jitter if jitter in JITTER_MODES else "decorrelated",
+    )
+
+
+def max_concurrency() -> int:
+    """Return the ceiling for adaptive concurrency."""
+    try:
+        ceiling = int(
+            user_config["cli"].get("max_concurrency", str(DEFAULT_MAX_CONCURRENCY))
+        )
+    except ValueError:
+        ceiling = DEFAULT_MAX_CONCURRENCY
+    return max(ceiling, 1)
+
+
+def map_requests(
+    func: Callable[[T], R], items: Iterable[T], concurrency: int | None = None
+) -> Iterator[tuple[T, R]]:
+    """Run request-making calls concurrently against the configured instance.
+
+    With a concurrency, that many calls run at once. Without one, the level
+    adapts to the instance's responses (see pwpush.api.concurrency), up to
+    max_concurrency, starting from the level saved for the instance. The
+    keep-alive pool is grown to fit every worker.
+    """
+    base_url = user_config["instance"]["url"]
+    ceiling = concurrency if concurrency is not None else max_concurrency()
+    get_session(base_url, max(connection_pool_size(), ceiling))
+    if concurrency is not None:
+        yield from map_bounded(func, items, concurrency)
+        return
+    with adaptive_concurrency(normalize_base_url(base_url), ceiling) as controller:
+        yield from map_bounded(func, items, ceiling, limit=controller.limit)
+
+
 # Import and re-export generate_secret and generate_passphrase for backward compatibility
 # These are used by tests
 from pwpush.utils import generate_passphrase, generate_secret
@@ -411,9 +817,15 @@ from pwpush.utils import generate_passphrase, generate_secret
 # Register commands from command modules
 @app.command()
 def login(
-    url: str = typer.Option(user_config["instance"]["url"], prompt=True),
-    email: str = typer.Option(user_config["instance"]["email"], prompt=True),
-    token: str = typer.Option(user_config["instance"]["token"], prompt=True),
+    url: str = typer.Option(
+        default_factory=lambda: user_config["instance"]["url"], prompt=True
+    ),
+    email: str = typer.Option(
+        default_factory=lambda: user_config["instance"]["email"], prompt=True
+    ),
+    token: str = typer.Option(
+        default_factory=lambda: user_config["instance"]["token"], prompt=True
+    ),
 ) -> None:
     """Login to the registered Password Pusher instance."""
     login_cmd(url=url, email=email, token=token)
@@ -536,7 +948,23 @@ def push_file(
         None,
         help="A name for the file push shown in the dashboard, notifications and emails.",
     ),
-    payload: str = typer.Argument(""),
+    # typing.List because the `list` command below shadows the builtin.
+    payloads: List[str] | None = typer.Argument(
+        None,
+        metavar="FILES...",
+        help="Files or glob patterns to upload. Several files go in one push unless --each is set.",
+    ),
+    each: bool = typer.Option(
+        False,
+        "--each",
+        help="Create one push per file and print one JSON result line per file.",
+    ),
+    concurrency: int | None = typer.Option(
+        None,
+        "--concurrency",
+        "-c",
+        help="Maximum number of pushes created at once with --each (default: adapt to rate limits).",
+    ),
     json: bool = typer.Option(
         False, "--json", "-j", help="Output results in JSON format."
     ),
@@ -548,7 +976,7 @@ def push_file(
     ),
     debug: bool = typer.Option(False, "--debug", "-d", help="Enable debug mode."),
 ) -> None:
-    """Push a new file. Requires login with an API token."""
+    """Push one or more files. Requires login with an API token."""
     push_file_cmd(
         days=days,
         views=views,
@@ -558,7 +986,9 @@ def push_file(
         notify=notify,
         notify_locale=notify_locale,
         name=name,
-        payload=payload,
+        payloads=payloads,
+        each=each,
+        concurrency=concurrency,
         json=json,
         verbose=verbose,
         pretty=pretty,
@@ -566,11 +996,68 @@ def push_file(
     )
 
 
+@app.command(name="push-batch", help=PUSH_BATCH_HELP_TEXT)
+def push_batch(
+    source: str = typer.Argument(
+        "-", help="JSONL or CSV file with one push per record ('-' for stdin)."
+    ),
+    input_format: str = typer.Option(
+        "auto",
+        "--format",
+        help="Input format: jsonl, csv or auto (by file extension, default jsonl).",
+    ),
+    concurrency: int | None = typer.Option(
+        None,
+        "--concurrency",
+        "-c",
+        help="Maximum number of pushes created at once (default: adapt to rate limits).",
+    ),
+    debug: bool = typer.Option(False, "--debug", "-d", help="Enable debug mode."),
+) -> None:
+    """Create many pushes concurrently from JSONL or CSV records."""
+    push_batch_cmd(
+        source=source,
+        input_format=input_format,
+        concurrency=concurrency,
+        debug=debug,
+    )
+
+
+@app.command(help=GENERATE_HELP_TEXT)
+def generate(
+    count: int = typer.Option(
+        1, "--count", "-n", help="Number of secrets to generate."
+    ),
+    length: int = typer.Option(50, "--length", "-l", help="Length of each secret."),
+) -> None:
+    """Generate secure random secrets locally, one per line."""
+    generate_cmd(count=count, length=length)
+
+
 @app.command()
 def expire(
     ctx: typer.Context,
-    url_token: str = typer.Argument(
-        "", help="The secret URL token of the push to be expired."
+    url_tokens: List[str] | None = typer.Argument(
+        None,
+        metavar="[URL_TOKENS]...",
+        help="URL tokens of the pushes to expire ('-' reads tokens from stdin).",
+    ),
+    source: str | None = typer.Option(
+        None,
+        "--from",
+        "-f",
+        help="Read tokens from a file ('-' for stdin): one per line, JSON lines or 'pwpush list --json' output.",
+    ),
+    concurrency: int | None = typer.Option(
+        None,
+        "--concurrency",
+        "-c",
+        help="Maximum number of pushes expired at once in bulk mode (default: adapt to rate limits).",
+    ),
+    names: List[str] | None = typer.Option(
+        None,
+        "--name",
+        help="Look up a push by name in the local ledger (repeatable).",
     ),
     json: bool = typer.Option(
         False, "--json", "-j", help="Output results in JSON format."
@@ -583,10 +1070,13 @@ def expire(
     ),
     debug: bool = typer.Option(False, "--debug", "-d", help="Enable debug mode."),
 ) -> None:
-    """Expire a push."""
+    """Expire a push. Pass several tokens, '-' or --from to expire many at once."""
     expire_cmd(
         ctx=ctx,
-        url_token=url_token,
+        url_tokens=url_tokens,
+        source=source,
+        concurrency=concurrency,
+        names=names,
         json=json,
         verbose=verbose,
         pretty=pretty,
@@ -594,11 +1084,80 @@ def expire(
     )
 
 
+@app.command(help=SWEEP_HELP_TEXT)
+def sweep(
+    older_than: str | None = typer.Option(
+        None,
+        "--older-than",
+        help="Only pushes created longer ago than this (e.g. 30m, 12h, 7d, 2w).",
+    ),
+    match: str | None = typer.Option(
+        None,
+        "--match",
+        help="Only pushes whose name or note matches this regular expression.",
+    ),
+    kind: str | None = typer.Option(
+        None, "--kind", help="Only pushes of this kind: text, file, url or qr."
+    ),
+    max_views_remaining: int | None = typer.Option(
+        None,
+        "--max-views-remaining",
+        help="Only pushes with at most this many views remaining.",
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="List matching pushes without expiring them."
+    ),
+    yes: bool = typer.Option(
+        False, "--yes", "-y", help="Expire matches without asking for confirmation."
+    ),
+    concurrency: int | None = typer.Option(
+        None,
+        "--concurrency",
+        "-c",
+        help="Maximum number of pushes expired at once (default: adapt to rate limits).",
+    ),
+    debug: bool = typer.Option(False, "--debug", "-d", help="Enable debug mode."),
+) -> None:
+    """Expire every active push matching the given filters."""
+    sweep_cmd(
+        older_than=older_than,
+        match=match,
+        kind=kind,
+        max_views_remaining=max_views_remaining,
+        dry_run=dry_run,
+        yes=yes,
+        concurrency=concurrency,
+        debug=debug,
+    )
+
+
 @app.command()
 def audit(
     ctx: typer.Context,
-    url_token: str = typer.Argument(
-        "", help="The secret URL token of the push to audit."
+    url_tokens: List[str] | None = typer.Argument(
+        None,
+        metavar="[URL_TOKENS]...",
+        help="URL tokens of the pushes to audit ('-' reads tokens from stdin).",
+    ),
+    source: str | None = typer.Option(
+        None,
+        "--from",
+        "-f",
+        help="Read tokens from a file ('-' for stdin): one per line, JSON lines or 'pwpush list --json' output.",
+    ),
+    all_active: bool = typer.Option(
+        False, "--all", "-a", help="Audit every active push."
+    ),
+    concurrency: int | None = typer.Option(
+        None,
+        "--concurrency",
+        "-c",
+        help="Maximum number of audit logs fetched at once (default: adapt to rate limits).",
+    ),
+    names: List[str] | None = typer.Option(
+        None,
+        "--name",
+        help="Look up a push by name in the local ledger (repeatable).",
     ),
     json: bool = typer.Option(
         False, "--json", "-j", help="Output results in JSON format."
@@ -611,10 +1170,17 @@ def audit(
     ),
     debug: bool = typer.Option(False, "--debug", "-d", help="Enable debug mode."),
 ) -> None:
-    """Show the audit log for the given push. Requires login with an API token."""
+    """Show the audit log for the given push. Requires login with an API token.
+
+    Pass several tokens, '-', --from or --all to merge many logs by time.
+    """
     audit_cmd(
         ctx=ctx,
-        url_token=url_token,
+        url_tokens=url_tokens,
+        source=source,
+        all_active=all_active,
+        concurrency=concurrency,
+        names=names,
         json=json,
         verbose=verbose,
         pretty=pretty,
@@ -625,6 +1191,12 @@ def audit(
 @app.command()
 def list(
     expired: bool = typer.Option(False, help="Show only expired pushes."),
+    limit: int | None = typer.Option(
+        None, "--limit", "-n", help="Show at most this many pushes."
+    ),
+    ndjson: bool = typer.Option(
+        False, "--ndjson", help="Output one JSON object per line as pages arrive."
+    ),
     json: bool = typer.Option(
         False, "--json", "-j", help="Output results in JSON format."
     ),
@@ -639,6 +1211,8 @@ def list(
     """List active pushes. Requires login with an API token."""
     list_cmd(
         expired=expired,
+        limit=limit,
+        ndjson=ndjson,
         json=json,
         verbose=verbose,
         pretty=pretty,
@@ -719,12 +1293,27 @@ def request(
     )
 
 
+@app.command(help=SERVE_HELP_TEXT)
+def serve(
+    socket_path: Path = typer.Option(
+        ..., "--socket", "-s", help="Path of the Unix socket to listen on."
+    ),
+) -> None:
+    """Run a local daemon that executes pwpush commands over a Unix socket."""
+    serve_cmd(socket_path)
+
+
 # Register config subcommands
 app.add_typer(
     config.app,
     name="config",
     help="Setup, show, and modify CLI configuration.",
 )
+app.add_typer(
+    ledger.app,
+    name="ledger",
+    help="Find and sync pushes recorded in the local ledger (opt-in).",
+)
 
 if __name__ == "__main__":
     app()
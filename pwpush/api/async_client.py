@@ -0,0 +1,700 @@
+"""Asyncio client for embedding pwpush in async services.
+
+AsyncPushClient talks to a Password Pusher instance from an asyncio event
+loop: many operations can run concurrently on one loop, sharing a bounded
+pool of keep-alive connections instead of one thread per request. It uses
+the same endpoint routing and payload adaptation as the CLI, and raises
+the exceptions in pwpush.api.errors instead of exiting.
+
+Only the standard library is used for transport (HTTP/1.1 over asyncio
+streams), so no extra dependency is needed. Like the CLI's requests
+session, it honours the HTTP_PROXY / HTTPS_PROXY / NO_PROXY environment
+variables (HTTPS goes through a CONNECT tunnel) and follows redirects,
+though only within the instance: a redirect to another host or scheme
+is returned as is, since the connection pool belongs to one origin.
+
+Example:
+    async with AsyncPushClient("https://eu.pwpush.com", token="...") as client:
+        push = await client.create_push("s3cret", days=1, views=3)
+        print(push.url)
+"""
+
+from typing import Any, AsyncIterator
+
+import asyncio
+import base64
+import json
+import socket
+import ssl
+import time
+import urllib.request
+from urllib.parse import unquote, urljoin, urlsplit
+
+from pwpush.api.capabilities import API_PROFILE_LEGACY, API_PROFILE_V2
+from pwpush.api.client import (
+    DEFAULT_POOL_SIZE,
+    absolute_url,
+    build_auth_headers,
+    is_rate_limit_error,
+    normalize_base_url,
+    user_agent,
+)
+from pwpush.api.endpoints import (
+    PushListPager,
+    adapt_request_payload_for_profile,
+    adapt_text_payload_for_profile,
+    normalize_audit_events,
+    push_audit_path,
+    push_create_path,
+    push_expire_path,
+    push_preview_path,
+    push_share_url,
+    request_create_path,
+    request_payload,
+    request_preview_path,
+    text_push_payload,
+)
+from pwpush.api.errors import (
+    PwpushConnectionError,
+    PwpushConnectionResetError,
+    PwpushError,
+    PwpushTimeoutError,
+    response_error,
+)
+from pwpush.api.ratelimit import get_rate_limiter
+from pwpush.api.results import Push
+from pwpush.api.retry import DEFAULT_MAX_RETRIES, IDEMPOTENT_METHODS, RetryPolicy
+
+_Connection = tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+# Redirects followed within the instance before the response is returned
+MAX_REDIRECTS = 10
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+
+class AsyncResponse:
+    """A fully read HTTP response.
+
+    Attributes:
+        status_code: HTTP status code
+        headers: Response headers, keyed by lower-cased name
+        content: Raw response body
+    """
+
+    def __init__(self, status_code: int, headers: dict[str, str], content: bytes):
+        self.status_code = status_code
+        self.headers = _Headers(headers)
+        self.content = content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """Parse the body as JSON.
+
+        Raises:
+            ValueError: If the body is not valid JSON.
+        """
+        return json.loads(self.content)
+
+
+class _Headers(dict[str, str]):
+    """Header mapping with case-insensitive lookups."""
+
+    def __init__(self, headers: dict[str, str]) -> None:
+        super().__init__((name.lower(), value) for name, value in headers.items())
+
+    def __getitem__(self, name: str) -> str:
+        return super().__getitem__(name.lower())
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and super().__contains__(name.lower())
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return super().get(name.lower(), default)
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    """Read a chunked transfer-encoded body, discarding trailers."""
+    chunks: list[bytes] = []
+    while True:
+        size_line = await reader.readline()
+        size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+        if size == 0:
+            while (await reader.readline()).strip():
+                pass
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
+
+
+class AsyncPushClient:
+    """Asynchronous Password Pusher client with a pooled connection set.
+
+    At most pool_size requests are in flight at once; further requests wait
+    for a connection to be released. The API profile (v2 or legacy) is
+    detected once from /api/v2/version unless given, and every call builds
+    its path and payload for that profile.
+
+    Args:
+        base_url: Base URL of the Password Pusher instance
+        email: User email for authentication ("Not Set" for anonymous use)
+        token: API token for authentication ("Not Set" for anonymous use)
+        account_id: Account to create pushes and requests in, if any
+        api_profile: "v2" or "legacy" to skip profile detection
+        pool_size: Maximum number of open connections to the instance
+        timeout: Seconds to wait for each request's response
+        verify: Verify TLS certificates
+        max_retries: Maximum number of retries per request (when no
+            retry_policy is given)
+        rate_limit: Requests per second to the instance, shared with other
+            clients and pwpush processes on this host (0 disables pacing)
+        rate_burst: Requests sent back to back before pacing applies
+        retry_policy: What to retry and how long to wait (see
+            pwpush.api.retry)
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        email: str = "Not Set",
+        token: str = "Not Set",
+        account_id: str | None = None,
+        api_profile: str | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float = 30,
+        verify: bool = True,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        rate_limit: float = 0,
+        rate_burst: int = 1,
+        retry_policy: RetryPolicy | None = None,
+    ) -> None:
+        self.base_url = normalize_base_url(base_url)
+        self.email = email
+        self.token = token
+        self.account_id = account_id
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=max_retries)
+        self._limiter = get_rate_limiter(self.base_url, rate_limit, rate_burst)
+
+        parts = urlsplit(self.base_url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported instance URL: {base_url!r}")
+        self._host = parts.hostname
+        self._port = parts.port or (443 if parts.scheme == "https" else 80)
+        self._host_header = parts.netloc.rsplit("@", 1)[-1]
+        self._ssl: ssl.SSLContext | None = None
+        if parts.scheme == "https":
+            self._ssl = ssl.create_default_context()
+            if not verify:
+                self._ssl.check_hostname = False
+                self._ssl.verify_mode = ssl.CERT_NONE
+
+        self._origin = (parts.scheme, self._host, self._port)
+        self._proxy = _environment_proxy(parts.scheme, self._host_header)
+
+        self._api_profile = api_profile
+        self._profile_lock: asyncio.Lock | None = None
+        self._slots = asyncio.Semaphore(max(pool_size, 1))
+        self._idle: list[_Connection] = []
+
+    async def __aenter__(self) -> "AsyncPushClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the idle pooled connections."""
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+        for _, writer in idle:
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    # Transport
+
+    async def _open(self) -> _Connection:
+        if self._proxy is not None and self._ssl is not None:
+            return await self._open_tunnel(self._proxy)
+        if self._proxy is not None:
+            return await asyncio.open_connection(
+                self._proxy.hostname, _port(self._proxy)
+            )
+        return await asyncio.open_connection(
+            self._host,
+            self._port,
+            ssl=self._ssl,
+            server_hostname=self._host if self._ssl is not None else None,
+        )
+
+    async def _open_tunnel(self, proxy: Any) -> _Connection:
+        """Open a TLS connection to the instance through a CONNECT tunnel."""
+        loop = asyncio.get_running_loop()
+        sock = await asyncio.to_thread(
+            socket.create_connection, (proxy.hostname, _port(proxy)), self.timeout
+        )
+        try:
+            sock.setblocking(False)
+            lines = [
+                f"CONNECT {self._host}:{self._port} HTTP/1.1",
+                f"Host: {self._host}:{self._port}",
+                *_proxy_auth_lines(proxy),
+            ]
+            await loop.sock_sendall(sock, ("\r\n".join(lines) + "\r\n\r\n").encode())
+            answer = b""
+            while b"\r\n\r\n" not in answer:
+                chunk = await loop.sock_recv(sock, 4096)
+                if not chunk:
+                    raise ConnectionResetError("Proxy closed the tunnel")
+                answer += chunk
+            status = answer.split(b" ", 2)[1:2]
+            if not status or not status[0].startswith(b"2"):
+                raise ConnectionRefusedError(
+                    f"Proxy refused the tunnel: {answer.splitlines()[0].decode('latin-1')}"
+                )
+            return await asyncio.open_connection(
+                sock=sock, ssl=self._ssl, server_hostname=self._host
+            )
+        except BaseException:
+            sock.close()
+            raise
+
+    async def _read_response(
+        self, reader: asyncio.StreamReader, method: str
+    ) -> tuple[AsyncResponse, bool]:
+        """Read one response.
+
+        Returns:
+            The response, and whether the connection can be reused.
+        """
+        while True:
+            status_line = await reader.readline()
+            if not status_line:
+                raise ConnectionResetError("Connection closed before a response")
+            version, status, *_ = status_line.decode("latin-1").split(" ", 2)
+            headers: dict[str, str] = {}
+            while True:
+                line = (await reader.readline()).decode("latin-1").rstrip("\r\n")
+                if not line:
+                    break
+                name, _, value = line.partition(":")
+                headers[name.strip()] = value.strip()
+            status_code = int(status)
+            # Interim responses (100 Continue, 103 Early Hints) precede the
+            # real one on the same connection.
+            if status_code >= 200:
+                break
+        response_headers = _Headers(headers)
+
+        reusable = version == "HTTP/1.1" and (
+            response_headers.get("connection", "").lower() != "close"
+        )
+        if method == "HEAD" or status_code in (204, 304):
+            content = b""
+        elif "chunked" in response_headers.get("transfer-encoding", "").lower():
+            content = await _read_chunked(reader)
+        elif "content-length" in response_headers:
+            content = await reader.readexactly(int(response_headers["content-length"]))
+        else:
+            content = await reader.read()
+            reusable = False
+        return AsyncResponse(status_code, headers, content), reusable
+
+    async def _send_once(
+        self, method: str, path: str, body: bytes | None, headers: dict[str, str]
+    ) -> AsyncResponse:
+        target = urlsplit(absolute_url(self.base_url, path))
+        request_target = target.path + (f"?{target.query}" if target.query else "")
+        request_target = request_target or "/"
+        proxy_lines: list[str] = []
+        if self._proxy is not None and self._ssl is None:
+            # A plain HTTP proxy takes the absolute URL.
+            request_target = f"http://{self._host_header}{request_target}"
+            proxy_lines = _proxy_auth_lines(self._proxy)
+        lines = [
+            f"{method} {request_target} HTTP/1.1",
+            f"Host: {self._host_header}",
+            *proxy_lines,
+        ]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        if body is not None or method in ("POST", "PUT", "PATCH"):
+            lines.append(f"Content-Length: {len(body or b'')}")
+        request = ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8") + (body or b"")
+
+        async with self._slots:
+            while True:
+                connection = self._idle_connection()
+                reused = connection is not None
+                if connection is None:
+                    connection = await asyncio.wait_for(self._open(), self.timeout)
+                reader, writer = connection
+                sent = False
+                reusable = False
+
+                async def exchange() -> AsyncResponse:
+                    nonlocal sent, reusable
+                    writer.write(request)
+                    await writer.drain()
+                    sent = True
+                    response, reusable = await self._read_response(reader, method)
+                    return response
+
+                try:
+                    return await asyncio.wait_for(exchange(), self.timeout)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    # A pooled connection the server closed while idle is
+                    # replaced once, unless the request may have reached
+                    # the server and sending it again is not safe.
+                    if not reused or (sent and method not in IDEMPOTENT_METHODS):
+                        raise
+                finally:
+                    if reusable:
+                        self._idle.append(connection)
+                    else:
+                        writer.close()
+
+    def _idle_connection(self) -> _Connection | None:
+        """Take a pooled connection, dropping those the server has closed."""
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not reader.at_eof():
+                return reader, writer
+            writer.close()
+        return None
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json_body: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> AsyncResponse:
+        """Send a request to the instance, retrying as the retry policy allows.
+
+        Redirects within the instance are followed the way requests follows
+        them (303, and 301/302 after a POST, continue as a GET); a redirect
+        elsewhere is returned as the response.
+
+        Args:
+            method: HTTP method (GET, POST, DELETE)
+            path: API path to request
+            json_body: Optional JSON request body
+            headers: Optional additional request headers
+
+        Returns:
+            The response, whatever its status.
+
+        Raises:
+            PwpushTimeoutError: If the instance does not answer in time.
+            PwpushConnectionError: If the connection fails.
+        """
+        request_headers = {
+            **(headers or {}),
+            **build_auth_headers(self.email, self.token),
+            "User-Agent": user_agent(),
+            "Accept": "application/json",
+        }
+        body = None
+        if json_body is not None:
+            if method == "POST" and self.account_id and self.account_id != "Not Set":
+                json_body = {**json_body, "account_id": self.account_id}
+            body = json.dumps(json_body).encode("utf-8")
+            request_headers["Content-Type"] = "application/json"
+
+        for _ in range(MAX_REDIRECTS):
+            response = await self._send_with_retries(
+                method, path, body, request_headers
+            )
+            location = response.headers.get("location")
+            if response.status_code not in _REDIRECT_STATUSES or not location:
+                return response
+            target = urljoin(absolute_url(self.base_url, path), location)
+            if _origin(target) != self._origin:
+                return response
+            if method != "HEAD" and (
+                response.status_code == 303
+                or (response.status_code in (301, 302) and method == "POST")
+            ):
+                method, body = "GET", None
+                request_headers.pop("Content-Type", None)
+            path = target
+        return await self._send_with_retries(method, path, body, request_headers)
+
+    async def _send_with_retries(
+        self, method: str, path: str, body: bytes | None, headers: dict[str, str]
+    ) -> AsyncResponse:
+        """Send one request, retrying as the retry policy allows."""
+        policy = self.retry_policy
+        first_started = time.monotonic()
+        delay = 0.0
+        attempt = 0
+        while True:
+            if self._limiter is not None:
+                # The shared bucket takes a file lock: keep it off the loop.
+                wait = (
+                    await asyncio.to_thread(self._limiter.reserve)
+                    if self._limiter.shared
+                    else self._limiter.reserve()
+                )
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            try:
+                response = await self._send_once(method, path, body, headers)
+            except asyncio.TimeoutError as e:
+                raise PwpushTimeoutError(
+                    f"Request to {self.base_url} timed out after {self.timeout}s."
+                ) from e
+            except (ConnectionResetError, asyncio.IncompleteReadError) as e:
+                next_delay = None
+                if policy.allows_method(method):
+                    next_delay = policy.next_delay(
+                        None, attempt, delay, time.monotonic() - first_started
+                    )
+                if next_delay is None:
+                    raise PwpushConnectionResetError(
+                        f"Connection to {self.base_url} was reset: {e}"
+                    ) from e
+            except (OSError, ValueError) as e:
+                raise PwpushConnectionError(
+                    f"Could not connect to {self.base_url}: {e}"
+                ) from e
+            else:
+                if not policy.retries_response(
+                    method, response, is_rate_limit_error(response)
+                ):
+                    return response
+                next_delay = policy.next_delay(
+                    response, attempt, delay, time.monotonic() - first_started
+                )
+                if next_delay is None:
+                    return response
+            delay = next_delay
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _json(
+        self,
+        method: str,
+        path: str,
+        *,
+        json_body: dict[str, Any] | None = None,
+        expected: tuple[int, ...] = (200, 201),
+    ) -> Any:
+        """Send a request and return its JSON body, raising on error statuses."""
+        response = await self.request(method, path, json_body=json_body)
+        if response.status_code not in expected:
+            raise response_error(response)
+        try:
+            return response.json()
+        except ValueError as e:
+            raise PwpushError(
+                f"Invalid JSON response from {path} ({response.status_code})."
+            ) from e
+
+    # Operations
+
+    async def api_profile(self) -> str:
+        """Return the instance's API profile, detecting it on first use."""
+        if self._api_profile is not None:
+            return self._api_profile
+        if self._profile_lock is None:
+            self._profile_lock = asyncio.Lock()
+        async with self._profile_lock:
+            if self._api_profile is None:
+                response = await self.request("GET", "/api/v2/version")
+                self._api_profile = (
+                    API_PROFILE_V2
+                    if response.status_code == 200
+                    else API_PROFILE_LEGACY
+                )
+        return self._api_profile
+
+    async def create_push(
+        self,
+        secret: str,
+        *,
+        kind: str = "text",
+        days: int | None = None,
+        views: int | None = None,
+        deletable: bool | None = None,
+        retrieval_step: bool | None = None,
+        note: str | None = None,
+        name: str | None = None,
+        passphrase: str | None = None,
+    ) -> Push:
+        """Create a text, url or qr push.
+
+        Options left as None use the instance defaults. When the create
+        response carries no share URL, it is read from the push preview.
+
+        Raises:
+            PwpushAPIError: If the instance rejects the push.
+        """
+        profile = await self.api_profile()
+        payload = text_push_payload(
+            secret,
+            kind=kind,
+            days=days,
+            views=views,
+            deletable=deletable,
+            retrieval_step=retrieval_step,
+            note=note,
+            name=name,
+            passphrase=passphrase,
+        )
+        created: dict[str, Any] = await self._json(
+            "POST",
+            push_create_path(profile, kind),
+            json_body=adapt_text_payload_for_profile(payload, profile),
+        )
+        url = push_share_url(self.base_url, profile, created, kind)
+        if url is None:
+            preview = await self.preview_push(created["url_token"], kind=kind)
+            if isinstance(preview, dict):
+                url = preview.get("url")
+        return Push.from_json(created, url=url, kind=kind)
+
+    async def preview_push(self, url_token: str, *, kind: str = "text") -> Any:
+        """Return the preview (including the share URL) of a push.
+
+        Raises:
+            PwpushAPIError: If the push does not exist or is not accessible.
+        """
+        profile = await self.api_profile()
+        return await self._json("GET", push_preview_path(profile, url_token, kind))
+
+    async def expire_push(self, url_token: str) -> Any:
+        """Expire a push and return the server's response body.
+
+        Raises:
+            PwpushAPIError: If the push cannot be expired.
+        """
+        profile = await self.api_profile()
+        response = await self.request("DELETE", push_expire_path(profile, url_token))
+        if response.status_code != 200:
+            raise response_error(response)
+        try:
+            return response.json()
+        except ValueError:
+            return {"url_token": url_token, "expired": True}
+
+    async def audit_push(self, url_token: str) -> list[dict[str, str]]:
+        """Return the normalized audit events of a push.
+
+        Raises:
+            PwpushAPIError: If the audit log is not accessible.
+        """
+        profile = await self.api_profile()
+        body = await self._json("GET", push_audit_path(profile, url_token))
+        return normalize_audit_events(body)
+
+    async def list_pushes(self, *, expired: bool = False) -> AsyncIterator[Push]:
+        """Yield the active (or expired) pushes of the account, page by page.
+
+        Pages are walked by PushListPager, like the CLI's list command. The
+        next page is only requested once the caller has consumed the
+        current one.
+
+        Raises:
+            PwpushAPIError: If the list is not accessible.
+        """
+        pager = PushListPager(await self.api_profile(), expired=expired)
+        while pager.next_path is not None:
+            response = await self.request("GET", pager.next_path)
+            for push in pager.read(response) or []:
+                if isinstance(push, dict):
+                    yield Push.from_json(push)
+
+    async def create_request(
+        self,
+        text: str,
+        *,
+        days: int | None = None,
+        views: int | None = None,
+        deletable: bool | None = None,
+        retrieval_step: bool | None = None,
+        note: str | None = None,
+        name: str | None = None,
+        notify: str | None = None,
+        notify_locale: str | None = None,
+    ) -> dict[str, Any]:
+        """Create a request for someone to send a secret (Pro instances).
+
+        Raises:
+            PwpushAPIError: If the instance rejects the request.
+        """
+        profile = await self.api_profile()
+        payload = request_payload(
+            text,
+            days=days,
+            views=views,
+            deletable=deletable,
+            retrieval_step=retrieval_step,
+            note=note,
+            name=name,
+            notify=notify,
+            notify_locale=notify_locale,
+        )
+        created: dict[str, Any] = await self._json(
+            "POST",
+            request_create_path(profile),
+            json_body=adapt_request_payload_for_profile(payload, profile),
+        )
+        return created
+
+    async def preview_request(self, url_token: str) -> Any:
+        """Return the preview (including the share URL) of a request.
+
+        Raises:
+            PwpushAPIError: If the request does not exist or is not accessible.
+        """
+        profile = await self.api_profile()
+        return await self._json("GET", request_preview_path(profile, url_token))
+
+
+def _origin(url: str) -> tuple[str, str | None, int]:
+    """Return the (scheme, host, port) a URL is served from."""
+    parts = urlsplit(url)
+    return (
+        parts.scheme,
+        parts.hostname,
+        parts.port or (443 if parts.scheme == "https" else 80),
+    )
+
+
+def _environment_proxy(scheme: str, host: str) -> Any:
+    """Return the split proxy URL the environment sets for an instance, if any.
+
+    Uses the same HTTP_PROXY / HTTPS_PROXY / NO_PROXY variables as requests.
+    """
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+    parts = urlsplit(proxy)
+    if parts.scheme != "http" or not parts.hostname:
+        raise ValueError(f"Unsupported {scheme} proxy: {proxy!r}")
+    return parts
+
+
+def _port(proxy: Any) -> int:
+    return int(proxy.port or 80)
+
+
+def _proxy_auth_lines(proxy: Any) -> list[str]:
+    """Return the Proxy-Authorization header line for a proxy URL's credentials."""
+    if proxy.username is None:
+        return []
+    credentials = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}"
+    return [
+        f"Proxy-Authorization: Basic {base64.b64encode(credentials.encode()).decode()}"
+    ]
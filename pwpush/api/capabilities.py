@@ -1,54 +1,217 @@
 from typing import Any
 
-import requests
-from rich import print as rprint
+import json
+import os
+import time
 
-from pwpush.api.client import absolute_url
+from pwpush.api.client import absolute_url, get_session
+from pwpush.utils import app_dir, rprint
 
 API_PROFILE_V2 = "v2"
 API_PROFILE_LEGACY = "legacy"
 
-_profile_cache: dict[str, str] = {}
-_capabilities_cache: dict[str, dict[str, Any]] = {}
+# In-memory discovery results: base_url -> (checked_at, result)
+_discovery_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+# Per-instance discovery results persisted between invocations
+discovery_cache_file = app_dir().joinpath("discovery.json")
+
+
+def clear_discovery_cache() -> None:
+    """Clear the shared instance discovery cache (mainly for tests)."""
+    _discovery_cache.clear()
+
+
+def _load_persisted_discoveries() -> dict[str, Any]:
+    """Read the on-disk discovery cache, ignoring missing or corrupt files."""
+    try:
+        with open(discovery_cache_file, encoding="utf-8") as file:
+            data = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _load_persisted_discovery(cache_key: str) -> dict[str, Any] | None:
+    """Return the persisted discovery entry for an instance if it is usable."""
+    entry = _load_persisted_discoveries().get(cache_key)
+    if not isinstance(entry, dict):
+        return None
+    if entry.get("profile") not in (API_PROFILE_V2, API_PROFILE_LEGACY):
+        return None
+    if not isinstance(entry.get("capabilities"), dict):
+        return None
+    if not isinstance(entry.get("checked_at"), int):
+        return None
+    return entry
+
+
+def _persist_discovery(cache_key: str, entry: dict[str, Any]) -> None:
+    """Write one instance's discovery entry to disk (best effort)."""
+    persisted = _load_persisted_discoveries()
+    persisted[cache_key] = entry
+    temp_file = discovery_cache_file.with_suffix(".tmp")
+    try:
+        discovery_cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(temp_file, "w", encoding="utf-8") as file:
+            json.dump(persisted, file)
+        os.replace(temp_file, discovery_cache_file)
+    except OSError:
+        pass
 
 
 def clear_profile_cache() -> None:
     """Clear profile cache (mainly for tests)."""
-    _profile_cache.clear()
+    clear_discovery_cache()
 
 
 def clear_capabilities_cache() -> None:
     """Clear capabilities cache (mainly for tests)."""
-    _capabilities_cache.clear()
+    clear_discovery_cache()
 
 
-def detect_api_profile(
+def discover_instance(
     *,
     base_url: str,
     email: str,
     token: str,
     debug: bool = False,
     force_refresh: bool = False,
-) -> str:
-    """Detect whether API v2 is supported by probing /api/v2/version."""
+    ttl_seconds: int | None = None,
+) -> dict[str, Any]:
+    """Probe /api/v2/version once and derive both profile and capabilities.
+
+    Returns a dict with:
+    - profile: "v2" when the version endpoint exists, otherwise "legacy"
+    - capabilities: dict shaped like detect_api_capabilities() output
+
+    The result is cached per base_url so that profile and feature checks
+    within one invocation share a single round trip. When ttl_seconds is
+    given, cached results older than it are not used (the serve daemon
+    lives far longer than one invocation), and results are also persisted
+    to disk: a fresh entry skips the probe entirely, and a stale one is
+    revalidated with If-None-Match / If-Modified-Since so an unchanged
+    document costs only a 304.
+    """
     cache_key = base_url.rstrip("/")
-    if not force_refresh and cache_key in _profile_cache:
-        return _profile_cache[cache_key]
+    cached = _discovery_cache.get(cache_key)
+    if not force_refresh and cached is not None:
+        checked_at, result = cached
+        if ttl_seconds is None or 0 <= time.time() - checked_at < ttl_seconds:
+            return result
+
+    persisted = None
+    if ttl_seconds is not None:
+        persisted = _load_persisted_discovery(cache_key)
+        if persisted is not None and not force_refresh:
+            age = int(time.time()) - persisted["checked_at"]
+            if 0 <= age < ttl_seconds:
+                result = {
+                    "profile": persisted["profile"],
+                    "capabilities": persisted["capabilities"],
+                }
+                _discovery_cache[cache_key] = (persisted["checked_at"], result)
+                return result
 
     probe_url = absolute_url(base_url, "/api/v2/version")
     headers: dict[str, str] = {}
     if token.strip() and token != "Not Set":
         headers = {"Authorization": f"Bearer {token}"}
-
+    if persisted is not None:
+        if persisted.get("etag"):
+            headers["If-None-Match"] = persisted["etag"]
+        if persisted.get("last_modified"):
+            headers["If-Modified-Since"] = persisted["last_modified"]
+
+    profile = API_PROFILE_LEGACY
+    capabilities: dict[str, Any] = {
+        "api_version": None,
+        "edition": None,
+        "features": {},
+    }
+
+    import requests
+
+    response = None
     try:
-        response = requests.get(probe_url, headers=headers, timeout=5)
-        _profile_cache[cache_key] = (
-            API_PROFILE_V2 if response.status_code == 200 else API_PROFILE_LEGACY
+        response = get_session(base_url).get(probe_url, headers=headers, timeout=5)
+        if response.status_code == 304 and persisted is not None:
+            profile = persisted["profile"]
+            capabilities = persisted["capabilities"]
+            if debug:
+                rprint("[dim][debug] API capabilities unchanged (304)[/dim]")
+        elif response.status_code == 200:
+            profile = API_PROFILE_V2
+            try:
+                data = response.json()
+            except ValueError:
+                data = None
+            if isinstance(data, dict):
+                capabilities["api_version"] = data.get("api_version")
+                capabilities["edition"] = data.get("edition")
+                capabilities["features"] = data.get("features", {})
+            if debug:
+                rprint(f"[dim][debug] API capabilities detected: {capabilities}[/dim]")
+        elif debug:
+            rprint(
+                f"[dim][debug] API capabilities check failed: {response.status_code}[/dim]"
+            )
+    except requests.exceptions.RequestException as e:
+        if debug:
+            rprint(f"[dim][debug] API capabilities check error: {e}[/dim]")
+
+    result = {"profile": profile, "capabilities": capabilities}
+    _discovery_cache[cache_key] = (time.time(), result)
+
+    # Only persist definitive answers; transient failures are retried next run.
+    revalidated = (
+        response is not None and response.status_code == 304 and persisted is not None
+    )
+    if (
+        ttl_seconds is not None
+        and response is not None
+        and (response.status_code in (200, 404) or revalidated)
+    ):
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if revalidated and persisted is not None:
+            etag = etag or persisted.get("etag")
+            last_modified = last_modified or persisted.get("last_modified")
+        _persist_discovery(
+            cache_key,
+            {
+                "profile": profile,
+                "capabilities": capabilities,
+                "checked_at": int(time.time()),
+                "etag": etag if isinstance(etag, str) else None,
+                "last_modified": (
+                    last_modified if isinstance(last_modified, str) else None
+                ),
+            },
         )
-    except requests.exceptions.RequestException:
-        _profile_cache[cache_key] = API_PROFILE_LEGACY
 
-    return _profile_cache[cache_key]
+    return result
+
+
+def detect_api_profile(
+    *,
+    base_url: str,
+    email: str,
+    token: str,
+    debug: bool = False,
+    force_refresh: bool = False,
+    ttl_seconds: int | None = None,
+) -> str:
+    """Detect whether API v2 is supported by probing /api/v2/version."""
+    discovery = discover_instance(
+        base_url=base_url,
+        email=email,
+        token=token,
+        debug=debug,
+        force_refresh=force_refresh,
+        ttl_seconds=ttl_seconds,
+    )
+    return str(discovery["profile"])
 
 
 def detect_api_capabilities(
@@ -58,6 +221,7 @@ def detect_api_capabilities(
     token: str,
     debug: bool = False,
     force_refresh: bool = False,
+    ttl_seconds: int | None = None,
 ) -> dict[str, Any]:
     """Detect API version and feature flags from /api/v2/version endpoint.
 
@@ -66,38 +230,19 @@ def detect_api_capabilities(
     - edition: str | None (e.g., "commercial", "oss")
     - features: dict[str, bool] (feature flags from the features section)
 
-    The result is cached per base_url to avoid repeated API calls.
+    The probe is shared with detect_api_profile() and cached per base_url
+    to avoid repeated API calls. Pass ttl_seconds to use the on-disk cache.
     """
-    cache_key = base_url.rstrip("/")
-    if not force_refresh and cache_key in _capabilities_cache:
-        return _capabilities_cache[cache_key]
-
-    probe_url = absolute_url(base_url, "/api/v2/version")
-    headers: dict[str, str] = {}
-    if token.strip() and token != "Not Set":
-        headers = {"Authorization": f"Bearer {token}"}
-
-    result: dict[str, Any] = {"api_version": None, "edition": None, "features": {}}
-
-    try:
-        response = requests.get(probe_url, headers=headers, timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            result["api_version"] = data.get("api_version")
-            result["edition"] = data.get("edition")
-            result["features"] = data.get("features", {})
-            if debug:
-                rprint(f"[dim][debug] API capabilities detected: {result}[/dim]")
-        elif debug:
-            rprint(
-                f"[dim][debug] API capabilities check failed: {response.status_code}[/dim]"
-            )
-    except requests.exceptions.RequestException as e:
-        if debug:
-            rprint(f"[dim][debug] API capabilities check error: {e}[/dim]")
-
-    _capabilities_cache[cache_key] = result
-    return result
+    discovery = discover_instance(
+        base_url=base_url,
+        email=email,
+        token=token,
+        debug=debug,
+        force_refresh=force_refresh,
+        ttl_seconds=ttl_seconds,
+    )
+    capabilities: dict[str, Any] = discovery["capabilities"]
+    return capabilities
 
 
 def email_notifications_enabled(capabilities: dict[str, Any] | None = None) -> bool:
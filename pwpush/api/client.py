@@ -1,21 +1,43 @@
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import random
+import threading
 import time
 from urllib.parse import urljoin
 
-import requests
-import typer
-from rich import print as rprint
+from pwpush.api.concurrency import observe_response
+from pwpush.api.errors import (
+    PwpushConnectionError,
+    PwpushConnectionResetError,
+    PwpushError,
+    PwpushTimeoutError,
+)
+from pwpush.api.multipart import MultipartStream, ProgressCallback
+from pwpush.api.ratelimit import get_rate_limiter
+from pwpush.api.retry import (
+    DEFAULT_MAX_RETRIES,
+    RetryPolicy,
+)
+from pwpush.utils import rprint
 
-from pwpush import version as pwpush_version
+if TYPE_CHECKING:
+    # requests is imported where it is used so commands that never touch the
+    # network (config, --version, help) start without loading it.
+    import requests
 
-USER_AGENT = f"pwpush-cli/{pwpush_version}"
 
-# Rate limit handling constants
-DEFAULT_MAX_RETRIES = 3
-DEFAULT_BASE_DELAY = 1.0  # seconds
-MAX_BACKOFF_DELAY = 30.0  # maximum seconds to wait between retries
+# Connection pooling constants
+DEFAULT_POOL_SIZE = 10  # keep-alive connections kept per instance
+
+_sessions: dict[str, "requests.Session"] = {}
+_session_pool_sizes: dict[str, int] = {}
+_sessions_lock = threading.Lock()
+
+
+def user_agent() -> str:
+    """Return the User-Agent header value sent with every request."""
+    from pwpush import version
+
+    return f"pwpush-cli/{version}"
 
 
 def _sanitize_headers(headers: dict[str, str]) -> dict[str, str]:
@@ -28,11 +50,11 @@ def _sanitize_headers(headers: dict[str, str]) -> dict[str, str]:
     return sanitized
 
 
-def is_rate_limit_error(response: requests.Response) -> bool:
+def is_rate_limit_error(response: Any) -> bool:
     """Check if the response indicates a rate limit error.
 
     Args:
-        response: The HTTP response to check
+        response: The HTTP response to check (requests or async client)
 
     Returns:
         True if this is a rate limit error (403 with rate limit message)
@@ -57,43 +79,55 @@ def is_rate_limit_error(response: requests.Response) -> bool:
     )
 
 
-def get_retry_delay(
-    response: requests.Response, attempt: int, base_delay: float = DEFAULT_BASE_DELAY
-) -> float:
-    """Calculate the delay before the next retry attempt.
+def normalize_base_url(url: str) -> str:
+    """Normalize an instance URL for safe path joining."""
+    return url.rstrip("/")
+
+
+def get_session(
+    base_url: str, pool_size: int = DEFAULT_POOL_SIZE
+) -> "requests.Session":
+    """Return the process-wide pooled session for an instance.
 
-    Uses Retry-After header if present, otherwise uses exponential backoff with jitter.
+    One session is created per normalized base URL and reused for every later
+    request to that instance, so consecutive calls share warm keep-alive
+    connections instead of repeating DNS, TCP and TLS setup. The pool only
+    grows: a later caller asking for more connections (e.g. a concurrent
+    batch) gets a larger pool, smaller requests keep the existing one.
 
     Args:
-        response: The HTTP response containing potential Retry-After header
-        attempt: The current retry attempt number (0-indexed)
-        base_delay: The base delay in seconds for exponential backoff
+        base_url: Base URL of the Password Pusher instance
+        pool_size: Maximum number of connections kept open to the instance
 
     Returns:
-        The number of seconds to wait before retrying
+        The shared requests session for this instance
     """
-    # Check for Retry-After header (can be seconds or HTTP date)
-    retry_after = response.headers.get("retry-after")
-    if retry_after:
-        try:
-            # Try parsing as seconds first
-            return min(float(retry_after), MAX_BACKOFF_DELAY)
-        except (ValueError, TypeError):
-            # If not a number, we'll fall back to exponential backoff
-            pass
-
-    # Exponential backoff with full jitter: delay = min(max_delay, base * 2^attempt * random(0,1))
-    exponential_delay = base_delay * (2**attempt)
-    jitter = random.random()  # Random value between 0 and 1
-    delay = float(min(exponential_delay * jitter, MAX_BACKOFF_DELAY))
-
-    # Ensure minimum delay of base_delay for predictability
-    return float(max(delay, base_delay))
-
-
-def normalize_base_url(url: str) -> str:
-    """Normalize an instance URL for safe path joining."""
-    return url.rstrip("/")
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    cache_key = normalize_base_url(base_url)
+    pool_size = max(pool_size, 1)
+    with _sessions_lock:
+        session = _sessions.get(cache_key)
+        if session is None:
+            session = requests.Session()
+            _sessions[cache_key] = session
+            _session_pool_sizes[cache_key] = 0
+        if pool_size > _session_pool_sizes[cache_key]:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session_pool_sizes[cache_key] = pool_size
+    return session
+
+
+def close_sessions() -> None:
+    """Close all pooled sessions and drop them from the cache."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+        _session_pool_sizes.clear()
 
 
 def _flatten_form_data(data: dict[str, Any], prefix: str = "") -> dict[str, Any]:
@@ -131,6 +165,21 @@ def absolute_url(base_url: str, path: str) -> str:
     return urljoin(normalize_base_url(base_url) + "/", path.lstrip("/"))
 
 
+def _is_connection_reset(error: Exception) -> bool:
+    """Whether a requests error means an open connection was dropped.
+
+    Connections that could not be opened at all (refused, DNS failure) are
+    not resets: retrying them only delays the error.
+    """
+    import requests
+    from urllib3.exceptions import ProtocolError
+
+    if isinstance(error, requests.exceptions.ChunkedEncodingError):
+        return True
+    reason = error.args[0] if error.args else None
+    return isinstance(reason, (ProtocolError, ConnectionResetError))
+
+
 def _send_single_request(
     method: str,
     *,
@@ -143,11 +192,17 @@ def _send_single_request(
     timeout: int = 30,
     debug: bool = False,
     verify: bool = True,
-) -> requests.Response:
+    pool_size: int = DEFAULT_POOL_SIZE,
+    on_upload_progress: ProgressCallback | None = None,
+    extra_headers: dict[str, str] | None = None,
+) -> "requests.Response":
     """Send a single HTTP request without retry logic."""
+    import requests
+
     auth_headers = build_auth_headers(email, token)
-    headers = {**auth_headers, "User-Agent": USER_AGENT}
+    headers = {**(extra_headers or {}), **auth_headers, "User-Agent": user_agent()}
     url = absolute_url(base_url, path)
+    session = get_session(base_url, pool_size)
 
     if debug:
         safe_headers = _sanitize_headers(headers)
@@ -164,21 +219,23 @@ def _send_single_request(
 
     try:
         if method == "GET":
-            return requests.get(url, headers=headers, timeout=timeout, verify=verify)
+            return session.get(url, headers=headers, timeout=timeout, verify=verify)
         if method == "POST":
-            # When uploading files, use data= instead of json= as they can't be combined
+            # When uploading files, stream a multipart body instead of json=
             if upload_files is not None:
                 # Flatten nested dicts to Rails-style form field names
                 flat_data = _flatten_form_data(post_data) if post_data else {}
-                return requests.post(
+                body = MultipartStream(
+                    flat_data, upload_files, on_progress=on_upload_progress
+                )
+                return session.post(
                     url,
-                    headers=headers,
-                    data=flat_data,
+                    headers={**headers, "Content-Type": body.content_type},
+                    data=body,
                     timeout=timeout,
-                    files=upload_files,
                     verify=verify,
                 )
-            return requests.post(
+            return session.post(
                 url,
                 headers=headers,
                 json=post_data,
@@ -186,26 +243,44 @@ def _send_single_request(
                 verify=verify,
             )
         if method == "DELETE":
-            return requests.delete(url, headers=headers, timeout=timeout, verify=verify)
-    except requests.exceptions.Timeout:
-        rprint(
-            "[red]Error: Request timed out. Please check your connection and try again.[/red]"
-        )
-        raise typer.Exit(1)
-    except requests.exceptions.ConnectionError:
-        rprint(
-            f"[red]Error: Could not connect to {normalize_base_url(base_url)}. Please check the URL and your connection.[/red]"
-        )
-        raise typer.Exit(1)
+            return session.delete(url, headers=headers, timeout=timeout, verify=verify)
+    except requests.exceptions.Timeout as e:
+        raise PwpushTimeoutError(
+            "Request timed out. Please check your connection and try again."
+        ) from e
+    except (
+        requests.exceptions.ConnectionError,
+        requests.exceptions.ChunkedEncodingError,
+    ) as e:
+        if _is_connection_reset(e):
+            raise PwpushConnectionResetError(
+                f"Connection to {normalize_base_url(base_url)} was reset: {e}"
+            ) from e
+        raise PwpushConnectionError(
+            f"Could not connect to {normalize_base_url(base_url)}. Please check the URL and your connection."
+        ) from e
     except requests.exceptions.RequestException as e:
-        rprint(f"[red]Error: Network request failed: {str(e)}[/red]")
-        raise typer.Exit(1)
+        raise PwpushConnectionError(f"Network request failed: {str(e)}") from e
+
+    raise PwpushError(f"Unsupported HTTP method '{method}'.")
 
-    rprint(f"[red]Error: Unsupported HTTP method '{method}'.[/red]")
-    raise typer.Exit(1)
 
+def send_request(method: str, **kwargs: Any) -> "requests.Response":
+    """Send an HTTP request for a CLI command, exiting on network errors.
+
+    Takes the same arguments as perform_request(). A network failure is
+    reported on the console and ends the command with typer.Exit(1).
+    """
+    try:
+        return perform_request(method, **kwargs)
+    except PwpushError as e:
+        import typer
 
-def send_request(
+        rprint(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+
+def perform_request(
     method: str,
     *,
     base_url: str,
@@ -219,11 +294,20 @@ def send_request(
     verify: bool = True,
     max_retries: int = DEFAULT_MAX_RETRIES,
     on_rate_limit_retry: Any | None = None,
-) -> requests.Response:
-    """Send an HTTP request to the configured instance with rate limit retry support.
-
-    This function will automatically retry on rate limit errors (HTTP 403 with rate limit
-    message or Retry-After header) using exponential backoff with jitter.
+    pool_size: int = DEFAULT_POOL_SIZE,
+    on_upload_progress: ProgressCallback | None = None,
+    extra_headers: dict[str, str] | None = None,
+    rate_limit: float = 0,
+    rate_burst: int = 1,
+    retry_policy: RetryPolicy | None = None,
+) -> "requests.Response":
+    """Send an HTTP request to the configured instance with retry support.
+
+    Rate limit errors (HTTP 403 with a rate limit message or Retry-After
+    header, or 429) are retried, as are the policy's other statuses and
+    connection resets for idempotent methods. Waits honour Retry-After and
+    otherwise back off with jitter. Responses are returned whatever their
+    status.
 
     Args:
         method: HTTP method (GET, POST, DELETE)
@@ -236,49 +320,101 @@ def send_request(
         timeout: Request timeout in seconds
         debug: Enable debug output
         verify: Verify SSL certificates
-        max_retries: Maximum number of retry attempts for rate limits
+        max_retries: Maximum number of retry attempts (when no retry_policy)
         on_rate_limit_retry: Optional callback function(attempt, delay, response) called before each retry
+        pool_size: Maximum keep-alive connections kept open to the instance
+        on_upload_progress: Optional callback(bytes_sent, total_bytes) called as
+            file uploads stream; restarts from zero if the request is retried
+        extra_headers: Optional additional request headers, e.g. conditional
+            If-None-Match / If-Modified-Since validators
+        rate_limit: Requests per second allowed to the instance across all
+            threads and pwpush processes on this host (0 disables pacing);
+            every attempt, including retries, waits for a token
+        rate_burst: Requests that may be sent back to back before pacing
+        retry_policy: What to retry and how long to wait; defaults to the
+            standard policy with max_retries
 
     Returns:
         The HTTP response object
-    """
-    last_response = None
-
-    for attempt in range(max_retries + 1):
-        response = _send_single_request(
-            method,
-            base_url=base_url,
-            path=path,
-            email=email,
-            token=token,
-            post_data=post_data,
-            upload_files=upload_files,
-            timeout=timeout,
-            debug=debug,
-            verify=verify,
-        )
-
-        # Check if this is a rate limit error and we have retries left
-        if attempt < max_retries and is_rate_limit_error(response):
-            delay = get_retry_delay(response, attempt)
 
+    Raises:
+        PwpushTimeoutError: If the request timed out.
+        PwpushConnectionError: If the instance could not be reached.
+        PwpushError: If the HTTP method is not supported.
+    """
+    policy = retry_policy or RetryPolicy(max_retries=max_retries)
+    instance = normalize_base_url(base_url)
+    limiter = get_rate_limiter(instance, rate_limit, rate_burst)
+    first_started = time.monotonic()
+    delay = 0.0
+    attempt = 0
+
+    while True:
+        if limiter is not None:
+            waited = limiter.acquire()
+            if debug and waited > 0:
+                rprint(f"[dim][debug] Rate limiter waited {waited:.2f}s[/dim]")
+
+        started = time.monotonic()
+        try:
+            response = _send_single_request(
+                method,
+                base_url=base_url,
+                path=path,
+                email=email,
+                token=token,
+                post_data=post_data,
+                upload_files=upload_files,
+                timeout=timeout,
+                debug=debug,
+                verify=verify,
+                pool_size=pool_size,
+                on_upload_progress=on_upload_progress,
+                extra_headers=extra_headers,
+            )
+        except PwpushConnectionResetError:
+            if not policy.allows_method(method):
+                raise
+            next_delay = policy.next_delay(
+                None, attempt, delay, time.monotonic() - first_started
+            )
+            if next_delay is None:
+                raise
             if debug:
                 rprint(
-                    f"[yellow]Rate limit hit (attempt {attempt + 1}/{max_retries + 1}). "
-                    f"Waiting {delay:.1f}s before retry...[/yellow]"
+                    f"[yellow]Connection reset (attempt {attempt + 1}). "
+                    f"Waiting {next_delay:.1f}s before retry...[/yellow]"
                 )
+            delay = next_delay
+            time.sleep(delay)
+            attempt += 1
+            continue
 
-            # Call the optional callback if provided (for UI updates)
-            if on_rate_limit_retry is not None:
-                on_rate_limit_retry(attempt + 1, delay, response)
+        rate_limited = is_rate_limit_error(response)
+        observe_response(instance, response, started, rate_limited)
 
-            time.sleep(delay)
-            last_response = response
-            continue  # Retry the request
+        if not policy.retries_response(method, response, rate_limited):
+            return response
+        next_delay = policy.next_delay(
+            response, attempt, delay, time.monotonic() - first_started
+        )
+        if next_delay is None:
+            # Out of retries: the caller reports the last response
+            return response
+        delay = next_delay
+
+        if debug:
+            reason = (
+                "Rate limit hit" if rate_limited else f"HTTP {response.status_code}"
+            )
+            rprint(
+                f"[yellow]{reason} (attempt {attempt + 1}/{policy.max_retries + 1}). "
+                f"Waiting {delay:.1f}s before retry...[/yellow]"
+            )
 
-        # Not a rate limit error or no more retries - return the response
-        return response
+        # Call the optional callback if provided (for UI updates)
+        if rate_limited and on_rate_limit_retry is not None:
+            on_rate_limit_retry(attempt + 1, delay, response)
 
-    # If we exhausted all retries, return the last rate limit response
-    # The caller should handle this appropriately
-    return last_response if last_response is not None else response
+        time.sleep(delay)
+        attempt += 1
@@ -0,0 +1,239 @@
+"""Adaptive concurrency for operations that send many requests.
+
+An AdaptiveConcurrency controller sets how many requests to an instance
+may be in flight at once, using AIMD (additive increase, multiplicative
+decrease): every successful response raises the level by 1/level (about
+one more slot per round of requests), and a rate-limit response or a
+Retry-After header halves it. RateLimit-Remaining / RateLimit-Reset
+headers, when the server sends them, cap the level until the reset.
+
+While a controller is active for an instance, perform_request reports
+every response to it. The level reached is saved per instance, so the
+next run starts where this one left off.
+"""
+
+from typing import Any, Iterator
+
+import json
+import math
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+from pwpush.utils import app_dir
+
+# Per-instance concurrency levels persisted between invocations
+concurrency_file = app_dir().joinpath("concurrency.json")
+
+# Level used for an instance with no saved level
+DEFAULT_CONCURRENCY = 4
+
+# Default ceiling for adaptive concurrency
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Factor applied to the level on a rate-limit signal
+DECREASE_FACTOR = 0.5
+
+# How long a RateLimit-Remaining cap holds when no reset time is sent
+DEFAULT_RESET_SECONDS = 1.0
+
+# Reset values above this are Unix timestamps rather than seconds from now
+_EPOCH_THRESHOLD = 1_000_000_000
+
+_REMAINING_HEADERS = ("RateLimit-Remaining", "X-RateLimit-Remaining")
+_RESET_HEADERS = ("RateLimit-Reset", "X-RateLimit-Reset")
+# Combined "RateLimit: limit=100, remaining=50, reset=30" (or r=50;t=30) form
+_COMBINED_REMAINING = re.compile(r"(?:\bremaining|(?<![\w-])r)\s*=\s*(\d+)")
+_COMBINED_RESET = re.compile(r"(?:\breset|(?<![\w-])t)\s*=\s*(\d+(?:\.\d+)?)")
+
+_active: dict[str, "AdaptiveConcurrency"] = {}
+_active_lock = threading.Lock()
+
+
+def _header(response: Any, names: tuple[str, ...]) -> str | None:
+    """Return the first of the named headers present on the response."""
+    headers = getattr(response, "headers", None)
+    if headers is None:
+        return None
+    for name in names:
+        value = headers.get(name)
+        if isinstance(value, str) and value.strip():
+            return value.strip()
+    return None
+
+
+def rate_limit_headers(response: Any) -> tuple[int | None, float | None]:
+    """Read the server's remaining request quota from a response.
+
+    Returns:
+        (remaining, reset) where remaining is the number of requests left in
+        the current window and reset the seconds until it renews. Either is
+        None when the server does not send it.
+    """
+    remaining_text = _header(response, _REMAINING_HEADERS)
+    reset_text = _header(response, _RESET_HEADERS)
+    combined = _header(response, ("RateLimit",))
+    if combined is not None:
+        if remaining_text is None and (match := _COMBINED_REMAINING.search(combined)):
+            remaining_text = match.group(1)
+        if reset_text is None and (match := _COMBINED_RESET.search(combined)):
+            reset_text = match.group(1)
+
+    remaining = None
+    if remaining_text is not None:
+        try:
+            remaining = max(int(remaining_text), 0)
+        except ValueError:
+            pass
+
+    reset = None
+    if reset_text is not None:
+        try:
+            value = float(reset_text)
+        except ValueError:
+            value = math.nan
+        if value > _EPOCH_THRESHOLD:
+            value -= time.time()
+        if math.isfinite(value):
+            reset = max(value, 0.0)
+    return remaining, reset
+
+
+class AdaptiveConcurrency:
+    """AIMD controller for the number of requests in flight to one instance.
+
+    Args:
+        key: Normalized instance URL
+        initial: Starting level
+        maximum: Highest level allowed
+        minimum: Lowest level allowed
+    """
+
+    def __init__(
+        self,
+        key: str,
+        initial: float = DEFAULT_CONCURRENCY,
+        maximum: int = DEFAULT_MAX_CONCURRENCY,
+        minimum: int = 1,
+    ):
+        self.key = key
+        self.minimum = max(minimum, 1)
+        self.maximum = max(maximum, self.minimum)
+        self._level = min(max(float(initial), self.minimum), self.maximum)
+        self._cap: int | None = None
+        self._cap_until = 0.0
+        self._decreased_at = -math.inf
+        self._lock = threading.Lock()
+
+    @property
+    def level(self) -> float:
+        """The AIMD level, before any header cap."""
+        return self._level
+
+    def limit(self) -> int:
+        """Return how many requests may be in flight right now."""
+        with self._lock:
+            limit = int(self._level)
+            if self._cap is not None and time.monotonic() < self._cap_until:
+                limit = min(limit, self._cap)
+            return max(limit, self.minimum)
+
+    def observe(self, response: Any, started: float, rate_limited: bool) -> None:
+        """Adjust the level for one response.
+
+        Args:
+            response: The HTTP response received
+            started: time.monotonic() when the request was sent; signals from
+                requests sent before the last decrease do not decrease again
+            rate_limited: Whether the response is a rate-limit error
+        """
+        remaining, reset = rate_limit_headers(response)
+        retry_after = _header(response, ("Retry-After",)) is not None
+        status_code = getattr(response, "status_code", None)
+        now = time.monotonic()
+        with self._lock:
+            if remaining is not None:
+                self._cap = max(remaining, self.minimum)
+                self._cap_until = now + (
+                    reset if reset is not None else DEFAULT_RESET_SECONDS
+                )
+
+            # A 429 is a rate limit even without a Retry-After header.
+            if rate_limited or retry_after or remaining == 0 or status_code == 429:
+                # One cut per round: requests already in flight when the
+                # level dropped report the same congestion.
+                if started >= self._decreased_at:
+                    self._level = max(self._level * DECREASE_FACTOR, self.minimum)
+                    self._decreased_at = now
+            elif isinstance(status_code, int) and status_code < 500:
+                self._level = min(self._level + 1 / self._level, self.maximum)
+
+
+def _load_levels() -> dict[str, Any]:
+    """Read the saved levels, ignoring missing or corrupt files."""
+    try:
+        with open(concurrency_file, encoding="utf-8") as file:
+            data = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def load_level(key: str) -> float | None:
+    """Return the level saved for an instance, if any."""
+    entry = _load_levels().get(key)
+    level = entry.get("level") if isinstance(entry, dict) else None
+    if isinstance(level, (int, float)) and math.isfinite(level) and level >= 1:
+        return float(level)
+    return None
+
+
+def save_level(key: str, level: float) -> None:
+    """Save an instance's level to disk (best effort)."""
+    levels = _load_levels()
+    levels[key] = {"level": round(level, 2), "updated_at": int(time.time())}
+    temp_file = concurrency_file.with_suffix(".tmp")
+    try:
+        concurrency_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(temp_file, "w", encoding="utf-8") as file:
+            json.dump(levels, file)
+        os.replace(temp_file, concurrency_file)
+    except OSError:
+        pass
+
+
+@contextmanager
+def adaptive_concurrency(
+    key: str, maximum: int = DEFAULT_MAX_CONCURRENCY
+) -> Iterator[AdaptiveConcurrency]:
+    """Activate a controller for an instance, starting from its saved level.
+
+    The level reached is saved when the block exits.
+    """
+    saved = load_level(key)
+    controller = AdaptiveConcurrency(
+        key, saved if saved is not None else DEFAULT_CONCURRENCY, maximum
+    )
+    with _active_lock:
+        previous = _active.get(key)
+        _active[key] = controller
+    try:
+        yield controller
+    finally:
+        with _active_lock:
+            if previous is None:
+                _active.pop(key, None)
+            else:
+                _active[key] = previous
+        save_level(key, controller.level)
+
+
+def observe_response(
+    key: str, response: Any, started: float, rate_limited: bool
+) -> None:
+    """Report a response to the instance's active controller, if any."""
+    controller = _active.get(key)
+    if controller is not None:
+        controller.observe(response, started, rate_limited)
@@ -1,8 +1,9 @@
-from typing import Any
-
-from dateutil import parser
+from typing import Any, Callable, Iterator, Mapping
 
 from pwpush.api.capabilities import API_PROFILE_LEGACY, API_PROFILE_V2
+from pwpush.api.client import normalize_base_url
+from pwpush.api.errors import PwpushAPIError, response_error
+from pwpush.utils import format_timestamp, parse_boolean, utc_timestamp
 
 _DURATION_BY_DAYS = {
     1: 6,
@@ -31,6 +32,152 @@ def validation_paths(api_profile: str, *, expired: bool = False) -> list[str]:
     return [legacy_path, v2_path, legacy_alt_path]
 
 
+# Page metadata headers sent by paginating list endpoints
+_PAGE_METADATA_HEADERS = (
+    "X-Per-Page",
+    "Per-Page",
+    "X-Total",
+    "X-Total-Count",
+    "Total-Count",
+    "X-Page",
+    "Current-Page",
+)
+
+
+def has_next_page(response: Any, page: int) -> bool:
+    """Check whether a push list response announces a page after `page`.
+
+    Paginating servers say so with a Link header or page metadata headers
+    (X-Next-Page, X-Total-Pages, X-Per-Page and the like). A response with
+    neither holds the whole list: asking a server that ignores ?page=N for
+    page 2 would only download the list again.
+    """
+    headers = getattr(response, "headers", None)
+
+    def header(name: str) -> str | None:
+        value = headers.get(name) if headers is not None else None
+        return value.strip() if isinstance(value, str) else None
+
+    link = header("Link")
+    if link is not None:
+        return 'rel="next"' in link
+    next_page = header("X-Next-Page")
+    if next_page is not None:
+        return bool(next_page)
+    total_pages = header("X-Total-Pages") or header("Total-Pages")
+    if total_pages is not None:
+        try:
+            return page < int(total_pages)
+        except ValueError:
+            return True
+    return any(header(name) for name in _PAGE_METADATA_HEADERS)
+
+
+class PushListPager:
+    """Paging rules for the active or expired push list.
+
+    Request next_path, hand the response to read() and repeat until
+    next_path is None; the CLI and both library clients walk the list this
+    way, each with its own transport.
+
+    The first list endpoint that does not answer 404 is used. Further pages
+    are requested with ?page=N only while the server announces one (see
+    has_next_page), and stop at an empty or short page, a 404, or a repeat
+    of the previous page. Pushes shifting between pages while listing are
+    not repeated. A 304 answer to conditional headers on the first page
+    ends the listing with no pushes.
+
+    Args:
+        api_profile: API profile of the instance
+        expired: List expired instead of active pushes
+    """
+
+    def __init__(self, api_profile: str, *, expired: bool = False):
+        self._candidates = validation_paths(api_profile, expired=expired)
+        self._tried = 0
+        self._page_size = 0
+        self._previous_tokens: list[Any] = []
+        self.path: str | None = None
+        self.page = 1
+        self.next_path: str | None = self._candidates[0]
+
+    def read(self, response: Any) -> list[Any] | None:
+        """Take the response for next_path and return the pushes it adds.
+
+        The first page is always returned, even when empty; later pages that
+        add nothing give None.
+
+        Raises:
+            PwpushAPIError: If the list answers with an error status, or no
+                list endpoint exists on the instance.
+        """
+        self.next_path = None
+        status_code = response.status_code
+        if self.path is None:
+            candidate = self._candidates[self._tried]
+            self._tried += 1
+            if status_code == 404:
+                if self._tried < len(self._candidates):
+                    self.next_path = self._candidates[self._tried]
+                    return None
+                raise PwpushAPIError(
+                    404, "No compatible list endpoint found on this instance."
+                )
+            self.path = candidate
+            if status_code == 304:
+                return []
+        elif status_code == 404:
+            return None
+        if status_code != 200:
+            raise response_error(response)
+
+        pushes = response.json()
+        if not isinstance(pushes, list) or not pushes:
+            return [] if self.page == 1 else None
+        tokens = [push.get("url_token") for push in pushes if isinstance(push, dict)]
+        if self.page > 1 and tokens == self._previous_tokens:
+            return None
+
+        seen = set(self._previous_tokens)
+        if len(pushes) >= self._page_size and has_next_page(response, self.page):
+            self._page_size = max(self._page_size, len(pushes))
+            self._previous_tokens = tokens
+            self.page += 1
+            self.next_path = f"{self.path}?page={self.page}"
+        return [
+            push
+            for push in pushes
+            if not (isinstance(push, dict) and push.get("url_token") in seen)
+        ]
+
+
+def iter_push_pages(
+    send: Callable[..., Any],
+    api_profile: str,
+    *,
+    expired: bool = False,
+    headers: dict[str, str] | None = None,
+) -> Iterator[tuple[Any, list[Any]]]:
+    """Yield (response, pushes) for each page of the active or expired list.
+
+    send(method, path, headers=...) performs one request and returns its
+    response. Only one page is held in memory at a time, and the next page
+    is only requested once the caller asks for it. `headers` are sent with
+    the first page's request only; a 304 answer to them is yielded with no
+    pushes. See PushListPager for the paging rules.
+
+    Raises:
+        PwpushAPIError: If the list is not accessible.
+    """
+    pager = PushListPager(api_profile, expired=expired)
+    while pager.next_path is not None:
+        first_page = pager.path is None
+        response = send("GET", pager.next_path, headers=headers if first_page else None)
+        pushes = pager.read(response)
+        if pushes is not None:
+            yield response, pushes
+
+
 def push_create_path(api_profile: str, kind: str) -> str:
     """Return create endpoint for text/url/qr/file push."""
     if api_profile == API_PROFILE_V2:
@@ -49,6 +196,30 @@ def push_preview_path(api_profile: str, url_token: str, kind: str) -> str:
     return f"/p/{url_token}/preview.json"
 
 
+def push_share_url(
+    base_url: str, api_profile: str, body: dict[str, Any], kind: str
+) -> str | None:
+    """Derive the share URL of a created push without a preview request.
+
+    Uses the create response's own URL when present. Otherwise the URL is
+    built from the instance URL and url_token, which requires the response
+    to state retrieval_step (those pushes are shared via the /r step page).
+    Returns None when the URL cannot be derived safely.
+    """
+    if isinstance(body.get("url"), str) and body["url"]:
+        return str(body["url"])
+
+    url_token = body.get("url_token")
+    if not url_token or "retrieval_step" not in body:
+        return None
+
+    prefix = "f" if api_profile == API_PROFILE_LEGACY and kind == "file" else "p"
+    share_url = f"{normalize_base_url(base_url)}/{prefix}/{url_token}"
+    if parse_boolean(body["retrieval_step"]):
+        share_url += "/r"
+    return share_url
+
+
 def push_expire_path(api_profile: str, url_token: str) -> str:
     """Return expire endpoint path."""
     if api_profile == API_PROFILE_V2:
@@ -63,6 +234,53 @@ def push_audit_path(api_profile: str, url_token: str) -> str:
     return f"/p/{url_token}/audit.json"
 
 
+def _resolve_options(
+    options: dict[str, Any], defaults: Mapping[str, Any] | None
+) -> dict[str, Any]:
+    """Fill options left as None from defaults and drop those still unset."""
+    resolved = {}
+    for key, value in options.items():
+        if value is None and defaults is not None:
+            value = defaults.get(key)
+        if value is not None:
+            resolved[key] = value
+    return resolved
+
+
+def text_push_payload(
+    secret: str,
+    *,
+    kind: str = "text",
+    days: int | None = None,
+    views: int | None = None,
+    deletable: bool | None = None,
+    retrieval_step: bool | None = None,
+    note: str | None = None,
+    name: str | None = None,
+    passphrase: str | None = None,
+    defaults: Mapping[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Build a legacy-shaped text push payload.
+
+    Options left as None take their value from `defaults` (keyed by payload
+    field, e.g. the CLI's expiration settings), or are omitted so the
+    instance defaults apply. Use adapt_text_payload_for_profile() to
+    convert the result for API v2.
+    """
+    options = {
+        "expire_after_days": days,
+        "expire_after_views": views,
+        "deletable_by_viewer": deletable,
+        "retrieval_step": retrieval_step,
+        "note": note,
+        "name": name,
+        "passphrase": passphrase,
+    }
+    push: dict[str, Any] = {"kind": kind, "payload": secret}
+    push.update(_resolve_options(options, defaults))
+    return {"password": push}
+
+
 def adapt_text_payload_for_profile(
     payload: dict[str, Any], api_profile: str
 ) -> dict[str, Any]:
@@ -151,8 +369,17 @@ def adapt_file_uploads_for_profile(
     return upload_files
 
 
+def _audit_times(created_at: str) -> tuple[str, str]:
+    """Return (display time, sortable ISO-8601 UTC timestamp) for an event."""
+    return format_timestamp(created_at), utc_timestamp(created_at)
+
+
 def normalize_audit_events(body: dict[str, Any]) -> list[dict[str, str]]:
-    """Normalize legacy and v2 audit payloads into one renderable schema."""
+    """Normalize legacy and v2 audit payloads into one renderable schema.
+
+    Each row also carries a "timestamp" (ISO-8601 UTC) that sorts
+    chronologically, for merging events from several pushes.
+    """
     if "views" in body:
         rows = []
         for event in body["views"]:
@@ -164,15 +391,15 @@ def normalize_audit_events(body: dict[str, Any]) -> list[dict[str, str]]:
             else:
                 kind_label = str(kind)
 
+            created_at, timestamp = _audit_times(event["created_at"])
             rows.append(
                 {
                     "ip": event.get("ip", "Unknown"),
                     "user_agent": event.get("user_agent", "Unknown"),
                     "referrer": event.get("referrer") or "None",
                     "successful": str(event.get("successful", True)),
-                    "created_at": parser.isoparse(event["created_at"]).strftime(
-                        "%m/%d/%Y, %H:%M:%S UTC"
-                    ),
+                    "created_at": created_at,
+                    "timestamp": timestamp,
                     "kind": kind_label,
                 }
             )
@@ -180,15 +407,15 @@ def normalize_audit_events(body: dict[str, Any]) -> list[dict[str, str]]:
 
     rows = []
     for event in body.get("logs", []):
+        created_at, timestamp = _audit_times(event["created_at"])
         rows.append(
             {
                 "ip": event.get("ip", "Unknown"),
                 "user_agent": event.get("user_agent", "Unknown"),
                 "referrer": event.get("referrer") or "None",
                 "successful": "True",
-                "created_at": parser.isoparse(event["created_at"]).strftime(
-                    "%m/%d/%Y, %H:%M:%S UTC"
-                ),
+                "created_at": created_at,
+                "timestamp": timestamp,
                 "kind": str(event.get("kind", "unknown")).replace("_", " ").title(),
             }
         )
@@ -214,6 +441,47 @@ def request_preview_path(api_profile: str, url_token: str) -> str:
     return f"/r/{url_token}/preview.json"
 
 
+def request_share_url(body: dict[str, Any]) -> str | None:
+    """Return the share URL from a request create response, if it has one."""
+    if isinstance(body.get("url"), str) and body["url"]:
+        return str(body["url"])
+    return None
+
+
+def request_payload(
+    text: str,
+    *,
+    days: int | None = None,
+    views: int | None = None,
+    deletable: bool | None = None,
+    retrieval_step: bool | None = None,
+    note: str | None = None,
+    name: str | None = None,
+    notify: str | None = None,
+    notify_locale: str | None = None,
+    defaults: Mapping[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Build a legacy-shaped request payload.
+
+    Options left as None take their value from `defaults`, or are omitted,
+    as in text_push_payload(). Use adapt_request_payload_for_profile() to
+    convert the result for API v2.
+    """
+    options = {
+        "expire_after_days": days,
+        "expire_after_views": views,
+        "deletable_by_viewer": deletable,
+        "retrieval_step": retrieval_step,
+        "note": note,
+        "name": name,
+        "notify_emails_to": notify,
+        "notify_emails_to_locale": notify_locale,
+    }
+    request: dict[str, Any] = {"request": text}
+    request.update(_resolve_options(options, defaults))
+    return {"request": request}
+
+
 def adapt_request_payload_for_profile(
     payload: dict[str, Any], api_profile: str
 ) -> dict[str, Any]:
@@ -0,0 +1,52 @@
+"""Exceptions raised by the embeddable pwpush client APIs.
+
+The CLI commands report failures and exit; the clients meant for use from
+other programs raise these instead so callers can handle them.
+"""
+
+from typing import Any
+
+
+class PwpushError(Exception):
+    """Base class for errors raised by the pwpush client APIs."""
+
+
+class PwpushConnectionError(PwpushError):
+    """The instance could not be reached or the connection failed."""
+
+
+class PwpushTimeoutError(PwpushConnectionError):
+    """The instance did not answer within the request timeout."""
+
+
+class PwpushConnectionResetError(PwpushConnectionError):
+    """The connection was dropped after the request was sent."""
+
+
+class PwpushAPIError(PwpushError):
+    """The instance answered with an error status.
+
+    Attributes:
+        status_code: HTTP status code of the response
+        message: Error message from the response body, or its raw text
+        body: Parsed JSON body of the response, if it had one
+    """
+
+    def __init__(self, status_code: int, message: str, body: Any = None) -> None:
+        super().__init__(f"Error {status_code}: {message}")
+        self.status_code = status_code
+        self.message = message
+        self.body = body
+
+
+def response_error(response: Any) -> PwpushAPIError:
+    """Build a PwpushAPIError from an error response."""
+    message = response.text
+    body = None
+    try:
+        body = response.json()
+    except ValueError:
+        pass
+    if isinstance(body, dict) and body.get("error"):
+        message = body["error"]
+    return PwpushAPIError(response.status_code, str(message), body)
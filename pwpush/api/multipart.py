@@ -0,0 +1,138 @@
+"""Streaming multipart/form-data bodies for file uploads."""
+
+from typing import Any, BinaryIO, Callable
+
+import mimetypes
+import os
+import secrets
+
+UPLOAD_CHUNK_SIZE = 64 * 1024  # bytes read from disk per chunk
+
+ProgressCallback = Callable[[int, int], None]
+
+
+def _file_size(fileobj: BinaryIO) -> int:
+    """Return the total size of an open binary file."""
+    try:
+        return os.fstat(fileobj.fileno()).st_size
+    except (AttributeError, OSError, ValueError):
+        fileobj.seek(0, os.SEEK_END)
+        size = fileobj.tell()
+        fileobj.seek(0)
+        return size
+
+
+def _quote(value: str) -> str:
+    """Escape a value for use in a Content-Disposition header."""
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r\n", " ")
+
+
+class MultipartStream:
+    """File-like multipart/form-data body that streams file parts from disk.
+
+    requests encodes `files=` uploads into a single bytes object before
+    sending, so memory use grows with the file size. This body reports its
+    full length up front (so requests sends a Content-Length) and produces
+    the encoded bytes on demand as the connection reads them, keeping peak
+    memory at roughly one chunk regardless of file size.
+
+    Args:
+        fields: Flat form fields (values are sent as strings, None is skipped)
+        files: Mapping of field name to an open binary file, or a list of
+            open binary files for repeated fields such as push[files][]
+        on_progress: Optional callback(bytes_sent, total_bytes)
+        chunk_size: Number of bytes read from disk at a time
+    """
+
+    def __init__(
+        self,
+        fields: dict[str, Any],
+        files: dict[str, Any],
+        on_progress: ProgressCallback | None = None,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+    ) -> None:
+        self.boundary = secrets.token_hex(16)
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self.on_progress = on_progress
+        self.chunk_size = chunk_size
+        self.bytes_sent = 0
+
+        self._parts: list[bytes | BinaryIO] = []
+        for name, value in fields.items():
+            values = value if isinstance(value, (list, tuple)) else [value]
+            for item in values:
+                if item is None:
+                    continue
+                self._parts.append(self._field_header(name))
+                self._parts.append(str(item).encode("utf-8"))
+                self._parts.append(b"\r\n")
+
+        for name, value in files.items():
+            fileobjs = value if isinstance(value, (list, tuple)) else [value]
+            for fileobj in fileobjs:
+                fileobj.seek(0)
+                self._parts.append(self._file_header(name, fileobj))
+                self._parts.append(fileobj)
+                self._parts.append(b"\r\n")
+
+        self._parts.append(f"--{self.boundary}--\r\n".encode())
+
+        self.len = sum(
+            len(part) if isinstance(part, bytes) else _file_size(part)
+            for part in self._parts
+        )
+        self._index = 0
+        self._buffer = b""
+
+    def _field_header(self, name: str) -> bytes:
+        return (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'
+        ).encode("utf-8")
+
+    def _file_header(self, name: str, fileobj: BinaryIO) -> bytes:
+        filename = os.path.basename(str(getattr(fileobj, "name", name)))
+        content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        return (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote(name)}"; '
+            f'filename="{_quote(filename)}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode("utf-8")
+
+    def __len__(self) -> int:
+        return self.len
+
+    def _next_chunk(self) -> bytes:
+        """Return the next piece of the encoded body, or b"" when done."""
+        while self._index < len(self._parts):
+            part = self._parts[self._index]
+            if isinstance(part, bytes):
+                self._index += 1
+                if part:
+                    return part
+                continue
+            chunk = part.read(self.chunk_size)
+            if chunk:
+                return bytes(chunk)
+            self._index += 1
+        return b""
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes of the encoded body (all remaining if -1)."""
+        while size < 0 or len(self._buffer) < size:
+            chunk = self._next_chunk()
+            if not chunk:
+                break
+            self._buffer += chunk
+
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+
+        if data:
+            self.bytes_sent += len(data)
+            if self.on_progress is not None:
+                self.on_progress(self.bytes_sent, self.len)
+        return data
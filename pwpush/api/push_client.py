@@ -0,0 +1,303 @@
+"""Synchronous client for using pwpush as a Python library.
+
+PushClient holds the credentials and resolved API profile for one instance
+and reuses the process-wide pooled session for it, so a program can make
+many calls without spawning the CLI or importing pwpush.__main__ (which
+loads the user's config). Results are typed and failures raise the
+exceptions in pwpush.api.errors instead of exiting.
+
+Example:
+    client = PushClient("https://eu.pwpush.com", token="...")
+    push = client.create_push("s3cret", days=1, views=3)
+    print(push.url)
+"""
+
+from typing import Any, Iterator
+
+from pwpush.api.capabilities import detect_api_profile
+from pwpush.api.client import (
+    DEFAULT_POOL_SIZE,
+    normalize_base_url,
+    perform_request,
+)
+from pwpush.api.endpoints import (
+    adapt_request_payload_for_profile,
+    adapt_text_payload_for_profile,
+    iter_push_pages,
+    normalize_audit_events,
+    push_audit_path,
+    push_create_path,
+    push_expire_path,
+    push_preview_path,
+    push_share_url,
+    request_create_path,
+    request_payload,
+    request_preview_path,
+    request_share_url,
+    text_push_payload,
+)
+from pwpush.api.errors import PwpushError, response_error
+from pwpush.api.results import AuditEvent, Push, SecretRequest
+from pwpush.api.retry import DEFAULT_MAX_RETRIES, RetryPolicy
+
+
+class PushClient:
+    """Synchronous Password Pusher client that raises instead of exiting.
+
+    The API profile (v2 or legacy) is detected once, on first use, unless
+    given. Connections are pooled per instance for the whole process and
+    shared with any other client of the same instance.
+
+    Args:
+        base_url: Base URL of the Password Pusher instance
+        email: User email for authentication ("Not Set" for anonymous use)
+        token: API token for authentication ("Not Set" for anonymous use)
+        account_id: Account to create pushes and requests in, if any
+        api_profile: "v2" or "legacy" to skip profile detection
+        pool_size: Maximum keep-alive connections kept open to the instance
+        timeout: Seconds to wait for each request's response
+        verify: Verify TLS certificates
+        max_retries: Maximum number of retries per request (when no
+            retry_policy is given)
+        rate_limit: Requests per second to the instance, shared with other
+            clients and pwpush processes on this host (0 disables pacing)
+        rate_burst: Requests sent back to back before pacing applies
+        retry_policy: What to retry and how long to wait (see
+            pwpush.api.retry)
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        email: str = "Not Set",
+        token: str = "Not Set",
+        account_id: str | None = None,
+        api_profile: str | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: int = 30,
+        verify: bool = True,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        rate_limit: float = 0,
+        rate_burst: int = 1,
+        retry_policy: RetryPolicy | None = None,
+    ) -> None:
+        self.base_url = normalize_base_url(base_url)
+        self.email = email
+        self.token = token
+        self.account_id = account_id
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.verify = verify
+        self.max_retries = max_retries
+        self.rate_limit = rate_limit
+        self.rate_burst = rate_burst
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=max_retries)
+        self._api_profile = api_profile
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        post_data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Any:
+        """Send a request to the instance and return the raw response.
+
+        Raises:
+            PwpushTimeoutError: If the instance does not answer in time.
+            PwpushConnectionError: If the instance cannot be reached.
+        """
+        if (
+            method == "POST"
+            and post_data is not None
+            and self.account_id
+            and self.account_id != "Not Set"
+        ):
+            post_data = {**post_data, "account_id": self.account_id}
+        return perform_request(
+            method,
+            base_url=self.base_url,
+            path=path,
+            email=self.email,
+            token=self.token,
+            post_data=post_data,
+            timeout=self.timeout,
+            verify=self.verify,
+            max_retries=self.max_retries,
+            pool_size=self.pool_size,
+            extra_headers=headers,
+            rate_limit=self.rate_limit,
+            rate_burst=self.rate_burst,
+            retry_policy=self.retry_policy,
+        )
+
+    def _json(
+        self,
+        method: str,
+        path: str,
+        *,
+        post_data: dict[str, Any] | None = None,
+        expected: tuple[int, ...] = (200, 201),
+    ) -> Any:
+        """Send a request and return its JSON body, raising on error statuses."""
+        response = self.request(method, path, post_data=post_data)
+        if response.status_code not in expected:
+            raise response_error(response)
+        try:
+            return response.json()
+        except ValueError as e:
+            raise PwpushError(
+                f"Invalid JSON response from {path} ({response.status_code})."
+            ) from e
+
+    @property
+    def api_profile(self) -> str:
+        """The instance's API profile, detected on first use."""
+        if self._api_profile is None:
+            self._api_profile = detect_api_profile(
+                base_url=self.base_url, email=self.email, token=self.token
+            )
+        return self._api_profile
+
+    def create_push(
+        self,
+        secret: str,
+        *,
+        kind: str = "text",
+        days: int | None = None,
+        views: int | None = None,
+        deletable: bool | None = None,
+        retrieval_step: bool | None = None,
+        note: str | None = None,
+        name: str | None = None,
+        passphrase: str | None = None,
+    ) -> Push:
+        """Create a text, url or qr push.
+
+        Options left as None use the instance defaults. The share URL is
+        taken from the create response when possible, and otherwise from
+        the push's preview.
+
+        Raises:
+            PwpushAPIError: If the instance rejects the push.
+        """
+        profile = self.api_profile
+        payload = text_push_payload(
+            secret,
+            kind=kind,
+            days=days,
+            views=views,
+            deletable=deletable,
+            retrieval_step=retrieval_step,
+            note=note,
+            name=name,
+            passphrase=passphrase,
+        )
+        created = self._json(
+            "POST",
+            push_create_path(profile, kind),
+            post_data=adapt_text_payload_for_profile(payload, profile),
+        )
+        url = push_share_url(self.base_url, profile, created, kind)
+        if url is None:
+            url = self.preview_push(created["url_token"], kind=kind)
+        return Push.from_json(created, url=url, kind=kind)
+
+    def preview_push(self, url_token: str, *, kind: str = "text") -> str | None:
+        """Return the share URL of a push.
+
+        Raises:
+            PwpushAPIError: If the push does not exist or is not accessible.
+        """
+        body = self._json("GET", push_preview_path(self.api_profile, url_token, kind))
+        url = body.get("url") if isinstance(body, dict) else None
+        return url if isinstance(url, str) else None
+
+    def expire_push(self, url_token: str) -> None:
+        """Expire a push.
+
+        Raises:
+            PwpushAPIError: If the push cannot be expired.
+        """
+        response = self.request("DELETE", push_expire_path(self.api_profile, url_token))
+        if response.status_code != 200:
+            raise response_error(response)
+
+    def audit_push(self, url_token: str) -> list[AuditEvent]:
+        """Return the audit log of a push, oldest event first.
+
+        Raises:
+            PwpushAPIError: If the audit log is not accessible.
+        """
+        body = self._json("GET", push_audit_path(self.api_profile, url_token))
+        events = [AuditEvent.from_row(row) for row in normalize_audit_events(body)]
+        return sorted(events, key=lambda event: event.timestamp)
+
+    def list_pushes(self, *, expired: bool = False) -> Iterator[Push]:
+        """Yield the account's active (or expired) pushes, page by page.
+
+        Pages are walked with the CLI's paging rules (see PushListPager); the
+        next page is only requested once the caller has consumed the current
+        one.
+
+        Raises:
+            PwpushAPIError: If the list is not accessible.
+        """
+        for _, pushes in iter_push_pages(
+            self.request, self.api_profile, expired=expired
+        ):
+            for push in pushes:
+                if isinstance(push, dict):
+                    yield Push.from_json(push)
+
+    def create_request(
+        self,
+        text: str,
+        *,
+        days: int | None = None,
+        views: int | None = None,
+        deletable: bool | None = None,
+        retrieval_step: bool | None = None,
+        note: str | None = None,
+        name: str | None = None,
+        notify: str | None = None,
+        notify_locale: str | None = None,
+    ) -> SecretRequest:
+        """Create a request for someone to send a secret (Pro instances).
+
+        Raises:
+            PwpushAPIError: If the instance rejects the request.
+        """
+        profile = self.api_profile
+        payload = request_payload(
+            text,
+            days=days,
+            views=views,
+            deletable=deletable,
+            retrieval_step=retrieval_step,
+            note=note,
+            name=name,
+            notify=notify,
+            notify_locale=notify_locale,
+        )
+        created = self._json(
+            "POST",
+            request_create_path(profile),
+            post_data=adapt_request_payload_for_profile(payload, profile),
+        )
+        url = request_share_url(created)
+        if url is None:
+            url = self.preview_request(created["url_token"])
+        return SecretRequest.from_json(created, url=url)
+
+    def preview_request(self, url_token: str) -> str | None:
+        """Return the share URL of a request.
+
+        Raises:
+            PwpushAPIError: If the request does not exist or is not accessible.
+        """
+        body = self._json("GET", request_preview_path(self.api_profile, url_token))
+        url = body.get("url") if isinstance(body, dict) else None
+        return url if isinstance(url, str) else None
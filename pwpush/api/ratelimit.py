@@ -0,0 +1,138 @@
+"""Client-side token-bucket rate limiting shared by threads and processes.
+
+Each request takes one token from the bucket of its instance. The bucket
+refills at `rate` tokens per second up to `burst` tokens. A caller that
+finds the bucket empty reserves the next free slot and sleeps until it,
+so concurrent callers are spread out evenly instead of all retrying at
+once after a 403.
+
+The bucket state lives in a small JSON file in the app dir, guarded by an
+exclusive lock, so every pwpush process on the host shares it. Where file
+locking is unavailable (e.g. Windows) or the file cannot be opened, the
+bucket is shared by the threads of one process only.
+"""
+
+from typing import Any
+
+import json
+import os
+import threading
+import time
+
+from pwpush.utils import app_dir
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+rate_limit_file = app_dir().joinpath("ratelimit.json")
+
+# Buckets idle for longer than this are dropped from the shared file.
+_STALE_AFTER_SECONDS = 24 * 60 * 60
+
+_limiters: dict[tuple[str, float, int], "RateLimiter"] = {}
+_limiters_lock = threading.Lock()
+
+
+class RateLimiter:
+    """A token bucket for one instance.
+
+    Args:
+        key: Bucket name, normally the normalized instance URL
+        rate: Tokens added per second
+        burst: Maximum number of tokens held (requests sent back to back)
+        shared: Keep the bucket in the lock file so other processes share it
+    """
+
+    def __init__(self, key: str, rate: float, burst: int, shared: bool = True):
+        self.key = key
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.shared = shared and fcntl is not None
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.time()
+
+    def _take(self, tokens: float, updated: float, now: float) -> tuple[float, float]:
+        """Refill, take one token, and return (tokens left, seconds to wait).
+
+        Tokens may go negative: each caller reserves the slot after those
+        already reserved, and waits for it outside the lock.
+        """
+        elapsed = max(now - updated, 0.0)
+        tokens = min(float(self.burst), tokens + elapsed * self.rate) - 1
+        wait = -tokens / self.rate if tokens < 0 else 0.0
+        return tokens, wait
+
+    def _reserve_shared(self, now: float) -> float | None:
+        """Reserve a slot in the shared file, or None if it is unusable."""
+        try:
+            rate_limit_file.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(rate_limit_file, os.O_RDWR | os.O_CREAT, 0o600)
+        except OSError:
+            return None
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            with os.fdopen(os.dup(fd), "r+", encoding="utf-8") as file:
+                try:
+                    loaded: Any = json.loads(file.read() or "{}")
+                except ValueError:
+                    loaded = None
+                buckets: dict[str, Any] = loaded if isinstance(loaded, dict) else {}
+
+                bucket = buckets.get(self.key)
+                if isinstance(bucket, dict):
+                    tokens = float(bucket.get("tokens", self.burst))
+                    updated = float(bucket.get("updated", now))
+                else:
+                    tokens, updated = float(self.burst), now
+                tokens, wait = self._take(tokens, updated, now)
+
+                buckets = {
+                    key: value
+                    for key, value in buckets.items()
+                    if isinstance(value, dict)
+                    and now - float(value.get("updated", 0)) < _STALE_AFTER_SECONDS
+                }
+                buckets[self.key] = {"tokens": tokens, "updated": now}
+                file.seek(0)
+                file.truncate()
+                file.write(json.dumps(buckets))
+            return wait
+        except (OSError, TypeError, ValueError):
+            return None
+        finally:
+            os.close(fd)
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before sending."""
+        with self._lock:
+            now = time.time()
+            if self.shared:
+                wait = self._reserve_shared(now)
+                if wait is not None:
+                    return wait
+            self._tokens, wait = self._take(self._tokens, self._updated, now)
+            self._updated = now
+            return wait
+
+    def acquire(self) -> float:
+        """Wait until a request may be sent; return the seconds waited."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+def get_rate_limiter(key: str, rate: float, burst: int) -> RateLimiter | None:
+    """Return the process-wide limiter for a bucket, or None if rate <= 0."""
+    if rate <= 0:
+        return None
+    cache_key = (key, rate, max(burst, 1))
+    with _limiters_lock:
+        limiter = _limiters.get(cache_key)
+        if limiter is None:
+            limiter = RateLimiter(key, rate, burst)
+            _limiters[cache_key] = limiter
+        return limiter
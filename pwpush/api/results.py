@@ -0,0 +1,116 @@
+"""Typed results returned by the synchronous PushClient."""
+
+from typing import Any
+
+from dataclasses import dataclass, field
+
+from pwpush.utils import parse_boolean
+
+
+def _optional_int(value: Any) -> int | None:
+    """Return value as an int, or None when it is missing or not numeric."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _optional_str(value: Any) -> str | None:
+    """Return value when it is a non-empty string, otherwise None."""
+    return value if isinstance(value, str) and value else None
+
+
+@dataclass(frozen=True)
+class Push:
+    """A push as returned by the create, list or preview endpoints.
+
+    Fields the server did not send are None. `data` holds the full response
+    object for fields not modelled here.
+    """
+
+    url_token: str
+    url: str | None
+    kind: str
+    name: str | None
+    note: str | None
+    expire_after_days: int | None
+    expire_after_views: int | None
+    days_remaining: int | None
+    views_remaining: int | None
+    expired: bool
+    created_at: str | None
+    data: dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+
+    @classmethod
+    def from_json(
+        cls, body: dict[str, Any], *, url: str | None = None, kind: str = "text"
+    ) -> "Push":
+        """Build a Push from an API response object."""
+        return cls(
+            url_token=str(body.get("url_token", "")),
+            url=url or _optional_str(body.get("url")),
+            kind=_optional_str(body.get("kind")) or kind,
+            name=_optional_str(body.get("name")),
+            note=_optional_str(body.get("note")),
+            expire_after_days=_optional_int(body.get("expire_after_days")),
+            expire_after_views=_optional_int(body.get("expire_after_views")),
+            days_remaining=_optional_int(body.get("days_remaining")),
+            views_remaining=_optional_int(body.get("views_remaining")),
+            expired=parse_boolean(body.get("expired", False)),
+            created_at=_optional_str(body.get("created_at")),
+            data=body,
+        )
+
+
+@dataclass(frozen=True)
+class SecretRequest:
+    """A request for someone to send a secret (Pro instances)."""
+
+    url_token: str
+    url: str | None
+    name: str | None
+    note: str | None
+    data: dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+
+    @classmethod
+    def from_json(
+        cls, body: dict[str, Any], *, url: str | None = None
+    ) -> "SecretRequest":
+        """Build a SecretRequest from an API response object."""
+        return cls(
+            url_token=str(body.get("url_token", "")),
+            url=url or _optional_str(body.get("url")),
+            name=_optional_str(body.get("name")),
+            note=_optional_str(body.get("note")),
+            data=body,
+        )
+
+
+@dataclass(frozen=True)
+class AuditEvent:
+    """One entry of a push's audit log.
+
+    `created_at` is formatted for display; `timestamp` is ISO-8601 UTC and
+    sorts chronologically.
+    """
+
+    kind: str
+    ip: str
+    user_agent: str
+    referrer: str
+    successful: bool
+    created_at: str
+    timestamp: str
+
+    @classmethod
+    def from_row(cls, row: dict[str, str]) -> "AuditEvent":
+        """Build an AuditEvent from a normalize_audit_events() row."""
+        return cls(
+            kind=row["kind"],
+            ip=row["ip"],
+            user_agent=row["user_agent"],
+            referrer=row["referrer"],
+            successful=parse_boolean(row["successful"]),
+            created_at=row["created_at"],
+            timestamp=row["timestamp"],
+        )
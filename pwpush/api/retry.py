@@ -0,0 +1,185 @@
+"""Retry policy for requests to a Password Pusher instance.
+
+A RetryPolicy decides which failed attempts are sent again and how long to
+wait first. Rate-limit responses (a 403 rate-limit error or a 429) are
+retried for every method, since the server did not act on them. Other
+retryable statuses (502, 503, 504 by default) and connection resets are
+only retried for idempotent methods unless the policy allows all methods.
+
+Waits follow the server's Retry-After header (seconds or an HTTP date)
+when present, otherwise exponential backoff with decorrelated jitter.
+A RetryBudget caps the retries of a whole operation, such as a batch, and
+the policy's deadline caps the time spent on any one request.
+"""
+
+from typing import Any
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+
+# Retry handling defaults
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BASE_DELAY = 1.0  # seconds
+MAX_BACKOFF_DELAY = 30.0  # maximum seconds to wait between retries
+DEFAULT_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+JITTER_MODES = ("decorrelated", "full")
+RETRY_METHOD_MODES = ("idempotent", "all")
+
+
+def retry_after_seconds(response: Any) -> float | None:
+    """Return the wait a Retry-After header asks for, or None without one.
+
+    Both forms are accepted: a number of seconds and an HTTP date. Dates in
+    the past give 0.
+    """
+    headers = getattr(response, "headers", None)
+    value = headers.get("retry-after") if headers is not None else None
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+        if retry_at.tzinfo is None:
+            return None
+        seconds = retry_at.timestamp() - time.time()
+    if seconds != seconds or seconds == float("inf"):
+        return None
+    return max(seconds, 0.0)
+
+
+def parse_retry_statuses(value: str) -> frozenset[int]:
+    """Parse a comma-separated list of HTTP status codes.
+
+    Raises:
+        ValueError: If an entry is not a status code between 400 and 599.
+    """
+    statuses = set()
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        status = int(part)
+        if not 400 <= status <= 599:
+            raise ValueError(f"{status} is not an HTTP error status")
+        statuses.add(status)
+    return frozenset(statuses)
+
+
+class RetryBudget:
+    """A number of retries shared by every request of one operation.
+
+    Args:
+        total: Retries allowed in all (0 allows none)
+    """
+
+    def __init__(self, total: int):
+        self.total = max(total, 0)
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        """Use one retry from the budget; return False when it is spent."""
+        with self._lock:
+            if self.used >= self.total:
+                return False
+            self.used += 1
+            return True
+
+    @property
+    def remaining(self) -> int:
+        """Retries left in the budget."""
+        return self.total - self.used
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how failed requests are retried.
+
+    Attributes:
+        max_retries: Retries per request
+        statuses: Response statuses to retry (rate-limited 403s always are)
+        idempotent_only: Retry other statuses and connection resets only
+            for idempotent methods such as GET and DELETE
+        deadline: Seconds after a request's first attempt beyond which it is
+            not retried (0 for no deadline)
+        budget: Retries shared with other requests, if limited
+        base_delay: Smallest backoff delay in seconds
+        max_delay: Largest backoff delay in seconds; without a deadline a
+            longer Retry-After is shortened to it
+        jitter: "decorrelated" or "full" backoff jitter
+    """
+
+    max_retries: int = DEFAULT_MAX_RETRIES
+    statuses: frozenset[int] = DEFAULT_RETRY_STATUSES
+    idempotent_only: bool = True
+    deadline: float = 0
+    budget: RetryBudget | None = field(default=None, compare=False)
+    base_delay: float = DEFAULT_BASE_DELAY
+    max_delay: float = MAX_BACKOFF_DELAY
+    jitter: str = "decorrelated"
+
+    def allows_method(self, method: str) -> bool:
+        """Whether transient failures of this method may be retried."""
+        return not self.idempotent_only or method.upper() in IDEMPOTENT_METHODS
+
+    def retries_response(self, method: str, response: Any, rate_limited: bool) -> bool:
+        """Whether this response is worth retrying at all."""
+        if rate_limited:
+            return True
+        status_code = getattr(response, "status_code", None)
+        if status_code not in self.statuses:
+            return False
+        return status_code == 429 or self.allows_method(method)
+
+    def backoff(self, attempt: int, previous: float) -> float:
+        """Return the delay before retry number attempt + 1.
+
+        Args:
+            attempt: Retries made so far for this request
+            previous: The previous delay (0 before the first retry)
+        """
+        if self.jitter == "full":
+            delay = self.base_delay * (2**attempt) * random.random()
+        else:
+            delay = random.uniform(self.base_delay, max(previous * 3, self.base_delay))
+        return float(min(max(delay, self.base_delay), self.max_delay))
+
+    def next_delay(
+        self, response: Any, attempt: int, previous: float, elapsed: float
+    ) -> float | None:
+        """Return how long to wait before retrying, or None to stop.
+
+        Args:
+            response: The failed response, or None after a connection reset
+            attempt: Retries made so far for this request
+            previous: The previous delay (0 before the first retry)
+            elapsed: Seconds since the request's first attempt
+
+        A Retry-After is honoured in full when a deadline bounds the wait,
+        and capped at max_delay otherwise. The budget is only charged when a
+        retry is granted.
+        """
+        if attempt >= self.max_retries:
+            return None
+        retry_after = retry_after_seconds(response) if response is not None else None
+        if retry_after is not None:
+            delay = (
+                retry_after if self.deadline > 0 else min(retry_after, self.max_delay)
+            )
+        else:
+            delay = self.backoff(attempt, previous)
+        if self.deadline > 0 and elapsed + delay > self.deadline:
+            return None
+        if self.budget is not None and not self.budget.take():
+            return None
+        return delay
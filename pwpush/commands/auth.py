@@ -48,9 +48,15 @@ def _make_request(
 
 
 def login_cmd(
-    url: str = typer.Option(user_config["instance"]["url"], prompt=True),
-    email: str = typer.Option(user_config["instance"]["email"], prompt=True),
-    token: str = typer.Option(user_config["instance"]["token"], prompt=True),
+    url: str = typer.Option(
+        default_factory=lambda: user_config["instance"]["url"], prompt=True
+    ),
+    email: str = typer.Option(
+        default_factory=lambda: user_config["instance"]["email"], prompt=True
+    ),
+    token: str = typer.Option(
+        default_factory=lambda: user_config["instance"]["token"], prompt=True
+    ),
 ) -> None:
     """
     Login to the registered Password Pusher instance.
@@ -0,0 +1,287 @@
+"""Batch commands for pwpush CLI (creating many pushes in one invocation)."""
+
+from typing import Any, Iterator, TextIO
+
+import csv
+import json as json_module
+import sys
+
+import typer
+
+from pwpush.api.endpoints import adapt_text_payload_for_profile, push_create_path
+from pwpush.api.errors import PwpushError, response_error
+from pwpush.commands.config import user_config
+from pwpush.commands.push import build_push_payload, resolve_share_body
+from pwpush.ledger import record_push
+from pwpush.utils import parse_boolean
+
+HELP_TEXT = """Create many pushes from JSONL or CSV records.
+
+Each record may set: secret (required), kind, name, note, days, views,
+passphrase, deletable and retrieval_step. Other fields are ignored, and unset
+options fall back to your configured expiration defaults. One JSON result
+line is printed per record as soon as it completes; each line carries the
+record's zero-based index.
+
+[dim]Examples:[/]
+[code]
+pwpush push-batch secrets.jsonl                  # One JSON object per line
+pwpush push-batch users.csv --concurrency 8      # CSV with a header row
+cat secrets.jsonl | pwpush push-batch            # Read records from stdin
+generate-secrets | pwpush push-batch --format csv
+[/code]"""
+
+VALID_KINDS = ("text", "url", "qr")
+
+
+def _current_api_profile() -> str:
+    """Get the current API profile."""
+    from pwpush.__main__ import current_api_profile
+
+    return current_api_profile()
+
+
+def _map_requests(func, items, concurrency=None):
+    """Run request-making calls concurrently, fixed or adaptive."""
+    from pwpush.__main__ import map_requests
+
+    return map_requests(func, items, concurrency)
+
+
+def _request_with_profile_fallback(
+    method, api_profile, build_request, *, on_rate_limit_retry=None, raise_errors=False
+):
+    """Send a profile-dependent request with speculative v2 fallback."""
+    from pwpush.__main__ import request_with_profile_fallback
+
+    return request_with_profile_fallback(
+        method,
+        api_profile,
+        build_request,
+        on_rate_limit_retry=on_rate_limit_retry,
+        raise_errors=raise_errors,
+    )
+
+
+def _update_cli_options(
+    json: bool = False,
+    verbose: bool = False,
+    pretty: bool = False,
+    debug: bool = False,
+) -> None:
+    """Update CLI options from command-line flags."""
+    from pwpush.__main__ import update_cli_options
+
+    update_cli_options(json=json, verbose=verbose, pretty=pretty, debug=debug)
+
+
+def _error_json(message: str, status_code: int | None = None) -> None:
+    """Print an error message in JSON format."""
+    from pwpush.__main__ import error_json
+
+    error_json(message, status_code)
+
+
+def read_batch_records(
+    stream: TextIO, input_format: str
+) -> Iterator[tuple[int, dict[str, Any] | str]]:
+    """Yield (index, record) pairs from a JSONL or CSV stream.
+
+    Records are read lazily. A line that cannot be parsed yields an error
+    message string in place of the record so it can be reported in order.
+    """
+    if input_format == "csv":
+        for index, row in enumerate(csv.DictReader(stream)):
+            yield index, {key: value for key, value in row.items() if key}
+        return
+
+    index = 0
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            record = json_module.loads(line)
+        except ValueError as e:
+            yield index, f"Invalid JSON: {e}"
+        else:
+            if isinstance(record, dict):
+                yield index, record
+            else:
+                yield index, "Each JSONL line must be a JSON object."
+        index += 1
+
+
+def _optional_int(record: dict[str, Any], key: str) -> int | None:
+    value = record.get(key)
+    if value is None or value == "":
+        return None
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            pass
+    raise ValueError(f"Invalid {key} '{value}'. Must be a whole number.")
+
+
+def _optional_bool(record: dict[str, Any], key: str) -> bool | None:
+    value = record.get(key)
+    if value is None or value == "":
+        return None
+    return parse_boolean(value)
+
+
+def _optional_str(record: dict[str, Any], key: str) -> str | None:
+    value = record.get(key)
+    if value is None or value == "":
+        return None
+    return str(value)
+
+
+def build_batch_payload(record: dict[str, Any]) -> tuple[dict[str, Any], str]:
+    """Validate a batch record and build its push payload.
+
+    Returns:
+        The legacy-shaped payload and the push kind.
+
+    Raises:
+        ValueError: If the record is missing a secret or has invalid values.
+    """
+    secret = record.get("secret")
+    if secret is None or secret == "":
+        raise ValueError("Record is missing a secret.")
+
+    kind = _optional_str(record, "kind") or "text"
+    if kind not in VALID_KINDS:
+        raise ValueError(
+            f"Invalid kind '{kind}'. Must be one of: {', '.join(VALID_KINDS)}"
+        )
+
+    payload = build_push_payload(
+        str(secret),
+        kind=kind,
+        days=_optional_int(record, "days"),
+        views=_optional_int(record, "views"),
+        deletable=_optional_bool(record, "deletable"),
+        retrieval_step=_optional_bool(record, "retrieval_step"),
+        note=_optional_str(record, "note"),
+        name=_optional_str(record, "name"),
+        passphrase=_optional_str(record, "passphrase"),
+    )
+    return payload, kind
+
+
+def _create_batch_push(
+    item: tuple[int, dict[str, Any] | str], api_profile: str
+) -> dict[str, Any]:
+    """Create one push and return its JSON result line."""
+    index, record = item
+    if isinstance(record, str):
+        return {"index": index, "error": record}
+
+    try:
+        data, kind = build_batch_payload(record)
+    except ValueError as e:
+        return {"index": index, "error": str(e)}
+
+    def build_create_request(profile: str) -> tuple[str, dict[str, Any], None]:
+        return (
+            push_create_path(profile, kind),
+            adapt_text_payload_for_profile(data, profile),
+            None,
+        )
+
+    try:
+        response, profile = _request_with_profile_fallback(
+            "POST", api_profile, build_create_request, raise_errors=True
+        )
+        if response.status_code != 201:
+            error = response_error(response)
+            return {
+                "index": index,
+                "error": error.message,
+                "status_code": error.status_code,
+            }
+
+        try:
+            created = response.json()
+        except ValueError:
+            created = None
+        if not isinstance(created, dict):
+            return {
+                "index": index,
+                "error": "Unreadable response from server.",
+                "status_code": response.status_code,
+            }
+        record_push(created, data["password"], kind)
+    except PwpushError as e:
+        return {"index": index, "error": str(e)}
+
+    result: dict[str, Any] = {"index": index, "url_token": created.get("url_token")}
+    try:
+        body = resolve_share_body(profile, created, kind, None, raise_errors=True)
+    except PwpushError as e:
+        return {**result, "error": str(e)}
+    except ValueError:
+        return {**result, "error": "Unreadable preview response from server."}
+
+    if isinstance(body, dict) and "url" in body:
+        result["url"] = body["url"]
+    if record.get("name"):
+        result["name"] = record["name"]
+    return result
+
+
+def push_batch_cmd(
+    source: str = "-",
+    input_format: str = "auto",
+    concurrency: int | None = None,
+    debug: bool = False,
+) -> None:
+    """Create many pushes concurrently from JSONL or CSV records."""
+    _update_cli_options(json=True, debug=debug)
+
+    if input_format == "auto":
+        input_format = "csv" if source.lower().endswith(".csv") else "jsonl"
+    if input_format not in ("jsonl", "csv"):
+        _error_json(f"Invalid format '{input_format}'. Must be one of: jsonl, csv")
+        raise typer.Exit(1)
+
+    if concurrency is not None and concurrency < 1:
+        _error_json("--concurrency must be at least 1.")
+        raise typer.Exit(1)
+
+    stream: TextIO
+    try:
+        if source == "-":
+            stream = sys.stdin
+        else:
+            stream = open(source, encoding="utf-8", newline="")
+    except FileNotFoundError:
+        _error_json(f"Input file '{source}' not found.")
+        raise typer.Exit(1)
+    except PermissionError:
+        _error_json(f"Permission denied accessing input file '{source}'.")
+        raise typer.Exit(1)
+
+    api_profile = _current_api_profile()
+
+    failures = 0
+    try:
+        for _, result in _map_requests(
+            lambda item: _create_batch_push(item, api_profile),
+            read_batch_records(stream, input_format),
+            concurrency,
+        ):
+            if "error" in result:
+                failures += 1
+            print(json_module.dumps(result), flush=True)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+    if failures:
+        raise typer.Exit(1)
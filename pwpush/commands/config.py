@@ -161,7 +161,17 @@ def _show_config(use_json: bool = False) -> None:
         table.add_row(
             "api_profile_ttl_seconds",
             user_config["instance"]["api_profile_ttl_seconds"],
-            "How long to trust cached API profile before probing again.",
+            "How long to trust cached API profile and capabilities before probing again.",
+        )
+        table.add_row(
+            "api_profile_background_refresh",
+            user_config["instance"]["api_profile_background_refresh"],
+            "Keep using an expired API profile while it refreshes in the background.",
+        )
+        table.add_row(
+            "api_profile_speculative",
+            user_config["instance"]["api_profile_speculative"],
+            "Skip the profile probe and try API v2 first, falling back on 404.",
         )
         console.print(table)
 
@@ -239,6 +249,78 @@ def _show_config(use_json: bool = False) -> None:
             "true/false",
             "More verbosity when appropriate.",
         )
+        table.add_row(
+            "pool_size",
+            user_config["cli"]["pool_size"],
+            "1-100",
+            "Keep-alive connections reused per instance.",
+        )
+        table.add_row(
+            "skip_preview",
+            user_config["cli"]["skip_preview"],
+            "true/false",
+            "Build share URLs from the create response instead of a preview request.",
+        )
+        table.add_row(
+            "ledger",
+            user_config["cli"]["ledger"],
+            "true/false",
+            "Record created pushes locally so they can be found by name or note.",
+        )
+        table.add_row(
+            "rate_limit",
+            user_config["cli"]["rate_limit"],
+            "0 or more",
+            "Requests per second to the instance, shared by all pwpush processes (0 = off).",
+        )
+        table.add_row(
+            "rate_burst",
+            user_config["cli"]["rate_burst"],
+            "1 or more",
+            "Requests sent back to back before rate_limit pacing applies.",
+        )
+        table.add_row(
+            "max_concurrency",
+            user_config["cli"]["max_concurrency"],
+            "1 or more",
+            "Most requests in flight when --concurrency is not given (the level adapts to rate limits).",
+        )
+        table.add_row(
+            "max_retries",
+            user_config["cli"]["max_retries"],
+            "0 or more",
+            "Retries per request for rate limits, retry_statuses and connection resets.",
+        )
+        table.add_row(
+            "retry_statuses",
+            user_config["cli"]["retry_statuses"],
+            "status codes",
+            "Comma-separated HTTP statuses to retry (rate-limited 403s always are).",
+        )
+        table.add_row(
+            "retry_methods",
+            user_config["cli"]["retry_methods"],
+            "idempotent/all",
+            "Retry server errors and resets for GET/DELETE only, or for pushes (POST) too.",
+        )
+        table.add_row(
+            "retry_budget",
+            user_config["cli"]["retry_budget"],
+            "0 or more",
+            "Most retries for a whole command, e.g. a batch (0 = no limit).",
+        )
+        table.add_row(
+            "retry_deadline",
+            user_config["cli"]["retry_deadline"],
+            "0 or more",
+            "Seconds after which a request is no longer retried (0 = no deadline).",
+        )
+        table.add_row(
+            "retry_jitter",
+            user_config["cli"]["retry_jitter"],
+            "decorrelated/full",
+            "Backoff jitter used when the server sends no Retry-After.",
+        )
         console.print(table)
 
         rprint()
@@ -0,0 +1,69 @@
+"""Generate command for pwpush CLI (bulk secret generation without pushing)."""
+
+import os
+import sys
+
+import typer
+
+from pwpush.utils import SECRET_CHARACTER_CLASSES, generate_secrets
+
+HELP_TEXT = """Generate secure random secrets locally, one per line.
+
+Every secret contains at least one lowercase letter, uppercase letter, digit
+and punctuation character, and is drawn uniformly from all such strings.
+Nothing is sent to the server. Output is written as it is generated, so large
+counts can be piped straight into other tools.
+
+[dim]Examples:[/]
+[code]
+pwpush generate                                  # One 50-character secret
+pwpush generate --count 10000 --length 24        # Many secrets, one per line
+pwpush generate -n 5000 -l 32 > passwords.txt    # Stream to a file
+[/code]"""
+
+# Lines buffered before each write to stdout.
+WRITE_BATCH = 256
+
+
+def _error_json(message: str, status_code: int | None = None) -> None:
+    """Print an error message in JSON format."""
+    from pwpush.__main__ import error_json
+
+    error_json(message, status_code)
+
+
+def generate_cmd(count: int = 1, length: int = 50) -> None:
+    """Generate secure random secrets and stream them to stdout."""
+    if count < 1:
+        _error_json("--count must be at least 1.")
+        raise typer.Exit(1)
+
+    if length < len(SECRET_CHARACTER_CLASSES):
+        _error_json(
+            f"--length must be at least {len(SECRET_CHARACTER_CLASSES)} "
+            "to include every character class."
+        )
+        raise typer.Exit(1)
+
+    lines: list[str] = []
+    try:
+        for secret in generate_secrets(count, length):
+            lines.append(secret)
+            if len(lines) >= WRITE_BATCH:
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
+                lines.clear()
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`); stop quietly. Point a real
+        # stdout at devnull so the flush at exit does not fail again; under
+        # `serve` stdout is a stream to the client with no descriptor.
+        try:
+            stdout_fd = sys.stdout.fileno()
+        except (OSError, ValueError):
+            raise typer.Exit(0)
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, stdout_fd)
+        raise typer.Exit(0)
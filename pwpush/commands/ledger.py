@@ -0,0 +1,300 @@
+"""Ledger commands for pwpush CLI (query the local record of created pushes)."""
+
+from typing import Any
+
+import json as json_module
+
+import typer
+from rich import print as rprint
+from rich.console import Console
+from rich.table import Table
+
+from pwpush.ledger import (
+    apply_server_pushes,
+    clear_ledger,
+    expire_missing_pushes,
+    find_pushes,
+    get_sync_state,
+    ledger_enabled,
+    ledger_file,
+    save_sync_state,
+)
+from pwpush.options import cli_options, user_config
+from pwpush.utils import format_timestamp
+
+app = typer.Typer(
+    rich_markup_mode="rich",
+    context_settings=dict(help_option_names=["-h", "--help"]),
+)
+
+console = Console()
+
+
+def _error_json(message: str, status_code: int | None = None) -> None:
+    """Print an error message in JSON format."""
+    from pwpush.__main__ import error_json
+
+    error_json(message, status_code)
+
+
+def _json_output() -> bool:
+    """Check if JSON output is enabled."""
+    from pwpush.__main__ import json_output
+
+    return json_output()
+
+
+def _pretty_output() -> bool:
+    """Check if pretty output is enabled."""
+    from pwpush.__main__ import pretty_output
+
+    return pretty_output()
+
+
+def _require_api_token(operation: str) -> None:
+    """Require an API token for the given operation."""
+    from pwpush.__main__ import require_api_token
+
+    require_api_token(operation)
+
+
+def _require_ledger() -> None:
+    """Exit with an error unless the local ledger is enabled."""
+    if not ledger_enabled():
+        _error_json(
+            "The local ledger is disabled. Enable it with "
+            "'pwpush config set ledger true'."
+        )
+        raise typer.Exit(1)
+
+
+def _display_time(value: str | None) -> str:
+    """Format a ledger timestamp for the table, tolerating odd values."""
+    if not value:
+        return ""
+    try:
+        return format_timestamp(value)
+    except ValueError:
+        return value
+
+
+@app.command()
+def find(
+    query: str | None = typer.Argument(
+        None, help="Match pushes whose name or note starts with this text."
+    ),
+    name: str | None = typer.Option(
+        None, "--name", help="Match pushes whose name starts with this text."
+    ),
+    note: str | None = typer.Option(
+        None, "--note", help="Match pushes whose note starts with this text."
+    ),
+    include_expired: bool = typer.Option(
+        False, "--all", "-a", help="Include pushes expired through this CLI."
+    ),
+    limit: int = typer.Option(
+        50, "--limit", "-n", help="Show at most this many pushes."
+    ),
+    json: bool = typer.Option(
+        False, "--json", "-j", help="Output results in JSON format."
+    ),
+) -> None:
+    """
+    Find pushes recorded in the local ledger, newest first.
+
+    Matching is case-insensitive and needs no request to the server. Enable
+    recording with 'pwpush config set ledger true'.
+    """
+    if json:
+        cli_options["json"] = True
+
+    _require_ledger()
+
+    if limit < 1:
+        _error_json("--limit must be at least 1.")
+        raise typer.Exit(1)
+
+    import sqlite3
+
+    try:
+        pushes = find_pushes(
+            query,
+            name=name,
+            note=note,
+            include_expired=include_expired,
+            limit=limit,
+        )
+    except (OSError, sqlite3.Error) as e:
+        _error_json(f"Could not read the local ledger: {e}")
+        raise typer.Exit(1)
+
+    if _json_output():
+        dumps_kwargs: dict[str, Any] = {}
+        if _pretty_output():
+            dumps_kwargs["indent"] = 2
+            dumps_kwargs["sort_keys"] = True
+        print(json_module.dumps(pushes, **dumps_kwargs))
+        return
+
+    if not pushes:
+        rprint("No matching pushes in the local ledger.")
+        return
+
+    table = Table("Secret URL Token", "Name", "Note", "Kind", "Created", "Expired")
+    for push in pushes:
+        table.add_row(
+            push["url_token"],
+            push["name"] or "",
+            push["note"] or "",
+            push["kind"] or "",
+            _display_time(push["created_at"]),
+            _display_time(push["expired_at"]),
+        )
+    console.print(table)
+
+
+def _header(response: Any, name: str) -> str | None:
+    """Return a response header if the server sent one."""
+    value = response.headers.get(name)
+    return value if isinstance(value, str) else None
+
+
+def _sync_list(expired: bool, started_at: str) -> dict[str, Any]:
+    """Reconcile one server list with the ledger and report what changed.
+
+    The stored ETag/Last-Modified describe page 1 only. The expired list is
+    newest first, so an unchanged first page means nothing new expired and
+    walking it stops at the first page that brings nothing new; pushes that
+    left the active list are marked expired by the active pass either way.
+    For the active list, where views can change on any page, validators are
+    only sent when the previous sync saw a single page.
+    """
+    from pwpush.commands.manage import iter_push_pages
+
+    list_name = "expired" if expired else "active"
+    state = get_sync_state(list_name)
+    headers: dict[str, str] = {}
+    if state is not None and (expired or state["pages"] == 1):
+        if state["etag"]:
+            headers["If-None-Match"] = state["etag"]
+        if state["last_modified"]:
+            headers["If-Modified-Since"] = state["last_modified"]
+
+    summary: dict[str, Any] = {
+        "list": list_name,
+        "not_modified": False,
+        "pages": 0,
+        "added": 0,
+        "changed": 0,
+        "expired": 0,
+    }
+    seen_tokens: set[str] = set()
+    validators: tuple[str | None, str | None] = (None, None)
+
+    for response, pushes in iter_push_pages(expired, headers or None):
+        if response.status_code == 304:
+            summary["not_modified"] = True
+            return summary
+        if summary["pages"] == 0:
+            validators = (_header(response, "ETag"), _header(response, "Last-Modified"))
+        summary["pages"] += 1
+
+        counts = apply_server_pushes(pushes, expired=expired, synced_at=started_at)
+        for key, count in counts.items():
+            summary[key] += count
+        seen_tokens.update(
+            push["url_token"]
+            for push in pushes
+            if isinstance(push, dict) and isinstance(push.get("url_token"), str)
+        )
+        if expired and not any(counts.values()):
+            break
+    else:
+        if not expired:
+            summary["expired"] += expire_missing_pushes(
+                seen_tokens, started_at=started_at
+            )
+
+    etag, last_modified = validators
+    save_sync_state(
+        list_name,
+        etag=etag,
+        last_modified=last_modified,
+        pages=summary["pages"],
+        synced_at=started_at,
+    )
+    return summary
+
+
+@app.command()
+def sync(
+    json: bool = typer.Option(
+        False, "--json", "-j", help="Output results in JSON format."
+    ),
+) -> None:
+    """
+    Reconcile the ledger with the server's active and expired push lists.
+
+    Records views consumed and pushes that expired on the server, and adds
+    pushes created elsewhere. Later runs send conditional requests, so an
+    unchanged list costs a single 304 response.
+    """
+    if json:
+        cli_options["json"] = True
+
+    _require_ledger()
+    _require_api_token("ledger sync")
+
+    if user_config["instance"]["email"] == "Not Set":
+        _error_json("You must log into an instance first.")
+        raise typer.Exit(1)
+
+    import sqlite3
+    from datetime import datetime, timezone
+
+    started_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    try:
+        summaries = [_sync_list(expired, started_at) for expired in (False, True)]
+    except (OSError, sqlite3.Error) as e:
+        _error_json(f"Could not update the local ledger: {e}")
+        raise typer.Exit(1)
+
+    if _json_output():
+        dumps_kwargs: dict[str, Any] = {}
+        if _pretty_output():
+            dumps_kwargs["indent"] = 2
+            dumps_kwargs["sort_keys"] = True
+        print(json_module.dumps(summaries, **dumps_kwargs))
+        return
+
+    table = Table("List", "Pages", "Added", "Changed", "Expired")
+    for summary in summaries:
+        if summary["not_modified"]:
+            table.add_row(summary["list"], "not modified", "", "", "")
+            continue
+        table.add_row(
+            summary["list"],
+            str(summary["pages"]),
+            str(summary["added"]),
+            str(summary["changed"]),
+            str(summary["expired"]),
+        )
+    console.print(table)
+
+
+@app.command()
+def clear(
+    yes: bool = typer.Option(
+        False, "--yes", "-y", help="Delete without asking for confirmation."
+    ),
+) -> None:
+    """
+    Delete the local ledger. Pushes on the server are not affected.
+    """
+    if not yes:
+        typer.confirm(f"Delete the local ledger at '{ledger_file}'?", abort=True)
+
+    if clear_ledger():
+        rprint(f"Deleted local ledger: {ledger_file}")
+    else:
+        rprint(f"No local ledger found at: {ledger_file}")
@@ -1,22 +1,51 @@
-"""Push management commands for pwpush CLI (expire, audit, list)."""
+"""Push management commands for pwpush CLI (expire, sweep, audit, list)."""
 
-from typing import Any
+from typing import Any, Iterable, Iterator, TextIO
 
+import heapq
+import itertools
 import json as json_module
+import re
+import sys
+from datetime import datetime, timedelta, timezone
 
 import typer
-from dateutil import parser
 from rich import print as rprint
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 
-from pwpush.api.endpoints import push_audit_path, push_expire_path, validation_paths
+from pwpush.api.endpoints import iter_push_pages as walk_push_pages
+from pwpush.api.endpoints import push_audit_path, push_expire_path
+from pwpush.api.errors import PwpushAPIError, PwpushError
 from pwpush.commands.config import user_config
+from pwpush.ledger import mark_expired, resolve_name
 from pwpush.options import cli_options
-from pwpush.utils import parse_boolean
+from pwpush.utils import (
+    format_timestamp,
+    parse_boolean,
+    parse_timestamp,
+)
 
 console = Console()
 
+SWEEP_HELP_TEXT = """Expire every active push matching the given filters.
+
+The active push list is fetched once and filtered locally; all filters must
+match. Matches are expired concurrently and one JSON result line is printed
+per push. Use --dry-run to preview the matches without expiring anything.
+
+[dim]Examples:[/]
+[code]
+pwpush sweep --older-than 30d --dry-run          # Preview old pushes
+pwpush sweep --older-than 12h --kind file --yes  # Expire day-old file pushes
+pwpush sweep --match "(?i)contractor" -c 8       # Name or note matches a regex
+pwpush sweep --max-views-remaining 1 --yes       # Nearly used-up pushes
+[/code]"""
+
+PUSH_KINDS = ("text", "file", "url", "qr")
+AGE_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
 
 def _json_output() -> bool:
     """Check if JSON output is enabled."""
@@ -37,6 +66,13 @@ def _current_api_profile() -> str:
     return current_api_profile()
 
 
+def _map_requests(func, items, concurrency=None):
+    """Run request-making calls concurrently, fixed or adaptive."""
+    from pwpush.__main__ import map_requests
+
+    return map_requests(func, items, concurrency)
+
+
 def _require_api_token(operation: str) -> None:
     """Require a configured API token before authenticated operations."""
     from pwpush.__main__ import require_api_token
@@ -54,6 +90,7 @@ def _make_request(
     email=None,
     token=None,
     timeout=None,
+    headers=None,
 ):
     """Make an API request with the given parameters."""
     from pwpush.__main__ import make_request
@@ -67,6 +104,22 @@ def _make_request(
         email=email,
         token=token,
         timeout=timeout,
+        headers=headers,
+    )
+
+
+def _request_with_profile_fallback(
+    method, api_profile, build_request, *, on_rate_limit_retry=None, raise_errors=False
+):
+    """Send a profile-dependent request with speculative v2 fallback."""
+    from pwpush.__main__ import request_with_profile_fallback
+
+    return request_with_profile_fallback(
+        method,
+        api_profile,
+        build_request,
+        on_rate_limit_retry=on_rate_limit_retry,
+        raise_errors=raise_errors,
     )
 
 
@@ -89,11 +142,156 @@ def _error_json(message: str, status_code: int | None = None) -> None:
     error_json(message, status_code)
 
 
+def _response_error_message(response: Any) -> str:
+    """Extract the error message from an API error response."""
+    # Safely parse error response
+    error_message = response.text
+    try:
+        error_body = response.json()
+        if isinstance(error_body, dict):
+            error_message = error_body.get("error", response.text)
+    except (json_module.JSONDecodeError, ValueError):
+        pass
+    return str(error_message)
+
+
+def _tokens_from_json(value: Any) -> Iterator[str]:
+    """Yield url_tokens from a parsed JSON value (push, token or list of them)."""
+    if isinstance(value, list):
+        for item in value:
+            yield from _tokens_from_json(item)
+    elif isinstance(value, dict):
+        token = value.get("url_token")
+        if isinstance(token, str) and token:
+            yield token
+    elif isinstance(value, str) and value:
+        yield value
+
+
+def read_url_tokens(stream: TextIO) -> Iterator[str]:
+    """Yield url_tokens read from a stream.
+
+    Accepts one token per line (blank lines and # comments are skipped),
+    JSON lines holding push objects, or a JSON array such as the output of
+    `pwpush list --json`. Line-oriented input is read lazily.
+    """
+    for line in stream:
+        text = line.strip()
+        if not text or text.startswith("#"):
+            continue
+        if text.startswith("["):
+            # A (possibly pretty-printed) JSON array: parse the whole document.
+            yield from _tokens_from_json(json_module.loads(line + stream.read()))
+            return
+        if text.startswith("{"):
+            yield from _tokens_from_json(json_module.loads(text))
+        else:
+            yield text
+
+
+def _unique(tokens: Iterable[str]) -> Iterator[str]:
+    """Yield tokens in order, skipping repeats."""
+    seen: set[str] = set()
+    for token in tokens:
+        if token not in seen:
+            seen.add(token)
+            yield token
+
+
+def _expire_one(url_token: str, api_profile: str) -> dict[str, Any]:
+    """Expire one push and return its JSON result line."""
+    try:
+        response, _ = _request_with_profile_fallback(
+            "DELETE",
+            api_profile,
+            lambda profile: (push_expire_path(profile, url_token), None, None),
+            raise_errors=True,
+        )
+    except PwpushError as e:
+        return {"url_token": url_token, "error": str(e)}
+
+    if response.status_code == 200:
+        mark_expired(url_token)
+        return {"url_token": url_token, "expired": True}
+    return {
+        "url_token": url_token,
+        "error": _response_error_message(response),
+        "status_code": response.status_code,
+    }
+
+
+def expire_many(tokens: Iterable[str], concurrency: int | None = None) -> int:
+    """Expire pushes concurrently, printing one JSON result line per token.
+
+    Tokens are consumed lazily and de-duplicated. All DELETE calls share the
+    instance's keep-alive pool, which is grown to fit the worker count.
+    Without a concurrency, the number in flight adapts to rate limits.
+
+    Returns:
+        The number of tokens that could not be expired.
+    """
+    api_profile = _current_api_profile()
+
+    failures = 0
+    for _, result in _map_requests(
+        lambda token: _expire_one(token, api_profile), _unique(tokens), concurrency
+    ):
+        if "error" in result:
+            failures += 1
+        print(json_module.dumps(result), flush=True)
+    return failures
+
+
+def _open_token_source(source: str) -> TextIO:
+    """Open a token file, or stdin for '-'."""
+    if source == "-":
+        return sys.stdin
+    try:
+        return open(source, encoding="utf-8")
+    except FileNotFoundError:
+        _error_json(f"Token file '{source}' not found.")
+        raise typer.Exit(1)
+    except PermissionError:
+        _error_json(f"Permission denied accessing token file '{source}'.")
+        raise typer.Exit(1)
+
+
+def _bulk_tokens(url_tokens: list[str], source: str | None) -> Iterator[str]:
+    """Yield tokens from arguments, then from the source file or stdin."""
+    for token in url_tokens:
+        if token == "-":
+            yield from read_url_tokens(sys.stdin)
+        else:
+            yield token
+    if source is not None:
+        stream = _open_token_source(source)
+        try:
+            yield from read_url_tokens(stream)
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+
+def _resolve_names(names: list[str]) -> list[str]:
+    """Turn push names into url_tokens using the local ledger."""
+    tokens = []
+    for name in names:
+        try:
+            tokens.append(resolve_name(name))
+        except ValueError as e:
+            _error_json(str(e))
+            raise typer.Exit(1)
+    return tokens
+
+
 def expire_cmd(
     ctx: typer.Context,
-    url_token: str = typer.Argument(
-        "", help="The secret URL token of the push to be expired."
+    url_tokens: list[str] | None = typer.Argument(
+        None, help="The secret URL token of the push to be expired."
     ),
+    source: str | None = None,
+    concurrency: int | None = None,
+    names: list[str] | None = None,
     json: bool = typer.Option(
         False, "--json", "-j", help="Output results in JSON format."
     ),
@@ -106,21 +304,44 @@ def expire_cmd(
     debug: bool = typer.Option(False, "--debug", "-d", help="Enable debug mode."),
 ) -> None:
     """
-    Expire a push.
+    Expire one push, or many concurrently.
+
+    With several tokens, '-' or --from, tokens are expired concurrently and
+    one JSON result line is printed per token.
     """
     _update_cli_options(json=json, verbose=verbose, pretty=pretty, debug=debug)
 
-    if not url_token:
+    url_tokens = url_tokens or []
+    if not url_tokens and source is None and not names:
         typer.echo(ctx.get_help())
         raise typer.Exit()
 
-    _require_api_token("expire")
+    if concurrency is not None and concurrency < 1:
+        _error_json("--concurrency must be at least 1.")
+        raise typer.Exit(1)
 
-    path = push_expire_path(_current_api_profile(), url_token)
+    _require_api_token("expire")
+    url_tokens = url_tokens + _resolve_names(names or [])
 
-    response = _make_request("DELETE", path)
+    if source is not None or len(url_tokens) > 1 or url_tokens == ["-"]:
+        try:
+            failures = expire_many(_bulk_tokens(url_tokens, source), concurrency)
+        except ValueError as e:
+            _error_json(f"Could not read tokens: {e}")
+            raise typer.Exit(1)
+        if failures:
+            raise typer.Exit(1)
+        return
+
+    url_token = url_tokens[0]
+    response, _ = _request_with_profile_fallback(
+        "DELETE",
+        _current_api_profile(),
+        lambda profile: (push_expire_path(profile, url_token), None, None),
+    )
 
     if response.status_code == 200:
+        mark_expired(url_token)
         body = response.json()
 
         if _json_output():
@@ -143,11 +364,113 @@ def expire_cmd(
         raise typer.Exit(1)
 
 
+def _audit_one(
+    url_token: str, api_profile: str
+) -> tuple[list[dict[str, str]], dict[str, Any] | None]:
+    """Fetch one push's audit log.
+
+    Returns:
+        The normalized events in chronological order, each tagged with the
+        push's url_token, and None; or no events and a JSON error line.
+    """
+    from pwpush.api.endpoints import normalize_audit_events
+
+    try:
+        response, _ = _request_with_profile_fallback(
+            "GET",
+            api_profile,
+            lambda profile: (push_audit_path(profile, url_token), None, None),
+            raise_errors=True,
+        )
+    except PwpushError as e:
+        return [], {"url_token": url_token, "error": str(e)}
+
+    if response.status_code != 200:
+        return [], {
+            "url_token": url_token,
+            "error": _response_error_message(response),
+            "status_code": response.status_code,
+        }
+
+    try:
+        events = normalize_audit_events(response.json())
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return [], {"url_token": url_token, "error": "Unreadable audit log."}
+
+    for event in events:
+        event["url_token"] = url_token
+    events.sort(key=lambda event: event["timestamp"])
+    return events, None
+
+
+def audit_many(tokens: Iterable[str], concurrency: int | None = None) -> int:
+    """Fetch audit logs concurrently and print them as one time-ordered stream.
+
+    Each push's log is sorted, then all logs are merged by timestamp. With
+    JSON output one line is printed per event (and per failed push, as soon
+    as it fails); otherwise a single table with a Push column is rendered.
+
+    Returns:
+        The number of pushes whose audit log could not be fetched.
+    """
+    api_profile = _current_api_profile()
+
+    logs: list[list[dict[str, str]]] = []
+    failures: list[dict[str, Any]] = []
+    for _, (events, error) in _map_requests(
+        lambda token: _audit_one(token, api_profile), _unique(tokens), concurrency
+    ):
+        if error is None:
+            logs.append(events)
+            continue
+        failures.append(error)
+        if _json_output():
+            print(json_module.dumps(error), flush=True)
+
+    merged = heapq.merge(*logs, key=lambda event: event["timestamp"])
+
+    if _json_output():
+        for event in merged:
+            line = {
+                "timestamp": event["timestamp"],
+                "url_token": event["url_token"],
+                "kind": event["kind"],
+                "ip": event["ip"],
+                "user_agent": event["user_agent"],
+                "referrer": event["referrer"],
+                "successful": event["successful"] == "True",
+            }
+            print(json_module.dumps(line))
+        return len(failures)
+
+    table = Table(
+        "Push", "When", "Operation", "IP", "User Agent", "Referrer", "Successful"
+    )
+    for event in merged:
+        table.add_row(
+            event["url_token"],
+            event["created_at"],
+            event["kind"],
+            event["ip"],
+            event["user_agent"],
+            event["referrer"],
+            event["successful"],
+        )
+    console.print(table)
+    for error in failures:
+        _error_json(f"{error['url_token']}: {error['error']}", error.get("status_code"))
+    return len(failures)
+
+
 def audit_cmd(
     ctx: typer.Context,
-    url_token: str = typer.Argument(
-        "", help="The secret URL token of the push to audit."
+    url_tokens: list[str] | None = typer.Argument(
+        None, help="The secret URL token of the push to audit."
     ),
+    source: str | None = None,
+    all_active: bool = False,
+    concurrency: int | None = None,
+    names: list[str] | None = None,
     json: bool = typer.Option(
         False, "--json", "-j", help="Output results in JSON format."
     ),
@@ -161,22 +484,50 @@ def audit_cmd(
 ) -> None:
     """
     Show the audit log for the given push. Requires login with an API token.
+
+    With several tokens, '-', --from or --all, logs are fetched concurrently
+    and merged into one stream ordered by time.
     """
     _update_cli_options(json=json, verbose=verbose, pretty=pretty, debug=debug)
 
-    if not url_token:
+    url_tokens = url_tokens or []
+    if not url_tokens and source is None and not all_active and not names:
         typer.echo(ctx.get_help())
         raise typer.Exit()
 
+    if concurrency is not None and concurrency < 1:
+        _error_json("--concurrency must be at least 1.")
+        raise typer.Exit(1)
+
     _require_api_token("audit")
 
     if user_config["instance"]["email"] == "Not Set":
         _error_json("You must log into an instance first.")
         raise typer.Exit(1)
 
-    path = push_audit_path(_current_api_profile(), url_token)
+    url_tokens = url_tokens + _resolve_names(names or [])
 
-    response = _make_request("GET", path)
+    if all_active or source is not None or len(url_tokens) > 1 or url_tokens == ["-"]:
+        tokens: Iterable[str] = _bulk_tokens(url_tokens, source)
+        if all_active:
+            active = (push["url_token"] for push in _active_pushes())
+            tokens = itertools.chain(tokens, active)
+        try:
+            failures = audit_many(tokens, concurrency)
+        except ValueError as e:
+            _error_json(f"Could not read tokens: {e}")
+            raise typer.Exit(1)
+        if failures:
+            raise typer.Exit(1)
+        return
+
+    url_token = url_tokens[0]
+
+    response, _ = _request_with_profile_fallback(
+        "GET",
+        _current_api_profile(),
+        lambda profile: (push_audit_path(profile, url_token), None, None),
+    )
 
     if response.status_code == 200:
         body = response.json()
@@ -223,8 +574,258 @@ def audit_cmd(
         raise typer.Exit(1)
 
 
+def iter_push_pages(
+    expired: bool = False, headers: dict[str, str] | None = None
+) -> Iterator[tuple[Any, list[Any]]]:
+    """Yield (response, pushes) for each page of the active or expired list.
+
+    Walks the list with the shared pwpush.api.endpoints.iter_push_pages; an
+    error answer is reported and ends the command.
+    """
+    try:
+        yield from walk_push_pages(
+            _make_request, _current_api_profile(), expired=expired, headers=headers
+        )
+    except PwpushAPIError as e:
+        _error_json(e.message, e.status_code)
+        raise typer.Exit(1)
+
+
+def iter_pushes(expired: bool = False, limit: int | None = None) -> Iterator[Any]:
+    """Yield pushes from the active or expired list, one page at a time.
+
+    Args:
+        expired: List expired instead of active pushes
+        limit: Stop after this many pushes (None for no limit); no further
+            pages are requested once it is reached
+    """
+    if limit is not None and limit <= 0:
+        return
+
+    emitted = 0
+    for _, pushes in iter_push_pages(expired):
+        for push in pushes:
+            yield push
+            emitted += 1
+            if limit is not None and emitted >= limit:
+                return
+
+
+def _active_pushes() -> list[dict[str, Any]]:
+    """Fetch every active push that has a url_token."""
+    return [
+        push
+        for push in iter_pushes()
+        if isinstance(push, dict) and push.get("url_token")
+    ]
+
+
+def parse_age(value: str) -> timedelta:
+    """Parse an age such as '30m', '12h', '7d' or '2w' (a bare number is days).
+
+    Raises:
+        ValueError: If the value is not a non-negative number with a known unit.
+    """
+    text = value.strip().lower()
+    unit = "d"
+    if text and text[-1] in AGE_UNITS:
+        text, unit = text[:-1], text[-1]
+    amount = float(text)
+    if amount < 0:
+        raise ValueError("age must not be negative")
+    try:
+        return timedelta(**{AGE_UNITS[unit]: amount})
+    except OverflowError:
+        raise ValueError(f"age out of range: {value}") from None
+
+
+def push_matches(
+    push: dict[str, Any],
+    *,
+    now: datetime,
+    older_than: timedelta | None = None,
+    pattern: re.Pattern[str] | None = None,
+    kind: str | None = None,
+    max_views_remaining: int | None = None,
+) -> bool:
+    """Check whether a push from the active list passes every given filter.
+
+    Pushes missing a field a filter needs (e.g. no created_at) do not match,
+    so a sweep never expires something it could not evaluate.
+    """
+    if older_than is not None:
+        try:
+            created_at = parse_timestamp(str(push["created_at"]))
+        except (KeyError, ValueError):
+            return False
+        if now - created_at < older_than:
+            return False
+
+    if pattern is not None:
+        fields = (push.get("name"), push.get("note"))
+        if not any(isinstance(f, str) and pattern.search(f) for f in fields):
+            return False
+
+    # Legacy lists only contain text pushes and omit the kind.
+    if kind is not None and str(push.get("kind") or "text") != kind:
+        return False
+
+    if max_views_remaining is not None:
+        views_remaining = push.get("views_remaining")
+        if not isinstance(views_remaining, int):
+            return False
+        if views_remaining > max_views_remaining:
+            return False
+
+    return True
+
+
+def sweep_cmd(
+    older_than: str | None = None,
+    match: str | None = None,
+    kind: str | None = None,
+    max_views_remaining: int | None = None,
+    dry_run: bool = False,
+    yes: bool = False,
+    concurrency: int | None = None,
+    debug: bool = False,
+) -> None:
+    """Expire every active push that matches the given filters."""
+    _update_cli_options(json=True, debug=debug)
+
+    if (
+        older_than is None
+        and match is None
+        and kind is None
+        and max_views_remaining is None
+    ):
+        _error_json(
+            "Specify at least one filter: --older-than, --match, --kind "
+            "or --max-views-remaining."
+        )
+        raise typer.Exit(1)
+
+    try:
+        min_age = parse_age(older_than) if older_than is not None else None
+    except ValueError:
+        _error_json(
+            f"Invalid age '{older_than}'. Use a number with m, h, d or w (e.g. 7d)."
+        )
+        raise typer.Exit(1)
+
+    try:
+        pattern = re.compile(match) if match is not None else None
+    except re.error as e:
+        _error_json(f"Invalid --match pattern: {e}")
+        raise typer.Exit(1)
+
+    if kind is not None and kind not in PUSH_KINDS:
+        _error_json(f"Invalid kind '{kind}'. Must be one of: {', '.join(PUSH_KINDS)}")
+        raise typer.Exit(1)
+
+    if concurrency is not None and concurrency < 1:
+        _error_json("--concurrency must be at least 1.")
+        raise typer.Exit(1)
+
+    _require_api_token("sweep")
+
+    now = datetime.now(timezone.utc)
+    matches = [
+        push
+        for push in _active_pushes()
+        if push_matches(
+            push,
+            now=now,
+            older_than=min_age,
+            pattern=pattern,
+            kind=kind,
+            max_views_remaining=max_views_remaining,
+        )
+    ]
+
+    if dry_run:
+        for push in matches:
+            preview: dict[str, Any] = {
+                key: push[key]
+                for key in ("url_token", "name", "note", "kind", "created_at")
+                if key in push
+            }
+            preview["views_remaining"] = push.get("views_remaining")
+            preview["dry_run"] = True
+            print(json_module.dumps(preview), flush=True)
+        return
+
+    if not matches:
+        return
+
+    if not yes and not typer.confirm(
+        f"Expire {len(matches)} matching push(es)?", err=True
+    ):
+        raise typer.Exit(1)
+
+    if expire_many((push["url_token"] for push in matches), concurrency):
+        raise typer.Exit(1)
+
+
+# Column widths (in terminal cells) for the streamed list table; longer
+# values end in an ellipsis.
+LIST_COLUMNS = (
+    ("Secret URL Token", 24),
+    ("Note", 24),
+    ("Views", 7),
+    ("Days", 7),
+    ("Deletable", 9),
+    ("Retrieval", 9),
+    ("Created", 24),
+)
+
+
+def _table_line(values: Iterable[str]) -> str:
+    """Format one fixed-width row of the streamed list table."""
+    cells = []
+    for value, (_, width) in zip(values, LIST_COLUMNS):
+        cell = Text(value)
+        cell.truncate(width, overflow="ellipsis", pad=True)
+        cells.append(cell.plain)
+    return "  ".join(cells).rstrip()
+
+
+def _push_row(push: dict[str, Any]) -> list[str]:
+    """Return the table cells for one push."""
+    return [
+        push["url_token"],
+        f'{push["note"]}',
+        f'{push["expire_after_views"] - push["views_remaining"]}/{push["expire_after_views"]}',
+        f'{push["expire_after_days"] - push["days_remaining"]}/{push["expire_after_days"]}',
+        f'{push["deletable_by_viewer"]}',
+        f'{push["retrieval_step"]}',
+        format_timestamp(push["created_at"]),
+    ]
+
+
+def _print_json_array(items: Iterable[Any]) -> None:
+    """Print items as one JSON array, writing each element as it arrives."""
+    pretty = _pretty_output()
+    count = 0
+    for item in items:
+        if pretty:
+            text = json_module.dumps(item, indent=2, sort_keys=True)
+            text = "  " + text.replace("\n", "\n  ")
+            sys.stdout.write(("[\n" if count == 0 else ",\n") + text)
+        else:
+            sys.stdout.write(("[" if count == 0 else ", ") + json_module.dumps(item))
+        sys.stdout.flush()
+        count += 1
+    if count == 0:
+        print("[]")
+    else:
+        print("\n]" if pretty else "]")
+
+
 def list_cmd(
     expired: bool = typer.Option(False, help="Show only expired pushes."),
+    limit: int | None = None,
+    ndjson: bool = False,
     json: bool = typer.Option(
         False, "--json", "-j", help="Output results in JSON format."
     ),
@@ -238,8 +839,13 @@ def list_cmd(
 ) -> None:
     """
     List active pushes. Requires login with an API token.
+
+    Pages are fetched on demand and printed as they arrive, so the first
+    rows appear after one round trip and memory stays bounded.
     """
-    _update_cli_options(json=json, verbose=verbose, pretty=pretty, debug=debug)
+    _update_cli_options(
+        json=json or ndjson, verbose=verbose, pretty=pretty, debug=debug
+    )
 
     _require_api_token("list")
 
@@ -247,69 +853,33 @@ def list_cmd(
         _error_json("You must log into an instance first.")
         raise typer.Exit(1)
 
-    paths = validation_paths(_current_api_profile(), expired=expired)
-    r = None
-    for path in paths:
-        response = _make_request("GET", path)
-        if response.status_code == 404:
-            continue
-        r = response
-        break
-
-    if r is None:
-        _error_json("No compatible list endpoint found on this instance.")
+    if limit is not None and limit < 1:
+        _error_json("--limit must be at least 1.")
         raise typer.Exit(1)
 
-    if r.status_code == 200:
-        pushes = r.json()
-        if _json_output():
-            # Respect --pretty flag
-            dumps_kwargs: dict[str, Any] = {}
-            if _pretty_output():
-                dumps_kwargs["indent"] = 2
-                dumps_kwargs["sort_keys"] = True
-            print(json_module.dumps(pushes, **dumps_kwargs))
-        else:
-            rprint()
-            if expired:
-                rprint("[bold]=== Expired Pushes:[/bold]")
-            else:
-                rprint("[bold]=== Active Pushes:[/bold]")
-            rprint()
+    pushes = iter_pushes(expired, limit)
 
-            table = Table(
-                "Secret URL Token",
-                "Note",
-                "Views",
-                "Days",
-                "Deletable by Viewer",
-                "Retrieval Step",
-                "Created",
-            )
-            for push in pushes:
-                push["created_at"] = parser.isoparse(push["created_at"]).strftime(
-                    "%m/%d/%Y, %H:%M:%S UTC"
-                )
+    if ndjson:
+        for push in pushes:
+            print(json_module.dumps(push), flush=True)
+        return
 
-                table.add_row(
-                    push["url_token"],
-                    f'{push["note"]}',
-                    f'{push["expire_after_views"] - push["views_remaining"]}/{push["expire_after_views"]}',
-                    f'{push["expire_after_days"] - push["days_remaining"]}/{push["expire_after_days"]}',
-                    f'{push["deletable_by_viewer"]}',
-                    f'{push["retrieval_step"]}',
-                    f'{push["created_at"]}',
-                )
+    if _json_output():
+        _print_json_array(pushes)
+        return
 
-            console.print(table)
+    first = next(pushes, None)
+
+    rprint()
+    if expired:
+        rprint("[bold]=== Expired Pushes:[/bold]")
     else:
-        # Safely parse error response
-        error_message = r.text
-        try:
-            error_body = r.json()
-            if isinstance(error_body, dict):
-                error_message = error_body.get("error", r.text)
-        except (json_module.JSONDecodeError, ValueError):
-            pass
-        _error_json(error_message, r.status_code)
-        raise typer.Exit(1)
+        rprint("[bold]=== Active Pushes:[/bold]")
+    rprint()
+
+    print(_table_line(title for title, _ in LIST_COLUMNS))
+    print(_table_line("-" * width for _, width in LIST_COLUMNS), flush=True)
+    if first is None:
+        return
+    for push in itertools.chain([first], pushes):
+        print(_table_line(_push_row(push)), flush=True)
@@ -1,15 +1,26 @@
 """Push commands for pwpush CLI (push and push-file)."""
 
-from typing import Any
+from typing import Any, Callable, Iterator
 
 import getpass
+import glob
 import json as json_module
+import os
 import sys
+from contextlib import ExitStack, contextmanager
 
 import typer
 from rich import print as rprint
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import (
+    BarColumn,
+    DownloadColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    TimeRemainingColumn,
+    TransferSpeedColumn,
+)
 
 from pwpush.api.capabilities import detect_api_capabilities, email_notifications_enabled
 from pwpush.api.endpoints import (
@@ -18,10 +29,18 @@ from pwpush.api.endpoints import (
     adapt_text_payload_for_profile,
     push_create_path,
     push_preview_path,
+    push_share_url,
+    text_push_payload,
 )
+from pwpush.api.errors import PwpushError
 from pwpush.commands.config import user_config
-from pwpush.options import cli_options
-from pwpush.utils import generate_passphrase, generate_secret, parse_boolean
+from pwpush.ledger import record_push
+from pwpush.options import cli_options, expiration_defaults
+from pwpush.utils import (
+    generate_passphrase,
+    generate_secret,
+    parse_boolean,
+)
 
 console = Console()
 
@@ -61,6 +80,11 @@ def _debug_output() -> bool:
     return cli_options["debug"] or user_config_debug
 
 
+def _skip_preview() -> bool:
+    """Check if share URLs should be derived without a preview request."""
+    return parse_boolean(user_config["cli"].get("skip_preview", "False"))
+
+
 def _current_api_profile() -> str:
     """Get the current API profile."""
     from pwpush.__main__ import current_api_profile
@@ -68,6 +92,20 @@ def _current_api_profile() -> str:
     return current_api_profile()
 
 
+def _api_profile_ttl_seconds() -> int:
+    """Get how long cached capability data may be trusted."""
+    from pwpush.__main__ import api_profile_ttl_seconds
+
+    return api_profile_ttl_seconds()
+
+
+def _map_requests(func, items, concurrency=None):
+    """Run request-making calls concurrently, fixed or adaptive."""
+    from pwpush.__main__ import map_requests
+
+    return map_requests(func, items, concurrency)
+
+
 def _require_api_token(operation: str) -> None:
     """Require a configured API token before authenticated operations."""
     from pwpush.__main__ import require_api_token
@@ -86,6 +124,7 @@ def _make_request(
     token=None,
     timeout=None,
     on_rate_limit_retry=None,
+    raise_errors=False,
 ):
     """Make an API request with the given parameters."""
     from pwpush.__main__ import make_request
@@ -100,9 +139,63 @@ def _make_request(
         token=token,
         timeout=timeout,
         on_rate_limit_retry=on_rate_limit_retry,
+        raise_errors=raise_errors,
+    )
+
+
+def _request_with_profile_fallback(
+    method,
+    api_profile,
+    build_request,
+    *,
+    on_rate_limit_retry=None,
+    on_upload_progress=None,
+    raise_errors=False,
+):
+    """Send a profile-dependent request with speculative v2 fallback."""
+    from pwpush.__main__ import request_with_profile_fallback
+
+    return request_with_profile_fallback(
+        method,
+        api_profile,
+        build_request,
+        on_rate_limit_retry=on_rate_limit_retry,
+        on_upload_progress=on_upload_progress,
+        raise_errors=raise_errors,
     )
 
 
+@contextmanager
+def upload_progress(
+    description: str,
+) -> Iterator[Callable[[int, int], None] | None]:
+    """Show a live bytes/sec progress bar on stderr while a file uploads.
+
+    Yields a callback(bytes_sent, total_bytes) for the upload, or None when
+    JSON output is enabled or stderr is not a terminal.
+    """
+    progress_console = Console(stderr=True)
+    if _json_output() or not progress_console.is_terminal:
+        yield None
+        return
+
+    with Progress(
+        TextColumn("{task.description}"),
+        BarColumn(),
+        DownloadColumn(),
+        TransferSpeedColumn(),
+        TimeRemainingColumn(),
+        console=progress_console,
+        transient=True,
+    ) as progress:
+        task = progress.add_task(description, total=None)
+
+        def on_upload_progress(sent: int, total: int) -> None:
+            progress.update(task, completed=sent, total=total)
+
+        yield on_upload_progress
+
+
 def _update_cli_options(
     json: bool = False,
     verbose: bool = False,
@@ -122,6 +215,67 @@ def _error_json(message: str, status_code: int | None = None) -> None:
     error_json(message, status_code)
 
 
+def build_push_payload(
+    secret: str,
+    *,
+    kind: str = "text",
+    days: int | None = None,
+    views: int | None = None,
+    deletable: bool | None = None,
+    retrieval_step: bool | None = None,
+    note: str | None = None,
+    name: str | None = None,
+    passphrase: str | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Build the legacy-shaped text push payload, applying config defaults.
+
+    Options left as None (or empty) fall back to the user's expiration
+    settings. Use adapt_text_payload_for_profile() to convert the result
+    for API v2.
+    """
+    return text_push_payload(
+        secret,
+        kind=kind,
+        days=days or None,
+        views=views or None,
+        deletable=deletable,
+        retrieval_step=retrieval_step,
+        note=note or None,
+        name=name or None,
+        passphrase=passphrase,
+        defaults=expiration_defaults(),
+    )
+
+
+def resolve_share_body(
+    api_profile: str,
+    created: dict[str, Any],
+    kind: str,
+    on_rate_limit_retry: Any,
+    raise_errors: bool = False,
+) -> Any:
+    """Return the share URL body for a created push.
+
+    In skip-preview mode the URL is derived from the create response; the
+    preview endpoint is only queried when that is not possible.
+    """
+    if _skip_preview():
+        share_url = push_share_url(
+            user_config["instance"]["url"], api_profile, created, kind
+        )
+        if share_url is not None:
+            return {"url": share_url}
+
+    preview_path = push_preview_path(api_profile, created["url_token"], kind)
+    response = _make_request(
+        "GET",
+        preview_path,
+        on_rate_limit_retry=on_rate_limit_retry,
+        raise_errors=raise_errors,
+    )
+    return response.json()
+
+
 def push_cmd(
     ctx: typer.Context,
     days: int | None = typer.Option(None, help="Expire after this many days."),
@@ -183,7 +337,6 @@ def push_cmd(
     """Push a new password, secret note or text."""
     _update_cli_options(json=json, verbose=verbose, pretty=pretty, debug=debug)
 
-    data: dict[str, dict[str, Any]] = {"password": {}}
     api_profile = _current_api_profile()
 
     # Validate kind parameter
@@ -194,9 +347,6 @@ def push_cmd(
         )
         raise typer.Exit(1)
 
-    # Set the kind in the request data
-    data["password"]["kind"] = kind
-
     # Track if input came from stdin pipe (to disable interactive prompts)
     piped_input = False
 
@@ -279,43 +429,17 @@ def push_cmd(
     # If passphrase is None (not provided), leave it as None
     # If passphrase has a value (provided with --passphrase value), use that value
 
-    data["password"]["payload"] = secret
-
-    # Option and user preference processing
-    if days:
-        data["password"]["expire_after_days"] = days
-    elif user_config["expiration"]["expire_after_days"] != "Not Set":
-        data["password"]["expire_after_days"] = user_config["expiration"][
-            "expire_after_days"
-        ]
-
-    if note:
-        data["password"]["note"] = note
-
-    if name:
-        data["password"]["name"] = name
-
-    if views:
-        data["password"]["expire_after_views"] = views
-    elif user_config["expiration"]["expire_after_views"] != "Not Set":
-        data["password"]["expire_after_views"] = user_config["expiration"][
-            "expire_after_views"
-        ]
-
-    if deletable is not None:
-        data["password"]["deletable_by_viewer"] = deletable
-    elif user_config["expiration"]["deletable_by_viewer"] != "Not Set":
-        data["password"]["deletable_by_viewer"] = user_config["expiration"][
-            "deletable_by_viewer"
-        ]
-
-    if retrieval_step is not None:
-        data["password"]["retrieval_step"] = retrieval_step
-    elif user_config["expiration"]["retrieval_step"] != "Not Set":
-        data["password"]["retrieval_step"] = user_config["expiration"]["retrieval_step"]
-
-    if passphrase is not None:
-        data["password"]["passphrase"] = passphrase
+    data = build_push_payload(
+        secret,
+        kind=kind,
+        days=days,
+        views=views,
+        deletable=deletable,
+        retrieval_step=retrieval_step,
+        note=note,
+        name=name,
+        passphrase=passphrase,
+    )
 
     # Email notification options require authentication
     if notify or notify_locale:
@@ -333,6 +457,7 @@ def push_cmd(
             email=user_config["instance"]["email"],
             token=user_config["instance"]["token"],
             debug=_debug_output(),
+            ttl_seconds=_api_profile_ttl_seconds(),
         )
         if email_notifications_enabled(capabilities):
             if notify:
@@ -360,23 +485,26 @@ def push_cmd(
     ) as progress:
         progress.add_task(description="Processing...", total=None)
 
-        create_path = push_create_path(api_profile, kind)
-        request_data = adapt_text_payload_for_profile(data, api_profile)
-        response = _make_request(
+        def build_create_request(
+            profile: str,
+        ) -> tuple[str, dict[str, Any], None]:
+            return (
+                push_create_path(profile, kind),
+                adapt_text_payload_for_profile(data, profile),
+                None,
+            )
+
+        response, api_profile = _request_with_profile_fallback(
             "POST",
-            create_path,
-            post_data=request_data,
+            api_profile,
+            build_create_request,
             on_rate_limit_retry=on_rate_limit_retry,
         )
 
         if response.status_code == 201:
-            body = response.json()
-            preview_path = push_preview_path(api_profile, body["url_token"], kind)
-            response = _make_request(
-                "GET", preview_path, on_rate_limit_retry=on_rate_limit_retry
-            )
-
-            body = response.json()
+            created = response.json()
+            record_push(created, data["password"], kind)
+            body = resolve_share_body(api_profile, created, kind, on_rate_limit_retry)
             if _json_output():
                 # Respect --pretty flag
                 dumps_kwargs: dict[str, Any] = {}
@@ -430,9 +558,11 @@ def push_file_cmd(
         None,
         help="A name for the file push shown in the dashboard, notifications and emails.",
     ),
-    payload: str = typer.Argument(
-        "",
+    payloads: list[str] | None = typer.Argument(
+        None,
     ),
+    each: bool = False,
+    concurrency: int | None = None,
     json: bool = typer.Option(
         False, "--json", "-j", help="Output results in JSON format."
     ),
@@ -453,10 +583,21 @@ def push_file_cmd(
         pwpush push-file config.json --retrieval-step   # Require click-through
         pwpush push-file backup.zip --days 7 --views 5  # Custom expiration
         pwpush push-file doc.pdf --notify "admin@example.com"      # Notify on access (Pro)
+        pwpush push-file a.pdf b.pdf "logs/*.txt"       # All files in one push
+        pwpush push-file "evidence/*" --each -c 8       # One push per file
     """
     _update_cli_options(json=json, verbose=verbose, pretty=pretty, debug=debug)
 
+    if concurrency is not None and concurrency < 1:
+        _error_json("--concurrency must be at least 1.")
+        raise typer.Exit(1)
+
     _require_api_token("push-file")
+    paths = expand_file_paths(payloads or [""])
+    if not paths:
+        _error_json(f"No files match '{' '.join(payloads or [])}'.")
+        raise typer.Exit(1)
+
     api_profile = _current_api_profile()
 
     data: dict[str, dict[str, Any]] = {"file_push": {}}
@@ -514,6 +655,7 @@ def push_file_cmd(
             email=user_config["instance"]["email"],
             token=user_config["instance"]["token"],
             debug=_debug_output(),
+            ttl_seconds=_api_profile_ttl_seconds(),
         )
         if email_notifications_enabled(capabilities):
             if notify:
@@ -534,37 +676,38 @@ def push_file_cmd(
                 f"[yellow]Rate limit exceeded. Retrying in {delay:.1f}s (attempt {attempt}/3)...[/yellow]"
             )
 
+    if each:
+        _push_files_each(paths, data, api_profile, concurrency)
+        return
+
+    payload = paths[0] if len(paths) == 1 else f"{len(paths)} files"
     try:
-        with open(payload, "rb") as fd:
-            upload_files = {"file_push[files][]": fd}
-            create_path = push_create_path(api_profile, "file")
-            request_data = adapt_file_payload_for_profile(data, api_profile)
-            request_files = adapt_file_uploads_for_profile(upload_files, api_profile)
-            response = _make_request(
-                "POST",
-                create_path,
-                upload_files=request_files,
-                post_data=request_data,
-                on_rate_limit_retry=on_rate_limit_retry_file,
-            )
-    except FileNotFoundError:
-        _error_json(f"File '{payload}' not found.")
+        with ExitStack() as stack:
+            fds = [stack.enter_context(open(path, "rb")) for path in paths]
+            with upload_progress(f"Uploading {payload}") as on_upload_progress:
+                response, api_profile = _create_file_push(
+                    api_profile,
+                    data,
+                    fds,
+                    on_rate_limit_retry=on_rate_limit_retry_file,
+                    on_upload_progress=on_upload_progress,
+                )
+    except FileNotFoundError as e:
+        _error_json(f"File '{e.filename}' not found.")
         raise typer.Exit(1)
-    except PermissionError:
-        _error_json(f"Permission denied accessing file '{payload}'.")
+    except PermissionError as e:
+        _error_json(f"Permission denied accessing file '{e.filename}'.")
         raise typer.Exit(1)
     except Exception as e:
         _error_json(f"Error reading file '{payload}': {str(e)}")
         raise typer.Exit(1)
 
     if response.status_code == 201:
-        body = response.json()
-        preview_path = push_preview_path(api_profile, body["url_token"], "file")
-        response = _make_request(
-            "GET", preview_path, on_rate_limit_retry=on_rate_limit_retry_file
+        created = response.json()
+        record_push(created, data["file_push"], "file")
+        body = resolve_share_body(
+            api_profile, created, "file", on_rate_limit_retry_file
         )
-
-        body = response.json()
         if _json_output():
             # Respect --pretty flag
             dumps_kwargs: dict[str, Any] = {}
@@ -575,13 +718,141 @@ def push_file_cmd(
         else:
             rprint(body["url"])
     else:
-        # Safely parse error response
-        error_message = response.text
+        _error_json(_response_error_message(response), response.status_code)
+        raise typer.Exit(1)
+
+
+def expand_file_paths(patterns: list[str]) -> list[str]:
+    """Expand glob patterns into file paths, keeping literal paths as given.
+
+    Patterns are expanded here as well as by the shell so quoted globs work
+    on every platform. A pattern that names an existing path, or contains no
+    wildcards, is kept unchanged so missing files are still reported by name.
+    Duplicate paths are dropped while preserving order.
+    """
+    paths: list[str] = []
+    for pattern in patterns:
+        if os.path.exists(pattern) or not any(c in pattern for c in "*?["):
+            matches = [pattern]
+        else:
+            matches = sorted(
+                match
+                for match in glob.glob(os.path.expanduser(pattern), recursive=True)
+                if os.path.isfile(match)
+            )
+        for match in matches:
+            if match not in paths:
+                paths.append(match)
+    return paths
+
+
+def _response_error_message(response: Any) -> str:
+    """Extract the error message from an API error response."""
+    # Safely parse error response
+    error_message = response.text
+    try:
+        error_body = response.json()
+        if isinstance(error_body, dict):
+            error_message = error_body.get("error", response.text)
+    except (json_module.JSONDecodeError, ValueError):
+        pass
+    return str(error_message)
+
+
+def _create_file_push(
+    api_profile: str,
+    data: dict[str, Any],
+    fds: list[Any],
+    *,
+    on_rate_limit_retry: Any = None,
+    on_upload_progress: Any = None,
+    raise_errors: bool = False,
+) -> tuple[Any, str]:
+    """Send one file push create request carrying every given open file."""
+
+    def build_create_request(
+        profile: str,
+    ) -> tuple[str, dict[str, Any], dict[str, Any]]:
+        # The multipart body rewinds each file, so a speculative v2 attempt
+        # that already sent them can be retried with the legacy shape.
+        files: Any = fds[0] if len(fds) == 1 else fds
+        upload_files = {"file_push[files][]": files}
+        return (
+            push_create_path(profile, "file"),
+            adapt_file_payload_for_profile(data, profile),
+            adapt_file_uploads_for_profile(upload_files, profile),
+        )
+
+    response, profile = _request_with_profile_fallback(
+        "POST",
+        api_profile,
+        build_create_request,
+        on_rate_limit_retry=on_rate_limit_retry,
+        on_upload_progress=on_upload_progress,
+        raise_errors=raise_errors,
+    )
+    return response, profile
+
+
+def _push_one_file(path: str, data: dict[str, Any], api_profile: str) -> dict[str, Any]:
+    """Create a push for a single file and return its JSON result line."""
+    try:
+        with open(path, "rb") as fd:
+            response, profile = _create_file_push(
+                api_profile, data, [fd], raise_errors=True
+            )
+        if response.status_code != 201:
+            return {
+                "file": path,
+                "error": _response_error_message(response),
+                "status_code": response.status_code,
+            }
         try:
-            error_body = response.json()
-            if isinstance(error_body, dict):
-                error_message = error_body.get("error", response.text)
-        except (json_module.JSONDecodeError, ValueError):
-            pass
-        _error_json(error_message, response.status_code)
+            created = response.json()
+        except ValueError:
+            created = None
+        if not isinstance(created, dict):
+            return {
+                "file": path,
+                "error": "Unreadable response from server.",
+                "status_code": response.status_code,
+            }
+        record_push(created, data["file_push"], "file")
+    except FileNotFoundError:
+        return {"file": path, "error": f"File '{path}' not found."}
+    except PermissionError:
+        return {"file": path, "error": f"Permission denied accessing file '{path}'."}
+    except PwpushError as e:
+        return {"file": path, "error": str(e)}
+    except OSError as e:
+        return {"file": path, "error": f"Error reading file '{path}': {str(e)}"}
+
+    result: dict[str, Any] = {"file": path, "url_token": created.get("url_token")}
+    try:
+        body = resolve_share_body(profile, created, "file", None, raise_errors=True)
+    except PwpushError as e:
+        return {**result, "error": str(e)}
+    except ValueError:
+        return {**result, "error": "Unreadable preview response from server."}
+    if isinstance(body, dict) and "url" in body:
+        result["url"] = body["url"]
+    return result
+
+
+def _push_files_each(
+    paths: list[str],
+    data: dict[str, Any],
+    api_profile: str,
+    concurrency: int | None,
+) -> None:
+    """Create one push per file concurrently, printing one JSON line each."""
+    failures = 0
+    for _, result in _map_requests(
+        lambda path: _push_one_file(path, data, api_profile), paths, concurrency
+    ):
+        if "error" in result:
+            failures += 1
+        print(json_module.dumps(result), flush=True)
+
+    if failures:
         raise typer.Exit(1)
@@ -18,10 +18,12 @@ from pwpush.api.endpoints import (
     adapt_request_payload_for_profile,
     adapt_request_uploads_for_profile,
     request_create_path,
+    request_payload,
     request_preview_path,
+    request_share_url,
 )
 from pwpush.commands.config import user_config
-from pwpush.options import cli_options
+from pwpush.options import cli_options, expiration_defaults
 from pwpush.utils import parse_boolean
 
 console = Console()
@@ -55,6 +57,11 @@ def _debug_output() -> bool:
     return cli_options["debug"] or user_config_debug
 
 
+def _skip_preview() -> bool:
+    """Check if share URLs should be derived without a preview request."""
+    return parse_boolean(user_config["cli"].get("skip_preview", "False"))
+
+
 def _current_api_profile() -> str:
     """Get the current API profile."""
     from pwpush.__main__ import current_api_profile
@@ -62,6 +69,13 @@ def _current_api_profile() -> str:
     return current_api_profile()
 
 
+def _api_profile_ttl_seconds() -> int:
+    """Get how long cached capability data may be trusted."""
+    from pwpush.__main__ import api_profile_ttl_seconds
+
+    return api_profile_ttl_seconds()
+
+
 def _require_api_token(operation: str) -> None:
     """Require a configured API token before authenticated operations."""
     from pwpush.__main__ import require_api_token
@@ -148,6 +162,7 @@ def request_cmd(
         email=user_config["instance"]["email"],
         token=user_config["instance"]["token"],
         debug=_debug_output(),
+        ttl_seconds=_api_profile_ttl_seconds(),
     )
 
     if not requests_enabled(capabilities):
@@ -196,58 +211,29 @@ def request_cmd(
         _error_json("Request must include either text content or a file attachment.")
         raise typer.Exit(1)
 
-    # Build the request payload
-    data: dict[str, dict[str, Any]] = {"request": {}}
-    data["request"]["request"] = request_content
-
-    # Add notification email (required for requests)
-    # Check if email notifications are supported on this instance
-    if notify or notify_locale:
-        if request_email_notifications_enabled(capabilities):
-            if notify:
-                data["request"]["notify_emails_to"] = notify
-            if notify_locale:
-                data["request"]["notify_emails_to_locale"] = notify_locale
-        else:
-            if not _json_output():
-                rprint(
-                    "[yellow]Warning: Email notifications are not enabled on this instance. "
-                    "Options ignored.[/yellow]"
-                )
-
-    # Add expiration options
-    if days:
-        data["request"]["expire_after_days"] = days
-    elif user_config["expiration"]["expire_after_days"] != "Not Set":
-        data["request"]["expire_after_days"] = user_config["expiration"][
-            "expire_after_days"
-        ]
-
-    if views:
-        data["request"]["expire_after_views"] = views
-    elif user_config["expiration"]["expire_after_views"] != "Not Set":
-        data["request"]["expire_after_views"] = user_config["expiration"][
-            "expire_after_views"
-        ]
-
-    # Add other options
-    if deletable is not None:
-        data["request"]["deletable_by_viewer"] = deletable
-    elif user_config["expiration"]["deletable_by_viewer"] != "Not Set":
-        data["request"]["deletable_by_viewer"] = user_config["expiration"][
-            "deletable_by_viewer"
-        ]
-
-    if retrieval_step is not None:
-        data["request"]["retrieval_step"] = retrieval_step
-    elif user_config["expiration"]["retrieval_step"] != "Not Set":
-        data["request"]["retrieval_step"] = user_config["expiration"]["retrieval_step"]
-
-    if note:
-        data["request"]["note"] = note
-
-    if name:
-        data["request"]["name"] = name
+    # Notification emails are only sent when the instance supports them
+    if (notify or notify_locale) and not request_email_notifications_enabled(
+        capabilities
+    ):
+        if not _json_output():
+            rprint(
+                "[yellow]Warning: Email notifications are not enabled on this instance. "
+                "Options ignored.[/yellow]"
+            )
+        notify = notify_locale = None
+
+    data = request_payload(
+        request_content,
+        days=days or None,
+        views=views or None,
+        deletable=deletable,
+        retrieval_step=retrieval_step,
+        note=note or None,
+        name=name or None,
+        notify=notify or None,
+        notify_locale=notify_locale or None,
+        defaults=expiration_defaults(),
+    )
 
     # Callback to show rate limit retry feedback
     def on_rate_limit_retry(attempt: int, delay: float, response: Any) -> None:
@@ -308,12 +294,15 @@ def request_cmd(
 
     if response.status_code == 201:
         body = response.json()
-        preview_path = request_preview_path(api_profile, body["url_token"])
-        response = _make_request(
-            "GET", preview_path, on_rate_limit_retry=on_rate_limit_retry
-        )
-
-        body = response.json()
+        share_url = request_share_url(body) if _skip_preview() else None
+        if share_url is not None:
+            body = {"url": share_url}
+        else:
+            preview_path = request_preview_path(api_profile, body["url_token"])
+            response = _make_request(
+                "GET", preview_path, on_rate_limit_retry=on_rate_limit_retry
+            )
+            body = response.json()
         if _json_output():
             # Respect --pretty flag
             dumps_kwargs: dict[str, Any] = {}
@@ -0,0 +1,260 @@
+"""Serve command for pwpush CLI (long-running local daemon)."""
+
+from typing import Any
+
+import io
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+import threading
+import traceback
+from pathlib import Path
+
+import typer
+from rich import print as rprint
+
+from pwpush.api.capabilities import clear_discovery_cache
+from pwpush.daemon import SOCKET_ENV, read_frames, send_frame
+from pwpush.options import cli_options, load_config, user_config_file
+
+HELP_TEXT = f"""Run a local daemon that executes pwpush commands over a Unix socket.
+
+The daemon keeps the configuration, API profile, instance capabilities and
+pooled keep-alive connections in memory. With {SOCKET_ENV} set to the
+socket path, later non-interactive `pwpush` invocations forward their
+arguments to it and skip loading the CLI, which is most of their start-up
+time. Interactive invocations and invocations made while no daemon is
+listening run in-process as usual.
+
+Commands run one at a time, in the directory of the invoking process. The
+configuration is reloaded when the config file changes on disk. The socket
+is only accessible to the current user.
+
+[dim]Examples:[/]
+[code]
+pwpush serve --socket ~/.pwpush.sock &
+export {SOCKET_ENV}=~/.pwpush.sock
+pwpush --json push --secret "s3cret" --days 1    # Runs in the daemon
+[/code]"""
+
+
+def _error_json(message: str, status_code: int | None = None) -> None:
+    """Print an error message in JSON format."""
+    from pwpush.__main__ import error_json
+
+    error_json(message, status_code)
+
+
+class _FrameWriter(io.TextIOBase):
+    """Text stream that forwards every write to the client as a frame."""
+
+    def __init__(self, connection: socket.socket, name: str, lock: threading.Lock):
+        self._connection = connection
+        self._name = name
+        self._lock = lock
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    def write(self, text: str) -> int:
+        if text:
+            with self._lock:
+                send_frame(self._connection, {self._name: text})
+        return len(text)
+
+
+class _RemoteStdin(io.TextIOBase):
+    """Stdin that asks the client for its input on first read.
+
+    Commands that never touch stdin never make the client read it, so a
+    client whose stdin is an idle pipe does not block.
+    """
+
+    def __init__(
+        self, connection: socket.socket, replies: Any, lock: threading.Lock
+    ) -> None:
+        self._connection = connection
+        self._replies = replies
+        self._lock = lock
+        self._buffer: io.StringIO | None = None
+
+    def readable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    def _data(self) -> io.StringIO:
+        if self._buffer is None:
+            with self._lock:
+                send_frame(self._connection, {"stdin": True})
+            frame: dict[str, Any] = next(read_frames(self._replies), {})
+            self._buffer = io.StringIO(str(frame.get("stdin", "")))
+        return self._buffer
+
+    def read(self, size: int | None = -1) -> str:
+        return self._data().read(size)
+
+    def readline(self, size: int = -1) -> str:  # type: ignore[override]
+        return self._data().readline(size)
+
+    def __iter__(self) -> Any:
+        return iter(self._data())
+
+
+def _exit_code(code: Any) -> int:
+    """Map a SystemExit code to a process exit status."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    return 1
+
+
+class _Daemon:
+    """Runs forwarded commands in this process, one at a time."""
+
+    def __init__(self) -> None:
+        from pwpush.__main__ import app
+
+        self._command = typer.main.get_command(app)
+        self._lock = threading.Lock()
+        self._config_mtime = self._current_config_mtime()
+
+    @staticmethod
+    def _current_config_mtime() -> int | None:
+        try:
+            return user_config_file.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _refresh_config(self) -> None:
+        """Reload the config if it changed since the last command.
+
+        Discovery results are dropped with it, since the instance URL, token
+        or profile TTL may have changed.
+        """
+        mtime = self._current_config_mtime()
+        if mtime != self._config_mtime:
+            load_config()
+            clear_discovery_cache()
+            self._config_mtime = self._current_config_mtime()
+
+    def run(self, connection: socket.socket, replies: Any) -> None:
+        """Read one request from the connection and run it."""
+        request = next(read_frames(replies), None)
+        if not isinstance(request, dict) or not isinstance(request.get("argv"), list):
+            return
+
+        send_lock = threading.Lock()
+        streams = (
+            _RemoteStdin(connection, replies, send_lock),
+            _FrameWriter(connection, "stdout", send_lock),
+            _FrameWriter(connection, "stderr", send_lock),
+        )
+        with self._lock:
+            saved_streams = (sys.stdin, sys.stdout, sys.stderr)
+            saved_cwd = os.getcwd()
+            sys.stdin, sys.stdout, sys.stderr = streams
+            try:
+                code = self._execute(request)
+            except (BrokenPipeError, ConnectionResetError):
+                # The client went away; there is nobody left to report to.
+                return
+            finally:
+                sys.stdin, sys.stdout, sys.stderr = saved_streams
+                os.chdir(saved_cwd)
+                self._config_mtime = self._current_config_mtime()
+        try:
+            send_frame(connection, {"exit": code})
+        except OSError:
+            pass
+
+    def _execute(self, request: dict[str, Any]) -> int:
+        """Run a request with the client's streams installed."""
+        cwd = request.get("cwd")
+        try:
+            if cwd:
+                os.chdir(cwd)
+        except OSError as e:
+            sys.stderr.write(f"Error: cannot use working directory {cwd!r}: {e}\n")
+            return 1
+
+        self._refresh_config()
+        for option in cli_options:
+            cli_options[option] = False
+        try:
+            # Standalone mode reports usage errors and always ends in SystemExit.
+            self._command.main(
+                args=[str(arg) for arg in request["argv"]], prog_name="pwpush"
+            )
+        except SystemExit as e:
+            return _exit_code(e.code)
+        except (BrokenPipeError, ConnectionResetError):
+            raise
+        except Exception:
+            sys.stderr.write(traceback.format_exc())
+            return 1
+
+
+def make_server(socket_path: Path) -> socketserver.UnixStreamServer:
+    """Bind the daemon's socket, readable and writable by this user only.
+
+    Raises:
+        ValueError: If the path is taken by another file or a live daemon.
+    """
+    if socket_path.exists() or socket_path.is_symlink():
+        if not stat.S_ISSOCK(socket_path.lstat().st_mode):
+            raise ValueError(f"'{socket_path}' exists and is not a socket.")
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(socket_path))
+        except OSError:
+            socket_path.unlink()
+        else:
+            raise ValueError(
+                f"A pwpush daemon is already listening on '{socket_path}'."
+            )
+        finally:
+            probe.close()
+
+    daemon = _Daemon()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            daemon.run(self.connection, self.rfile)
+
+    previous_umask = os.umask(0o177)
+    try:
+        return socketserver.UnixStreamServer(str(socket_path), Handler)
+    finally:
+        os.umask(previous_umask)
+
+
+def serve_cmd(socket_path: Path) -> None:
+    """Serve forwarded commands on socket_path until interrupted."""
+    socket_path = socket_path.expanduser()
+    try:
+        server = make_server(socket_path)
+    except (OSError, ValueError) as e:
+        _error_json(f"Could not start the daemon: {e}")
+        raise typer.Exit(1)
+
+    def stop(signum: int, frame: Any) -> None:
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, stop)
+    rprint(f"Serving pwpush on '{socket_path}'. Set {SOCKET_ENV} to use it.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
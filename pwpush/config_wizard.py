@@ -3,13 +3,12 @@ from typing import Any
 from dataclasses import dataclass
 from urllib.parse import urlparse
 
-import requests
 import typer
 from rich.console import Console
 from rich.table import Table
 
 from pwpush.api.capabilities import accounts_enabled, detect_api_capabilities
-from pwpush.api.client import absolute_url, normalize_base_url
+from pwpush.api.client import absolute_url, get_session, normalize_base_url
 from pwpush.options import save_config, user_config, user_config_file
 from pwpush.utils import mask_sensitive_value, parse_boolean
 
@@ -26,11 +25,13 @@ def fetch_accounts(base_url: str, token: str) -> list[dict[str, Any]]:
     Returns:
         List of account dictionaries with id, name, and role fields
     """
+    import requests
+
     accounts_url = absolute_url(base_url, "/api/v2/accounts")
     headers = {"Authorization": f"Bearer {token}"}
 
     try:
-        response = requests.get(accounts_url, headers=headers, timeout=10)
+        response = get_session(base_url).get(accounts_url, headers=headers, timeout=10)
         if response.status_code == 200:
             data = response.json()
             if isinstance(data, list):
@@ -0,0 +1,112 @@
+"""Thin client for a running `pwpush serve` daemon.
+
+When PWPUSH_SOCKET names the socket of a daemon started with
+`pwpush serve --socket PATH`, the `pwpush` entry point forwards its
+arguments to the daemon instead of importing the CLI, so an invocation
+costs little more than interpreter start-up. The daemon runs the command
+with its already loaded config, API profile and pooled connections, and
+streams the output and exit code back.
+
+Only the standard library is imported here. Interactive invocations (stdin
+is a terminal) and the `serve` command itself always run in-process, as
+does every invocation when no daemon is listening.
+
+Protocol: newline-delimited JSON objects over a Unix stream socket. The
+client sends {"argv": [...], "cwd": "..."}; the daemon answers with any
+number of {"stdout": text} / {"stderr": text} frames and ends with
+{"exit": code}. When the command first reads stdin the daemon sends
+{"stdin": true} and the client replies with {"stdin": text}.
+"""
+
+from typing import Any, TextIO
+
+import json
+import os
+import socket
+import sys
+
+SOCKET_ENV = "PWPUSH_SOCKET"
+
+
+def send_frame(connection: socket.socket, frame: dict[str, Any]) -> None:
+    """Send one protocol frame."""
+    connection.sendall(json.dumps(frame).encode("utf-8") + b"\n")
+
+
+def read_frames(stream: Any) -> Any:
+    """Yield protocol frames from a binary file object until it closes."""
+    for line in stream:
+        if line.strip():
+            yield json.loads(line)
+
+
+def forward(
+    argv: list[str],
+    socket_path: str,
+    *,
+    stdin: TextIO | None = None,
+    stdout: TextIO | None = None,
+    stderr: TextIO | None = None,
+) -> int | None:
+    """Run a command on the daemon listening at socket_path.
+
+    Args:
+        argv: Command-line arguments, without the program name
+        socket_path: Path of the daemon's Unix socket
+        stdin: Stream sent to the daemon if the command reads stdin
+        stdout: Stream receiving the command's standard output
+        stderr: Stream receiving the command's error output
+
+    Returns:
+        The command's exit code, or None when no daemon accepted the
+        connection (the caller should run the command itself).
+    """
+    stdin = sys.stdin if stdin is None else stdin
+    stdout = sys.stdout if stdout is None else stdout
+    stderr = sys.stderr if stderr is None else stderr
+
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(socket_path)
+    except OSError:
+        connection.close()
+        return None
+
+    with connection, connection.makefile("rb") as replies:
+        try:
+            send_frame(connection, {"argv": argv, "cwd": os.getcwd()})
+            for frame in read_frames(replies):
+                if "stdout" in frame:
+                    stdout.write(frame["stdout"])
+                    stdout.flush()
+                elif "stderr" in frame:
+                    stderr.write(frame["stderr"])
+                    stderr.flush()
+                elif "stdin" in frame:
+                    data = stdin.read() if stdin is not None else ""
+                    send_frame(connection, {"stdin": data})
+                elif "exit" in frame:
+                    return int(frame["exit"])
+        except (OSError, ValueError) as e:
+            stderr.write(f"Error: lost connection to pwpush daemon: {e}\n")
+            return 1
+
+    # The daemon went away mid-command; its side effects are unknown, so
+    # the command is not retried in-process.
+    stderr.write("Error: pwpush daemon closed the connection unexpectedly.\n")
+    return 1
+
+
+def main() -> None:
+    """Entry point: forward to a running daemon, else run the CLI in-process."""
+    argv = sys.argv[1:]
+    socket_path = os.environ.get(SOCKET_ENV)
+    interactive = sys.stdin is not None and sys.stdin.isatty()
+    if socket_path and argv[:1] != ["serve"] and not interactive:
+        exit_code = forward(argv, socket_path)
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    from pwpush.__main__ import app
+
+    app()
@@ -0,0 +1,547 @@
+"""Opt-in local ledger of created pushes, stored in SQLite.
+
+When `cli.ledger` is enabled, every push the CLI creates is recorded here so
+it can later be found by name or note, and so `expire` and `audit` can turn a
+name into a url_token without asking the server. Writes are best effort: a
+broken or locked ledger never fails the push that was just created.
+
+`pwpush ledger sync` reconciles the ledger with the server's active and
+expired lists, so remaining views and expiry can be read locally too.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+import typer
+
+from pwpush.options import user_config
+from pwpush.utils import parse_boolean, parse_timestamp, utc_timestamp
+
+if TYPE_CHECKING:
+    import sqlite3
+
+ledger_file = Path(typer.get_app_dir("pwpush")).joinpath("ledger.db")
+
+# Upper bound used to turn a prefix into an indexable range: every string
+# starting with the prefix sorts below prefix + this character.
+_PREFIX_END = "\U0010ffff"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pushes (
+    url_token TEXT PRIMARY KEY,
+    instance TEXT NOT NULL,
+    name TEXT COLLATE NOCASE,
+    note TEXT COLLATE NOCASE,
+    kind TEXT,
+    expire_after_days INTEGER,
+    expire_after_views INTEGER,
+    created_at TEXT NOT NULL,
+    expired_at TEXT,
+    views_remaining INTEGER,
+    days_remaining INTEGER,
+    synced_at TEXT
+);
+CREATE INDEX IF NOT EXISTS pushes_instance_name ON pushes (instance, name);
+CREATE INDEX IF NOT EXISTS pushes_instance_note ON pushes (instance, note);
+CREATE TABLE IF NOT EXISTS sync_state (
+    instance TEXT NOT NULL,
+    list TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    pages INTEGER NOT NULL DEFAULT 0,
+    synced_at TEXT NOT NULL,
+    PRIMARY KEY (instance, list)
+);
+"""
+
+# Columns added after the first ledger release, created on older databases.
+_ADDED_COLUMNS = (
+    ("views_remaining", "INTEGER"),
+    ("days_remaining", "INTEGER"),
+    ("synced_at", "TEXT"),
+)
+
+_COLUMNS = (
+    "url_token",
+    "instance",
+    "name",
+    "note",
+    "kind",
+    "expire_after_days",
+    "expire_after_views",
+    "created_at",
+    "expired_at",
+    "views_remaining",
+    "days_remaining",
+    "synced_at",
+)
+
+_connection: "sqlite3.Connection | None" = None
+_connection_path: Path | None = None
+_lock = threading.Lock()
+
+
+def ledger_enabled() -> bool:
+    """Check whether the local push ledger is enabled in the config."""
+    return parse_boolean(user_config["cli"]["ledger"])
+
+
+def _instance() -> str:
+    """Return the normalized URL of the configured instance."""
+    from pwpush.api.client import normalize_base_url
+
+    return normalize_base_url(user_config["instance"]["url"])
+
+
+def _restrict_permissions() -> None:
+    """Make the ledger files readable by their owner only (0o600).
+
+    The ledger holds share links, names and notes. The database is created
+    with owner-only permissions before SQLite opens it, so the -wal and -shm
+    files SQLite creates next to it get the same mode; files left by older
+    versions are tightened as well.
+    """
+    os.close(os.open(ledger_file, os.O_RDWR | os.O_CREAT, 0o600))
+    for path in (ledger_file, Path(f"{ledger_file}-wal"), Path(f"{ledger_file}-shm")):
+        try:
+            os.chmod(path, 0o600)
+        except FileNotFoundError:
+            pass
+
+
+def _connect() -> "sqlite3.Connection":
+    """Open (or reuse) the ledger connection; the caller must hold _lock."""
+    global _connection, _connection_path
+    import sqlite3
+
+    if _connection is not None and _connection_path == ledger_file:
+        return _connection
+    if _connection is not None:
+        _connection.close()
+        _connection = None
+
+    ledger_file.parent.mkdir(parents=True, exist_ok=True)
+    _restrict_permissions()
+    # One connection is shared by the worker threads of bulk commands.
+    connection = sqlite3.connect(ledger_file, timeout=5, check_same_thread=False)
+    connection.row_factory = sqlite3.Row
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(_SCHEMA)
+    existing = {row[1] for row in connection.execute("PRAGMA table_info(pushes)")}
+    for column, column_type in _ADDED_COLUMNS:
+        if column not in existing:
+            connection.execute(f"ALTER TABLE pushes ADD COLUMN {column} {column_type}")
+    _connection, _connection_path = connection, ledger_file
+    return connection
+
+
+def close_ledger() -> None:
+    """Close the shared ledger connection (mainly for tests)."""
+    global _connection, _connection_path
+
+    with _lock:
+        if _connection is not None:
+            _connection.close()
+        _connection, _connection_path = None, None
+
+
+def _now() -> str:
+    """Return the current UTC time in the ledger's timestamp form."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _timestamp(value: Any) -> str | None:
+    """Return a timestamp in UTC 'Z' form (kept as is when unparseable)."""
+    text = _optional_str(value)
+    if text is None:
+        return None
+    try:
+        return utc_timestamp(text)
+    except ValueError:
+        return text
+
+
+def _optional_int(value: Any) -> int | None:
+    """Return value as an int, or None when it is missing or not numeric."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _optional_str(value: Any) -> str | None:
+    """Return value when it is a non-empty string, otherwise None."""
+    return value if isinstance(value, str) and value else None
+
+
+def record_push(created: dict[str, Any], payload: dict[str, Any], kind: str) -> None:
+    """Record a newly created push if the ledger is enabled.
+
+    Fields come from the create response, falling back to the request
+    payload for anything the server did not echo back.
+
+    Args:
+        created: The parsed create response (must contain url_token)
+        payload: The push attributes that were sent (legacy shape)
+        kind: The push kind (text, url, qr or file)
+    """
+    if not ledger_enabled():
+        return
+
+    url_token = _optional_str(created.get("url_token"))
+    if url_token is None:
+        return
+
+    def field(key: str) -> Any:
+        value = created.get(key)
+        return payload.get(key) if value is None else value
+
+    row = (
+        url_token,
+        _instance(),
+        _optional_str(field("name")),
+        _optional_str(field("note")),
+        kind,
+        _optional_int(field("expire_after_days")),
+        _optional_int(field("expire_after_views")),
+        _timestamp(created.get("created_at")) or _now(),
+    )
+    import sqlite3
+
+    try:
+        with _lock:
+            connection = _connect()
+            with connection:
+                connection.execute(
+                    "INSERT INTO pushes (url_token, instance, name, note, kind,"
+                    " expire_after_days, expire_after_views, created_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+                    " ON CONFLICT (url_token) DO UPDATE SET"
+                    " name = excluded.name, note = excluded.note,"
+                    " kind = excluded.kind,"
+                    " expire_after_days = excluded.expire_after_days,"
+                    " expire_after_views = excluded.expire_after_views",
+                    row,
+                )
+    except (OSError, sqlite3.Error):
+        pass
+
+
+def mark_expired(url_token: str) -> None:
+    """Note in the ledger that a push was expired (no-op when disabled)."""
+    if not ledger_enabled():
+        return
+    import sqlite3
+
+    try:
+        with _lock:
+            connection = _connect()
+            with connection:
+                connection.execute(
+                    "UPDATE pushes SET expired_at = ?"
+                    " WHERE url_token = ? AND expired_at IS NULL",
+                    (_now(), url_token),
+                )
+    except (OSError, sqlite3.Error):
+        pass
+
+
+def find_pushes(
+    query: str | None = None,
+    *,
+    name: str | None = None,
+    note: str | None = None,
+    include_expired: bool = False,
+    limit: int | None = 50,
+) -> list[dict[str, Any]]:
+    """Look up recorded pushes on the current instance, newest first.
+
+    Matching is a case-insensitive prefix match served by the name and note
+    indexes. `query` matches either field; `name` and `note` match only
+    their own field. All given filters must match.
+
+    Returns:
+        Matching ledger rows as dicts.
+
+    Raises:
+        sqlite3.Error: If the ledger cannot be read.
+    """
+    clauses = ["instance = ?"]
+    params: list[Any] = [_instance()]
+    if query:
+        clauses.append("((name >= ? AND name < ?) OR (note >= ? AND note < ?))")
+        params += [query, query + _PREFIX_END, query, query + _PREFIX_END]
+    if name:
+        clauses.append("name >= ? AND name < ?")
+        params += [name, name + _PREFIX_END]
+    if note:
+        clauses.append("note >= ? AND note < ?")
+        params += [note, note + _PREFIX_END]
+    if not include_expired:
+        clauses.append("expired_at IS NULL")
+
+    sql = (
+        f"SELECT {', '.join(_COLUMNS)} FROM pushes WHERE {' AND '.join(clauses)}"
+        " ORDER BY created_at DESC"
+    )
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+
+    with _lock:
+        rows = _connect().execute(sql, params).fetchall()
+    return [dict(row) for row in rows]
+
+
+def resolve_name(name: str) -> str:
+    """Return the url_token of the one unexpired push recorded under a name.
+
+    The match is exact but case-insensitive, and uses the name index, so
+    no request is made to the server.
+
+    Raises:
+        ValueError: If the ledger is disabled, or no push or more than one
+            push has this name.
+    """
+    if not ledger_enabled():
+        raise ValueError(
+            "The local ledger is disabled. Enable it with "
+            "'pwpush config set ledger true' to look up pushes by name."
+        )
+    import sqlite3
+
+    try:
+        with _lock:
+            rows = (
+                _connect()
+                .execute(
+                    "SELECT url_token FROM pushes WHERE instance = ? AND name = ?"
+                    " AND expired_at IS NULL LIMIT 6",
+                    (_instance(), name),
+                )
+                .fetchall()
+            )
+    except (OSError, sqlite3.Error) as e:
+        raise ValueError(f"Could not read the local ledger: {e}") from None
+
+    if not rows:
+        raise ValueError(f"No active push named '{name}' in the local ledger.")
+    if len(rows) > 1:
+        tokens = ", ".join(row["url_token"] for row in rows[:5])
+        raise ValueError(
+            f"Several active pushes are named '{name}' ({tokens}). "
+            "Pass the url_token instead."
+        )
+    return str(rows[0]["url_token"])
+
+
+def clear_ledger() -> bool:
+    """Delete the ledger database.
+
+    Returns:
+        True if a ledger file was removed.
+    """
+    close_ledger()
+    removed = False
+    for path in (
+        ledger_file,
+        ledger_file.with_name(ledger_file.name + "-wal"),
+        ledger_file.with_name(ledger_file.name + "-shm"),
+    ):
+        try:
+            path.unlink()
+            removed = removed or path == ledger_file
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+def get_sync_state(list_name: str) -> dict[str, Any] | None:
+    """Return what the last sync stored for the active or expired list.
+
+    Raises:
+        sqlite3.Error: If the ledger cannot be read.
+    """
+    with _lock:
+        row = (
+            _connect()
+            .execute(
+                "SELECT etag, last_modified, pages, synced_at FROM sync_state"
+                " WHERE instance = ? AND list = ?",
+                (_instance(), list_name),
+            )
+            .fetchone()
+        )
+    return dict(row) if row is not None else None
+
+
+def save_sync_state(
+    list_name: str,
+    *,
+    etag: str | None,
+    last_modified: str | None,
+    pages: int,
+    synced_at: str,
+) -> None:
+    """Store the validators and page count seen for a list by a sync.
+
+    Raises:
+        sqlite3.Error: If the ledger cannot be written.
+    """
+    with _lock:
+        connection = _connect()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO sync_state"
+                " (instance, list, etag, last_modified, pages, synced_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (_instance(), list_name, etag, last_modified, pages, synced_at),
+            )
+
+
+def apply_server_pushes(
+    pushes: list[dict[str, Any]], *, expired: bool, synced_at: str
+) -> dict[str, int]:
+    """Upsert one page of server pushes and count how the ledger changed.
+
+    Args:
+        pushes: Push objects from the active or expired list
+        expired: Whether the pushes come from the expired list
+        synced_at: Timestamp of the running sync
+
+    Returns:
+        Counts of pushes "added" to the ledger, newly "expired", and
+        otherwise "changed" (e.g. views consumed).
+
+    Raises:
+        sqlite3.Error: If the ledger cannot be written.
+    """
+    counts = {"added": 0, "expired": 0, "changed": 0}
+    pushes = [
+        push
+        for push in pushes
+        if isinstance(push, dict) and _optional_str(push.get("url_token"))
+    ]
+    if not pushes:
+        return counts
+
+    instance = _instance()
+    rows = []
+    for push in pushes:
+        expired_at = None
+        if expired:
+            expired_at = _timestamp(push.get("expired_on")) or synced_at
+        rows.append(
+            (
+                push["url_token"],
+                instance,
+                _optional_str(push.get("name")),
+                _optional_str(push.get("note")),
+                _optional_str(push.get("kind")) or "text",
+                _optional_int(push.get("expire_after_days")),
+                _optional_int(push.get("expire_after_views")),
+                _timestamp(push.get("created_at")) or synced_at,
+                expired_at,
+                _optional_int(push.get("views_remaining")),
+                _optional_int(push.get("days_remaining")),
+                synced_at,
+            )
+        )
+
+    tokens = [row[0] for row in rows]
+    with _lock:
+        connection = _connect()
+        with connection:
+            placeholders = ", ".join("?" for _ in tokens)
+            known = {
+                row["url_token"]: row
+                for row in connection.execute(
+                    "SELECT url_token, expired_at, views_remaining, days_remaining"
+                    f" FROM pushes WHERE url_token IN ({placeholders})",
+                    tokens,
+                )
+            }
+            for row in rows:
+                previous = known.get(row[0])
+                if previous is None:
+                    counts["added"] += 1
+                elif expired and previous["expired_at"] is None:
+                    counts["expired"] += 1
+                elif (previous["views_remaining"], previous["days_remaining"]) != (
+                    row[9],
+                    row[10],
+                ):
+                    counts["changed"] += 1
+            connection.executemany(
+                "INSERT INTO pushes (url_token, instance, name, note, kind,"
+                " expire_after_days, expire_after_views, created_at, expired_at,"
+                " views_remaining, days_remaining, synced_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (url_token) DO UPDATE SET"
+                " name = COALESCE(excluded.name, name),"
+                " note = COALESCE(excluded.note, note),"
+                " expired_at = COALESCE(expired_at, excluded.expired_at),"
+                " views_remaining = excluded.views_remaining,"
+                " days_remaining = excluded.days_remaining,"
+                " synced_at = excluded.synced_at",
+                rows,
+            )
+    return counts
+
+
+def _created_before(created_at: str, cutoff: datetime) -> bool:
+    """Check whether a stored creation time is before cutoff."""
+    try:
+        return parse_timestamp(created_at) < cutoff
+    except ValueError:
+        return False
+
+
+def expire_missing_pushes(active_tokens: set[str], *, started_at: str) -> int:
+    """Mark pushes the server no longer lists as active as expired.
+
+    Only pushes created before the sync started are considered, so a push
+    created while the list was being fetched is not mistaken for expired.
+
+    Returns:
+        The number of pushes newly marked as expired.
+
+    Raises:
+        sqlite3.Error: If the ledger cannot be written.
+    """
+    with _lock:
+        connection = _connect()
+        with connection:
+            connection.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS sync_seen"
+                " (url_token TEXT PRIMARY KEY)"
+            )
+            connection.execute("DELETE FROM sync_seen")
+            connection.executemany(
+                "INSERT OR IGNORE INTO sync_seen VALUES (?)",
+                ((token,) for token in active_tokens),
+            )
+            candidates = connection.execute(
+                "SELECT url_token, created_at FROM pushes"
+                " WHERE instance = ? AND expired_at IS NULL"
+                " AND url_token NOT IN (SELECT url_token FROM sync_seen)",
+                (_instance(),),
+            ).fetchall()
+            # Compared as times, not strings: rows written by older versions
+            # use +00:00 offsets and the server may send fractional seconds.
+            cutoff = parse_timestamp(started_at)
+            stale = [
+                row["url_token"]
+                for row in candidates
+                if _created_before(row["created_at"], cutoff)
+            ]
+            connection.executemany(
+                "UPDATE pushes SET expired_at = ?, synced_at = ? WHERE url_token = ?",
+                ((started_at, started_at, token) for token in stale),
+            )
+            return len(stale)
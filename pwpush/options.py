@@ -2,6 +2,7 @@ from typing import Any
 
 import configparser
 import os
+import threading
 from pathlib import Path
 
 import typer
@@ -11,6 +12,8 @@ from pwpush.utils import parse_boolean
 user_config = configparser.ConfigParser()
 user_config_dir = Path(typer.get_app_dir("pwpush"))
 user_config_file = user_config_dir.joinpath("config.ini")
+# Held while user_config is changed from a worker thread and while it is saved
+config_lock = threading.RLock()
 
 cli_options = {
     "json": False,
@@ -19,6 +22,9 @@ cli_options = {
     "debug": False,
     "insecure": False,
 }
+# Retry settings given on the command line for this invocation; they take
+# precedence over the [cli] retry settings in config.ini.
+retry_overrides: dict[str, str] = {}
 default_config: dict[str, dict[str, Any]] = {"instance": {}}
 default_config["instance"]["url"] = "https://eu.pwpush.com"
 default_config["instance"]["email"] = "Not Set"
@@ -26,6 +32,8 @@ default_config["instance"]["token"] = "Not Set"
 default_config["instance"]["api_profile"] = "Not Set"
 default_config["instance"]["api_profile_checked_at"] = "0"
 default_config["instance"]["api_profile_ttl_seconds"] = "3600"
+default_config["instance"]["api_profile_background_refresh"] = "False"
+default_config["instance"]["api_profile_speculative"] = "False"
 default_config["instance"]["account_id"] = "Not Set"
 
 default_config["expiration"] = {
@@ -39,6 +47,18 @@ default_config["cli"] = {
     "verbose": "False",
     "pretty": "False",
     "debug": "False",
+    "pool_size": "10",
+    "skip_preview": "False",
+    "ledger": "False",
+    "rate_limit": "0",
+    "rate_burst": "5",
+    "max_concurrency": "16",
+    "max_retries": "3",
+    "retry_statuses": "429,502,503,504",
+    "retry_methods": "idempotent",
+    "retry_budget": "0",
+    "retry_deadline": "0",
+    "retry_jitter": "decorrelated",
 }
 
 default_config["pro"] = {
@@ -69,6 +89,14 @@ def load_config() -> None:
         user_config.read_dict(default_config)
 
 
+def ensure_config_loaded() -> None:
+    """
+    Load the configuration on first use unless it is already populated.
+    """
+    if not user_config.sections():
+        load_config()
+
+
 def validate_user_config() -> bool:
     """
     Validate `user_config` and assure that all default keys are set
@@ -102,11 +130,23 @@ def save_config() -> None:
     """
     Save `user_config` out to file with restricted permissions (owner read/write only).
     """
-    user_config_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(user_config_file, "w") as file:
-        user_config.write(file)
-    # Restrict permissions to owner read/write only (0o600) to protect API tokens
-    os.chmod(user_config_file, 0o600)
+    with config_lock:
+        user_config_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(user_config_file, "w") as file:
+            user_config.write(file)
+        # Restrict permissions to owner read/write only (0o600) to protect API tokens
+        os.chmod(user_config_file, 0o600)
+
+
+def expiration_defaults() -> dict[str, str]:
+    """
+    Return the configured expiration settings, leaving out those not set.
+    """
+    return {
+        key: value
+        for key, value in user_config["expiration"].items()
+        if value != "Not Set"
+    }
 
 
 def json_output() -> bool:
@@ -128,6 +168,3 @@ def debug_output() -> bool:
     Determines whether we should provide debug output.
     """
     return cli_options["debug"] or parse_boolean(user_config["cli"]["debug"])
-
-
-load_config()
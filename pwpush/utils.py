@@ -1,11 +1,55 @@
 """Utility functions for the pwpush CLI."""
 
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator, TypeVar
 
+import functools
+import hashlib
+import itertools
+import os
+import re
 import secrets
 import string
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
-from xkcdpass.xkcd_password import generate_wordlist, generate_xkcdpassword
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Word filter used for generated passphrases
+PASSPHRASE_MIN_WORD_LENGTH = 5
+PASSPHRASE_MAX_WORD_LENGTH = 9
+PASSPHRASE_VALID_CHARS = "[a-zA-Z1-9]"
+
+
+def app_dir() -> Path:
+    """Return the pwpush config folder, as typer.get_app_dir("pwpush") does.
+
+    Worked out here so library modules can find their cache files without
+    importing typer.
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("APPDATA") or os.path.expanduser("~")
+        return Path(base, "pwpush")
+    if sys.platform == "darwin":
+        return Path(os.path.expanduser("~/Library/Application Support"), "pwpush")
+    base = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+    return Path(base, "pwpush")
+
+
+def rprint(*objects: Any, **kwargs: Any) -> None:
+    """Print with rich markup, importing rich only when something is printed."""
+    from rich import print as rich_print
+
+    rich_print(*objects, **kwargs)
+
+
+wordlist_cache_dir = app_dir()
+
+_wordlist: list[str] | None = None
+_wordlist_lock = threading.Lock()
 
 
 def mask_sensitive_value(value: str, visible_chars: int = 4) -> str:
@@ -88,6 +132,96 @@ def check_secret_conditions(
     return all(conditions)
 
 
+def _wordlist_cache_file() -> Path | None:
+    """Return the on-disk wordlist cache path for the installed xkcdpass.
+
+    The name carries the xkcdpass version and a digest of the word filter, so
+    upgrading xkcdpass or changing the filter starts a fresh cache. Returns
+    None when the xkcdpass version cannot be determined.
+    """
+    from importlib import metadata as importlib_metadata
+
+    try:
+        xkcdpass_version = importlib_metadata.version("xkcdpass")
+    except importlib_metadata.PackageNotFoundError:
+        return None
+
+    word_filter = (
+        f"{PASSPHRASE_MIN_WORD_LENGTH}:{PASSPHRASE_MAX_WORD_LENGTH}:"
+        f"{PASSPHRASE_VALID_CHARS}"
+    )
+    digest = hashlib.sha256(word_filter.encode("utf-8")).hexdigest()[:12]
+    return wordlist_cache_dir.joinpath(f"wordlist-{xkcdpass_version}-{digest}.txt")
+
+
+def _load_cached_wordlist(cache_file: Path) -> list[str] | None:
+    """Read a cached wordlist (one word per line), or None if unusable."""
+    try:
+        words = cache_file.read_text(encoding="utf-8").split("\n")
+    except (OSError, UnicodeDecodeError):
+        return None
+    words = [word for word in words if word]
+    return words or None
+
+
+def _store_cached_wordlist(cache_file: Path, words: list[str]) -> None:
+    """Write the wordlist cache atomically (best effort)."""
+    temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file.write_text("\n".join(words), encoding="utf-8")
+        os.replace(temp_file, cache_file)
+    except OSError:
+        try:
+            temp_file.unlink()
+        except OSError:
+            pass
+
+
+def passphrase_wordlist() -> list[str]:
+    """Return the filtered xkcdpass wordlist used for passphrases.
+
+    The full word file is read and filtered at most once per xkcdpass
+    version: the result is kept in memory for the rest of the process and in
+    a compact one-word-per-line file under the app dir for later runs.
+
+    Returns:
+        list[str]: Sorted words matching the passphrase word filter
+    """
+    global _wordlist
+
+    with _wordlist_lock:
+        if _wordlist is not None:
+            return _wordlist
+
+        cache_file = _wordlist_cache_file()
+        words = _load_cached_wordlist(cache_file) if cache_file else None
+        if words is None:
+            from xkcdpass.xkcd_password import generate_wordlist
+
+            words = sorted(
+                generate_wordlist(
+                    wordfile=None,
+                    min_length=PASSPHRASE_MIN_WORD_LENGTH,
+                    max_length=PASSPHRASE_MAX_WORD_LENGTH,
+                    valid_chars=PASSPHRASE_VALID_CHARS,
+                )
+            )
+            if cache_file is not None:
+                _store_cached_wordlist(cache_file, words)
+
+        _wordlist = words
+        return words
+
+
+def clear_wordlist_cache() -> None:
+    """Forget the in-memory wordlist (mainly for tests)."""
+    global _wordlist
+
+    with _wordlist_lock:
+        _wordlist = None
+
+
 def generate_passphrase(length: int = 5) -> str:
     """Generate a passphrase using xkcdpass.
 
@@ -97,12 +231,11 @@ def generate_passphrase(length: int = 5) -> str:
     Returns:
         str: A randomly generated passphrase
     """
-    wordlist = generate_wordlist(
-        wordfile=None, min_length=5, max_length=9, valid_chars="[a-zA-Z1-9]"
-    )
+    from xkcdpass.xkcd_password import generate_xkcdpassword
+
     return str(
         generate_xkcdpassword(
-            wordlist,
+            passphrase_wordlist(),
             interactive=False,
             numwords=length,
             acrostic=False,
@@ -113,6 +246,124 @@ def generate_passphrase(length: int = 5) -> str:
     )
 
 
+# Every generated secret contains at least one character from each class.
+SECRET_CHARACTER_CLASSES = (
+    string.ascii_lowercase,
+    string.ascii_uppercase,
+    string.digits,
+    string.punctuation,
+)
+
+# Secrets generated per bulk random draw in generate_secrets().
+SECRET_DRAW_BATCH = 256
+
+
+@functools.lru_cache(maxsize=32)
+def _secret_completion_counts(length: int) -> tuple[tuple[int, ...], ...]:
+    """Count valid completions for every (missing classes, remaining length).
+
+    counts[mask][n] is the number of strings of n characters over the full
+    alphabet that contain at least one character from each class whose bit is
+    set in mask, by inclusion-exclusion over the classes left out.
+    """
+    sizes = [len(chars) for chars in SECRET_CHARACTER_CLASSES]
+    alphabet_size = sum(sizes)
+    counts = []
+    for mask in range(1 << len(sizes)):
+        row = []
+        for n in range(length + 1):
+            total = 0
+            subset = mask
+            while True:
+                excluded = sum(size for k, size in enumerate(sizes) if subset >> k & 1)
+                sign = -1 if bin(subset).count("1") % 2 else 1
+                total += sign * (alphabet_size - excluded) ** n
+                if subset == 0:
+                    break
+                subset = (subset - 1) & mask
+            row.append(total)
+        counts.append(tuple(row))
+    return tuple(counts)
+
+
+def count_valid_secrets(length: int) -> int:
+    """Return how many strings of this length contain every character class."""
+    full_mask = (1 << len(SECRET_CHARACTER_CLASSES)) - 1
+    return _secret_completion_counts(length)[full_mask][length]
+
+
+def unrank_secret(rank: int, length: int) -> str:
+    """Map an integer in [0, count_valid_secrets(length)) to its secret.
+
+    The mapping is a bijection onto the strings that contain every character
+    class, so a uniformly random rank yields a uniformly random valid secret
+    without ever building (and discarding) an invalid one. Each position
+    picks the class block the rank falls into, weighted by how many valid
+    completions remain; once every class has appeared the rest of the rank is
+    read off directly as base-N digits of the full alphabet.
+    """
+    counts = _secret_completion_counts(length)
+    alphabet = "".join(SECRET_CHARACTER_CLASSES)
+    mask = (1 << len(SECRET_CHARACTER_CLASSES)) - 1
+    chars: list[str] = []
+    for remaining in range(length, 0, -1):
+        if mask == 0:
+            for _ in range(remaining):
+                rank, index = divmod(rank, len(alphabet))
+                chars.append(alphabet[index])
+            break
+        for k, class_chars in enumerate(SECRET_CHARACTER_CLASSES):
+            rest_mask = mask & ~(1 << k)
+            block = counts[rest_mask][remaining - 1]
+            block_size = len(class_chars) * block
+            if rank < block_size:
+                index, rank = divmod(rank, block)
+                chars.append(class_chars[index])
+                mask = rest_mask
+                break
+            rank -= block_size
+    return "".join(chars)
+
+
+def generate_secrets(count: int, length: int = 50) -> Iterator[str]:
+    """Yield `count` secure random secrets, each containing every class.
+
+    Secrets are uniformly distributed over all strings of the given length
+    that contain a lowercase letter, an uppercase letter, a digit and a
+    punctuation character. Randomness comes from one secrets.token_bytes
+    draw per batch of secrets; each secret reads 8 more bytes than its rank
+    needs, so a value is redrawn with probability below 2**-64.
+
+    Args:
+        count: Number of secrets to generate
+        length: Length of each secret (default: 50)
+
+    Yields:
+        str: Randomly generated secure secrets
+
+    Raises:
+        ValueError: If length is too short to hold every character class.
+    """
+    total = count_valid_secrets(length) if length > 0 else 0
+    if total == 0:
+        raise ValueError(
+            f"Secret length must be at least {len(SECRET_CHARACTER_CLASSES)}."
+        )
+
+    width = (total.bit_length() + 7) // 8 + 8
+    limit = (1 << (8 * width)) // total * total
+    remaining = count
+    while remaining > 0:
+        batch = min(remaining, SECRET_DRAW_BATCH)
+        pool = secrets.token_bytes(batch * width)
+        for offset in range(0, batch * width, width):
+            value = int.from_bytes(pool[offset : offset + width], "big")
+            while value >= limit:
+                value = int.from_bytes(secrets.token_bytes(width), "big")
+            yield unrank_secret(value % total, length)
+        remaining -= batch
+
+
 def generate_secret(length: int = 50) -> str:
     """Generate a secure random password.
 
@@ -123,12 +374,178 @@ def generate_secret(length: int = 50) -> str:
         str: A randomly generated secure password
 
     Raises:
-        RuntimeError: If unable to generate a valid secret after maximum attempts.
+        ValueError: If length is too short to hold every character class.
+    """
+    return next(generate_secrets(1, length))
+
+
+def map_bounded(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    concurrency: int = 4,
+    *,
+    limit: Callable[[], int] | None = None,
+) -> Iterator[tuple[T, R]]:
+    """Apply func to items on a thread pool, yielding results as they finish.
+
+    At most `concurrency` calls are in flight at once and items are consumed
+    lazily, so arbitrarily long inputs are processed with bounded memory.
+
+    Args:
+        func: Function to call for each item
+        items: Input items (any iterable, including generators)
+        concurrency: Maximum number of concurrent calls (minimum 1)
+        limit: Optional callable giving the current number of calls allowed
+            in flight, checked whenever a call is started; it is clamped to
+            between 1 and `concurrency`
+
+    Yields:
+        tuple[T, R]: Each item with its result, in completion order
+    """
+    concurrency = max(concurrency, 1)
+    iterator = iter(items)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending: dict[Future[R], T] = {}
+
+        def fill() -> None:
+            allowed = (
+                concurrency if limit is None else min(max(limit(), 1), concurrency)
+            )
+            for item in itertools.islice(iterator, max(allowed - len(pending), 0)):
+                pending[executor.submit(func, item)] = item
+
+        fill()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                fill()
+                yield item, future.result()
+
+
+# How timestamps are shown in list and audit tables
+TIMESTAMP_DISPLAY_FORMAT = "%m/%d/%Y, %H:%M:%S UTC"
+
+# Distinct timestamp strings remembered by the parse and format caches
+TIMESTAMP_CACHE_SIZE = 4096
+
+# The fixed RFC 3339 shape the server sends, e.g. 2024-01-15T10:30:00.123Z
+_RFC3339_TIMESTAMP = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[Tt ](\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,9}))?"
+    r"(?:([Zz])|([+-])(\d{2}):?(\d{2}))?"
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _utc_offset(sign: str, hours: str, minutes: str) -> timezone:
+    """Return the fixed-offset timezone for a +HH:MM / -HH:MM suffix."""
+    offset = timedelta(hours=int(hours), minutes=int(minutes))
+    return timezone(-offset if sign == "-" else offset)
+
+
+def _parse_rfc3339(value: str) -> datetime | None:
+    """Parse the server's RFC 3339 shape, or return None for anything else."""
+    match = _RFC3339_TIMESTAMP.fullmatch(value)
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, fraction, zulu, sign, oh, om = (
+        match.groups()
+    )
+    tzinfo = None
+    if zulu:
+        tzinfo = timezone.utc
+    elif sign:
+        tzinfo = _utc_offset(sign, oh, om)
+    try:
+        return datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour),
+            int(minute),
+            int(second),
+            int(fraction[:6].ljust(6, "0")) if fraction else 0,
+            tzinfo=tzinfo,
+        )
+    except ValueError:
+        # Out-of-range fields (e.g. 24:00:00) are left to dateutil.
+        return None
+
+
+def _utc_fields(value: str) -> tuple[str, ...] | None:
+    """Return the matched digits of an in-range RFC 3339 UTC timestamp.
+
+    Returns None for other offsets, other shapes and out-of-range fields
+    (month 13, hour 24, ...), which are left to parse_timestamp.
+    """
+    match = _RFC3339_TIMESTAMP.fullmatch(value)
+    if match is None or match.group(9) is not None:
+        return None
+    fields = match.groups()[:7]
+    year, month, day, hour, minute, second = (int(field) for field in fields[:6])
+    try:
+        datetime(year, month, day, hour, minute, second)
+    except ValueError:
+        return None
+    return fields
+
+
+@functools.lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def parse_timestamp(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp into an aware UTC datetime.
+
+    The RFC 3339 form the server emits is parsed with a precompiled regular
+    expression; anything else falls back to dateutil's isoparse. Timestamps
+    without an offset are taken to be UTC. Results are cached, since list
+    and audit output repeat the same values often.
+
+    Args:
+        value: The timestamp string
+
+    Returns:
+        datetime: The timestamp converted to UTC
+
+    Raises:
+        ValueError: If the value is not a valid ISO-8601 timestamp.
+    """
+    when = _parse_rfc3339(value)
+    if when is None:
+        from dateutil import parser
+
+        when = parser.isoparse(value)
+
+    if when.tzinfo is None:
+        return when.replace(tzinfo=timezone.utc)
+    return when.astimezone(timezone.utc)
+
+
+@functools.lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def format_timestamp(value: str) -> str:
+    """Format an ISO-8601 timestamp for display, e.g. '01/15/2024, 10:30:00 UTC'.
+
+    Raises:
+        ValueError: If the value is not a valid ISO-8601 timestamp.
+    """
+    fields = _utc_fields(value)
+    if fields is not None:
+        # Already UTC: the display fields are the matched digits.
+        year, month, day, hour, minute, second, _ = fields
+        return f"{month}/{day}/{year}, {hour}:{minute}:{second} UTC"
+    return parse_timestamp(value).strftime(TIMESTAMP_DISPLAY_FORMAT)
+
+
+@functools.lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def utc_timestamp(value: str) -> str:
+    """Normalize an ISO-8601 timestamp to a sortable UTC form ending in 'Z'.
+
+    Raises:
+        ValueError: If the value is not a valid ISO-8601 timestamp.
     """
-    characters = string.ascii_letters + string.digits + string.punctuation
-    max_attempts = 1000
-    for _ in range(max_attempts):
-        secret = "".join(secrets.choice(characters) for _ in range(length))
-        if check_secret_conditions(secret, length=length):
-            return secret
-    raise RuntimeError(f"Failed to generate valid secret after {max_attempts} attempts")
+    fields = _utc_fields(value)
+    if fields is not None:
+        # Already UTC: rebuild datetime.isoformat() output from the digits.
+        year, month, day, hour, minute, second, fraction = fields
+        micros = fraction[:6].ljust(6, "0") if fraction else ""
+        suffix = f".{micros}" if micros.strip("0") else ""
+        return f"{year}-{month}-{day}T{hour}:{minute}:{second}{suffix}Z"
+    return parse_timestamp(value).replace(tzinfo=None).isoformat() + "Z"
@@ -1,7 +1,12 @@
 """Pytest configuration and global fixtures."""
 
+from typing import Any
+
+from unittest.mock import MagicMock, patch
+
 import pytest
 
+from pwpush.ledger import close_ledger
 from pwpush.options import default_config, load_config, user_config
 
 
@@ -19,6 +24,18 @@ def isolate_config_file(monkeypatch, tmp_path):
     monkeypatch.setattr("pwpush.options.user_config_file", config_file)
     monkeypatch.setattr("pwpush.commands.config.user_config_file", config_file)
     monkeypatch.setattr("pwpush.config_wizard.user_config_file", config_file)
+    monkeypatch.setattr("pwpush.commands.serve.user_config_file", config_file)
+    monkeypatch.setattr(
+        "pwpush.api.capabilities.discovery_cache_file", tmp_path / "discovery.json"
+    )
+    monkeypatch.setattr("pwpush.utils.wordlist_cache_dir", tmp_path)
+    monkeypatch.setattr("pwpush.ledger.ledger_file", tmp_path / "ledger.db")
+    monkeypatch.setattr(
+        "pwpush.api.ratelimit.rate_limit_file", tmp_path / "ratelimit.json"
+    )
+    monkeypatch.setattr(
+        "pwpush.api.concurrency.concurrency_file", tmp_path / "concurrency.json"
+    )
 
     # Clear and reload the config with defaults to ensure clean state
     user_config.clear()
@@ -26,4 +43,30 @@ def isolate_config_file(monkeypatch, tmp_path):
 
     yield config_file
 
+    close_ledger()
+
     # Cleanup: the tmp_path will be automatically cleaned up by pytest
+
+
+@pytest.fixture
+def fake_server():
+    """Serve {path: (status, body, headers)} from a dict filled by each test.
+
+    make_request is patched to answer from the dict (404 for unknown paths)
+    with the v2 API profile. Yields the dict and the make_request mock.
+    """
+    served: dict[str, tuple[int, Any, dict[str, str]]] = {}
+
+    def fake_make_request(method, path, **kwargs):
+        status, body, headers = served.get(path, (404, {}, {}))
+        response = MagicMock()
+        response.status_code = status
+        response.json.return_value = body
+        response.headers = headers
+        return response
+
+    with (
+        patch("pwpush.__main__.current_api_profile", return_value="v2"),
+        patch("pwpush.__main__.make_request", side_effect=fake_make_request) as mock,
+    ):
+        yield served, mock
@@ -8,16 +8,18 @@ from pwpush.api.capabilities import (
     API_PROFILE_LEGACY,
     API_PROFILE_V2,
     clear_capabilities_cache,
+    clear_discovery_cache,
     clear_profile_cache,
     detect_api_capabilities,
     detect_api_profile,
+    discover_instance,
     requests_enabled,
 )
 
 
 def test_detect_api_profile_prefers_v2_when_version_endpoint_exists() -> None:
     clear_profile_cache()
-    with patch("pwpush.api.capabilities.requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         response = MagicMock()
         response.status_code = 200
         mock_get.return_value = response
@@ -33,7 +35,7 @@ def test_detect_api_profile_prefers_v2_when_version_endpoint_exists() -> None:
 
 def test_detect_api_profile_falls_back_to_legacy_when_version_missing() -> None:
     clear_profile_cache()
-    with patch("pwpush.api.capabilities.requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         response = MagicMock()
         response.status_code = 404
         mock_get.return_value = response
@@ -49,7 +51,7 @@ def test_detect_api_profile_falls_back_to_legacy_when_version_missing() -> None:
 
 def test_detect_api_profile_caches_results_per_base_url() -> None:
     clear_profile_cache()
-    with patch("pwpush.api.capabilities.requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         response = MagicMock()
         response.status_code = 200
         mock_get.return_value = response
@@ -72,7 +74,7 @@ def test_detect_api_profile_caches_results_per_base_url() -> None:
 
 def test_detect_api_profile_uses_bearer_token_without_email() -> None:
     clear_profile_cache()
-    with patch("pwpush.api.capabilities.requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         response = MagicMock()
         response.status_code = 200
         mock_get.return_value = response
@@ -260,7 +262,7 @@ def test_request_email_notifications_enabled_old_api() -> None:
 def test_detect_api_capabilities_returns_version_and_features() -> None:
     """Test detect_api_capabilities returns version and features."""
     clear_capabilities_cache()
-    with patch("pwpush.api.capabilities.requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         response = MagicMock()
         response.status_code = 200
         response.json.return_value = {
@@ -283,7 +285,7 @@ def test_detect_api_capabilities_returns_version_and_features() -> None:
 def test_detect_api_capabilities_caches_results() -> None:
     """Test detect_api_capabilities caches results per base_url."""
     clear_capabilities_cache()
-    with patch("pwpush.api.capabilities.requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         response = MagicMock()
         response.status_code = 200
         response.json.return_value = {"api_version": "2.1.0", "features": {}}
@@ -308,7 +310,7 @@ def test_detect_api_capabilities_caches_results() -> None:
 def test_detect_api_capabilities_returns_empty_on_404() -> None:
     """Test detect_api_capabilities returns empty features on 404."""
     clear_capabilities_cache()
-    with patch("pwpush.api.capabilities.requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         response = MagicMock()
         response.status_code = 404
         mock_get.return_value = response
@@ -321,3 +323,186 @@ def test_detect_api_capabilities_returns_empty_on_404() -> None:
 
         assert capabilities["api_version"] is None
         assert capabilities["features"] == {}
+
+
+def test_profile_and_capabilities_share_one_version_probe() -> None:
+    """Test profile and capability detection reuse a single /api/v2/version probe."""
+    clear_discovery_cache()
+    with patch("requests.Session.get") as mock_get:
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = {
+            "api_version": "2.1.0",
+            "edition": "commercial",
+            "features": {"requests": {"enabled": True}},
+        }
+        mock_get.return_value = response
+
+        profile = detect_api_profile(
+            base_url="https://example.test",
+            email="Not Set",
+            token="Not Set",
+        )
+        capabilities = detect_api_capabilities(
+            base_url="https://example.test",
+            email="Not Set",
+            token="Not Set",
+        )
+
+        assert profile == API_PROFILE_V2
+        assert requests_enabled(capabilities) is True
+        assert mock_get.call_count == 1
+
+
+def test_discover_instance_tolerates_non_json_version_body() -> None:
+    """Test a 200 response without a JSON body still selects the v2 profile."""
+    clear_discovery_cache()
+    with patch("requests.Session.get") as mock_get:
+        response = MagicMock()
+        response.status_code = 200
+        response.json.side_effect = ValueError("not json")
+        mock_get.return_value = response
+
+        discovery = discover_instance(
+            base_url="https://example.test",
+            email="Not Set",
+            token="Not Set",
+        )
+
+        assert discovery["profile"] == API_PROFILE_V2
+        assert discovery["capabilities"]["api_version"] is None
+
+
+# Tests for the persistent discovery cache
+
+
+def _version_response(
+    status_code: int, headers: dict[str, str] | None = None
+) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = {"api_version": "2.1.0", "features": {}}
+    return response
+
+
+def test_discover_instance_skips_probe_when_persisted_entry_is_fresh() -> None:
+    """Test a fresh on-disk entry is used without contacting the server."""
+    clear_discovery_cache()
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value = _version_response(200, {"ETag": '"v1"'})
+        discover_instance(
+            base_url="https://example.test",
+            email="Not Set",
+            token="Not Set",
+            ttl_seconds=3600,
+        )
+
+    # Simulate a new process: only the on-disk cache survives.
+    clear_discovery_cache()
+    with patch("requests.Session.get") as mock_get:
+        capabilities = detect_api_capabilities(
+            base_url="https://example.test",
+            email="Not Set",
+            token="Not Set",
+            ttl_seconds=3600,
+        )
+        mock_get.assert_not_called()
+
+    assert capabilities["api_version"] == "2.1.0"
+
+
+def test_discover_instance_expires_in_memory_entries_after_ttl() -> None:
+    """Test a long-lived process re-probes once its cached entry is stale."""
+    clear_discovery_cache()
+    with (
+        patch("requests.Session.get") as mock_get,
+        patch("pwpush.api.capabilities.time.time") as mock_time,
+    ):
+        mock_get.return_value = _version_response(200)
+        mock_time.return_value = 1_000_000.0
+        discover_instance(
+            base_url="https://example.test",
+            email="Not Set",
+            token="Not Set",
+            ttl_seconds=60,
+        )
+        mock_time.return_value += 30
+        discover_instance(
+            base_url="https://example.test",
+            email="Not Set",
+            token="Not Set",
+            ttl_seconds=60,
+        )
+        assert mock_get.call_count == 1
+
+        mock_get.return_value = _version_response(404)
+        mock_time.return_value += 60
+        profile = detect_api_profile(
+            base_url="https://example.test",
+            email="Not Set",
+            token="Not Set",
+            ttl_seconds=60,
+        )
+
+    assert mock_get.call_count == 2
+    assert profile == API_PROFILE_LEGACY
+
+
+def test_discover_instance_revalidates_stale_entry_with_etag() -> None:
+    """Test a stale entry is revalidated conditionally and reused on 304."""
+    clear_discovery_cache()
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value = _version_response(
+            200,
+            {"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2026 07:28:00 GMT"},
+        )
+        discover_instance(
+            base_url="https://example.test",
+            email="Not Set",
+            token="Not Set",
+            ttl_seconds=3600,
+        )
+
+    clear_discovery_cache()
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value = _version_response(304)
+        discovery = discover_instance(
+            base_url="https://example.test",
+            email="Not Set",
+            token="Not Set",
+            ttl_seconds=0,
+        )
+
+        headers = mock_get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == "Wed, 21 Oct 2026 07:28:00 GMT"
+
+    assert discovery["profile"] == API_PROFILE_V2
+    assert discovery["capabilities"]["api_version"] == "2.1.0"
+
+
+def test_discover_instance_does_not_persist_transient_failures() -> None:
+    """Test server errors are not written to the on-disk cache."""
+    clear_discovery_cache()
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value = _version_response(503)
+        discover_instance(
+            base_url="https://example.test",
+            email="Not Set",
+            token="Not Set",
+            ttl_seconds=3600,
+        )
+
+    clear_discovery_cache()
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value = _version_response(200)
+        profile = detect_api_profile(
+            base_url="https://example.test",
+            email="Not Set",
+            token="Not Set",
+            ttl_seconds=3600,
+        )
+        mock_get.assert_called_once()
+
+    assert profile == API_PROFILE_V2
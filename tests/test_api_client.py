@@ -1,6 +1,19 @@
 """Tests for API client functionality."""
 
-from pwpush.api.client import build_auth_headers
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from requests.adapters import HTTPAdapter
+from urllib3 import encode_multipart_formdata
+
+from pwpush.api.client import (
+    _sessions,
+    build_auth_headers,
+    close_sessions,
+    get_session,
+    send_request,
+)
+from pwpush.api.multipart import MultipartStream
 
 
 def test_build_auth_headers_uses_bearer_token_without_email() -> None:
@@ -15,3 +28,128 @@ def test_build_auth_headers_includes_legacy_headers_when_email_is_set() -> None:
         "X-User-Email": "user@example.test",
         "X-User-Token": "test-token",
     }
+
+
+def test_get_session_reuses_session_per_base_url() -> None:
+    close_sessions()
+    try:
+        first = get_session("https://example.test/")
+        second = get_session("https://example.test")
+        other = get_session("https://other.test")
+
+        assert first is second
+        assert first is not other
+    finally:
+        close_sessions()
+
+
+def test_get_session_mounts_pool_with_configured_size() -> None:
+    close_sessions()
+    try:
+        session = get_session("https://example.test", pool_size=4)
+        adapter = session.get_adapter("https://example.test/api/v2/pushes")
+
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 4
+    finally:
+        close_sessions()
+
+
+def test_send_request_uses_pooled_session() -> None:
+    close_sessions()
+    try:
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value = MagicMock(status_code=200)
+            send_request(
+                "GET",
+                base_url="https://example.test",
+                path="/api/v2/version",
+                email="Not Set",
+                token="Not Set",
+            )
+            send_request(
+                "GET",
+                base_url="https://example.test",
+                path="/api/v2/pushes/active",
+                email="Not Set",
+                token="Not Set",
+            )
+
+        assert mock_get.call_count == 2
+        assert len(_sessions) == 1
+    finally:
+        close_sessions()
+
+
+def test_multipart_stream_matches_urllib3_encoding(tmp_path: Path) -> None:
+    upload = tmp_path / "notes.txt"
+    upload.write_bytes(b"secret file contents\n" * 1000)
+
+    with open(upload, "rb") as fd:
+        body = MultipartStream(
+            {"file_push[payload]": "", "file_push[expire_after_days]": 7},
+            {"file_push[files][]": fd},
+            chunk_size=1024,
+        )
+        encoded = body.read()
+
+    expected, content_type = encode_multipart_formdata(
+        [
+            ("file_push[payload]", ""),
+            ("file_push[expire_after_days]", "7"),
+            ("file_push[files][]", ("notes.txt", upload.read_bytes(), "text/plain")),
+        ],
+        boundary=body.boundary,
+    )
+    assert encoded == expected
+    assert len(body) == len(expected)
+    assert body.content_type == content_type
+
+
+def test_multipart_stream_reads_in_chunks_and_reports_progress(
+    tmp_path: Path,
+) -> None:
+    upload = tmp_path / "big.bin"
+    upload.write_bytes(b"x" * 50_000)
+    progress: list[tuple[int, int]] = []
+
+    with open(upload, "rb") as fd:
+        body = MultipartStream(
+            {}, {"push[files][]": [fd]}, on_progress=lambda *a: progress.append(a)
+        )
+        chunks = []
+        while chunk := body.read(8192):
+            assert len(chunk) <= 8192
+            chunks.append(chunk)
+
+    assert len(b"".join(chunks)) == len(body)
+    assert progress[-1] == (len(body), len(body))
+    assert all(sent <= total for sent, total in progress)
+
+
+def test_send_request_streams_file_uploads(tmp_path: Path) -> None:
+    upload = tmp_path / "doc.pdf"
+    upload.write_bytes(b"%PDF-1.4")
+    close_sessions()
+    try:
+        with (
+            patch("requests.Session.post") as mock_post,
+            open(upload, "rb") as fd,
+        ):
+            mock_post.return_value = MagicMock(status_code=201)
+            send_request(
+                "POST",
+                base_url="https://example.test",
+                path="/api/v2/pushes",
+                email="Not Set",
+                token="test-token",
+                post_data={"push": {"kind": "file"}},
+                upload_files={"push[files][]": fd},
+            )
+
+        kwargs = mock_post.call_args.kwargs
+        assert "files" not in kwargs
+        assert isinstance(kwargs["data"], MultipartStream)
+        assert kwargs["headers"]["Content-Type"] == kwargs["data"].content_type
+    finally:
+        close_sessions()
@@ -24,6 +24,9 @@ from pwpush.api.endpoints import (
     push_create_path,
     push_expire_path,
     push_preview_path,
+    push_share_url,
+    request_payload,
+    text_push_payload,
     validation_paths,
 )
 
@@ -34,7 +37,7 @@ class TestClearCaches:
     def test_clear_profile_cache(self):
         """Test that profile cache is cleared."""
         # First populate the cache
-        with patch("pwpush.api.capabilities.requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_get.return_value = mock_response
@@ -45,7 +48,7 @@ class TestClearCaches:
         # Clear and verify
         clear_profile_cache()
         # After clearing, a new call should be made
-        with patch("pwpush.api.capabilities.requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_get.return_value = mock_response
@@ -58,7 +61,7 @@ class TestClearCaches:
         """Test that capabilities cache is cleared."""
         clear_capabilities_cache()
         # After clearing, a new call should be made
-        with patch("pwpush.api.capabilities.requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"api_version": "2.1.0", "features": {}}
@@ -77,7 +80,7 @@ class TestDetectApiProfileForceRefresh:
         # Clear cache first
         clear_profile_cache()
 
-        with patch("pwpush.api.capabilities.requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_get.return_value = mock_response
@@ -198,7 +201,7 @@ class TestDetectApiCapabilitiesDebug:
         """Test debug output when API call succeeds."""
         clear_capabilities_cache()
 
-        with patch("pwpush.api.capabilities.requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -222,7 +225,7 @@ class TestDetectApiCapabilitiesDebug:
         """Test debug output when API call fails."""
         clear_capabilities_cache()
 
-        with patch("pwpush.api.capabilities.requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 404
             mock_get.return_value = mock_response
@@ -242,7 +245,7 @@ class TestDetectApiCapabilitiesDebug:
         """Test debug output when request raises exception."""
         clear_capabilities_cache()
 
-        with patch("pwpush.api.capabilities.requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.side_effect = requests.exceptions.RequestException(
                 "Connection failed"
             )
@@ -317,6 +320,49 @@ class TestPushPreviewPath:
         )
 
 
+class TestPushShareUrl:
+    """Tests for push_share_url function."""
+
+    def test_uses_url_from_create_response(self):
+        """Test a URL in the create response is returned as-is."""
+        body = {"url_token": "token123", "url": "https://example.com/en/p/token123"}
+        assert (
+            push_share_url("https://example.com", API_PROFILE_V2, body, "text")
+            == "https://example.com/en/p/token123"
+        )
+
+    def test_v2_derived_url(self):
+        """Test v2 share URL is derived from the instance URL and token."""
+        body = {"url_token": "token123", "retrieval_step": False}
+        assert (
+            push_share_url("https://example.com/", API_PROFILE_V2, body, "file")
+            == "https://example.com/p/token123"
+        )
+
+    def test_legacy_file_derived_url(self):
+        """Test legacy file pushes are shared under /f."""
+        body = {"url_token": "token123", "retrieval_step": False}
+        assert (
+            push_share_url("https://example.com", API_PROFILE_LEGACY, body, "file")
+            == "https://example.com/f/token123"
+        )
+
+    def test_retrieval_step_uses_step_page(self):
+        """Test retrieval step pushes link to the /r step page."""
+        body = {"url_token": "token123", "retrieval_step": True}
+        assert (
+            push_share_url("https://example.com", API_PROFILE_V2, body, "text")
+            == "https://example.com/p/token123/r"
+        )
+
+    def test_returns_none_without_retrieval_step(self):
+        """Test URL is not guessed when retrieval_step is unknown."""
+        body = {"url_token": "token123"}
+        assert (
+            push_share_url("https://example.com", API_PROFILE_V2, body, "text") is None
+        )
+
+
 class TestPushExpirePath:
     """Tests for push_expire_path function."""
 
@@ -346,6 +392,29 @@ class TestPushAuditPath:
         )
 
 
+class TestPayloadBuilders:
+    """Tests for text_push_payload and request_payload."""
+
+    def test_unset_options_are_omitted(self):
+        """Test options left as None leave the instance defaults in charge."""
+        assert text_push_payload("secret") == {
+            "password": {"kind": "text", "payload": "secret"}
+        }
+        assert request_payload("send it") == {"request": {"request": "send it"}}
+
+    def test_defaults_fill_unset_options_only(self):
+        """Test defaults apply to options left as None, not to given ones."""
+        defaults = {"expire_after_days": "7", "expire_after_views": "3"}
+
+        push = text_push_payload("secret", views=10, defaults=defaults)
+        request = request_payload("send it", days=2, defaults=defaults)
+
+        assert push["password"]["expire_after_days"] == "7"
+        assert push["password"]["expire_after_views"] == 10
+        assert request["request"]["expire_after_days"] == 2
+        assert request["request"]["expire_after_views"] == "3"
+
+
 class TestAdaptTextPayloadForProfile:
     """Tests for adapt_text_payload_for_profile function."""
 
@@ -522,3 +591,14 @@ class TestNormalizeAuditEvents:
         """Test empty body."""
         result = normalize_audit_events({})
         assert result == []
+
+    def test_timestamp_is_sortable_utc(self):
+        """Test that each event carries a UTC ISO-8601 timestamp."""
+        body = {
+            "logs": [
+                {"created_at": "2024-01-15T12:30:00+02:00", "kind": "password_viewed"}
+            ]
+        }
+        result = normalize_audit_events(body)
+        assert result[0]["timestamp"] == "2024-01-15T10:30:00Z"
+        assert result[0]["created_at"] == "01/15/2024, 10:30:00 UTC"
@@ -0,0 +1,535 @@
+"""Tests for the asyncio client, against a local HTTP/1.1 server."""
+
+from typing import Iterator
+
+import asyncio
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from pwpush.api.async_client import AsyncPushClient
+from pwpush.api.errors import (
+    PwpushAPIError,
+    PwpushConnectionError,
+    PwpushConnectionResetError,
+    PwpushTimeoutError,
+)
+from pwpush.api.retry import RetryPolicy
+
+
+class FakeInstance:
+    """Minimal keep-alive HTTP server answering from a route table.
+
+    Routes map (method, target) to (status, body, headers); a body that is
+    not bytes is sent as JSON. Unknown routes answer 404.
+    """
+
+    def __init__(self) -> None:
+        self.routes: dict[tuple[str, str], tuple[int, object, dict[str, str]]] = {}
+        self.requests: list[dict[str, object]] = []
+        self.connections = 0
+        self.chunked = False
+        self.close_after_response = False
+        self.drop_next_request = False
+        self.interim_response = False
+        self._server: asyncio.Server | None = None
+
+    async def __aenter__(self) -> "FakeInstance":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    @property
+    def url(self) -> str:
+        assert self._server is not None
+        return f"http://127.0.0.1:{self._server.sockets[0].getsockname()[1]}"
+
+    def route(self, method, target, status=200, body=None, headers=None):
+        self.routes[(method, target)] = (status, body, headers or {})
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    return
+                method, target, _ = request_line.decode().split(" ")
+                headers: dict[str, str] = {}
+                while (line := (await reader.readline()).decode().strip()) != "":
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                self.requests.append(
+                    {
+                        "method": method,
+                        "target": target,
+                        "headers": headers,
+                        "json": json.loads(body) if body else None,
+                    }
+                )
+                if self.drop_next_request:
+                    # Close the connection without answering.
+                    self.drop_next_request = False
+                    return
+
+                status, payload, extra = self.routes.get(
+                    (method, target), (404, {"error": "Not found"}, {})
+                )
+                if callable(payload):
+                    status, payload, extra = payload()
+                content = payload if isinstance(payload, bytes) else json.dumps(payload)
+                content = content if isinstance(content, bytes) else content.encode()
+                lines = [f"HTTP/1.1 {status} X"]
+                if self.interim_response:
+                    lines.insert(0, "HTTP/1.1 100 Continue\r\n")
+                lines += [f"{name}: {value}" for name, value in extra.items()]
+                if self.chunked:
+                    lines.append("Transfer-Encoding: chunked")
+                    half = len(content) // 2
+                    data = b"".join(
+                        f"{len(part):x}\r\n".encode() + part + b"\r\n"
+                        for part in (content[:half], content[half:])
+                        if part
+                    )
+                    content = data + b"0\r\n\r\n"
+                else:
+                    lines.append(f"Content-Length: {len(content)}")
+                writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + content)
+                await writer.drain()
+                if self.close_after_response:
+                    return
+        finally:
+            writer.close()
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_create_push_adapts_payload_for_v2():
+    async def scenario():
+        async with FakeInstance() as server:
+            server.route("GET", "/api/v2/version", body={"api_version": "2.0"})
+            server.route(
+                "POST",
+                "/api/v2/pushes",
+                201,
+                {"url_token": "tok1", "kind": "text", "retrieval_step": False},
+            )
+            async with AsyncPushClient(
+                server.url, email="user@test.com", token="secret-token"
+            ) as client:
+                created = await client.create_push("s3cret", days=7, views=3)
+            return server, server.url, created
+
+    server, url, created = run(scenario())
+
+    assert created.url_token == "tok1"
+    assert created.url == f"{url}/p/tok1"
+    create = server.requests[-1]
+    assert create["json"] == {
+        "push": {
+            "payload": "s3cret",
+            "kind": "text",
+            "expire_after_views": 3,
+            "expire_after_duration": 12,
+        }
+    }
+    assert create["headers"]["authorization"] == "Bearer secret-token"
+    assert create["headers"]["x-user-email"] == "user@test.com"
+    assert create["headers"]["user-agent"].startswith("pwpush-cli/")
+
+
+def test_legacy_instance_uses_legacy_paths():
+    async def scenario():
+        async with FakeInstance() as server:
+            server.route("POST", "/p.json", 201, {"url_token": "tok1"})
+            server.route(
+                "GET", "/p/tok1/preview.json", body={"url": "https://x/p/tok1"}
+            )
+            server.route("DELETE", "/p/tok1.json", body={"expired": True})
+            async with AsyncPushClient(server.url) as client:
+                created = await client.create_push("s3cret", note="db")
+                preview = await client.preview_push("tok1")
+                expired = await client.expire_push("tok1")
+                profile = await client.api_profile()
+            return server, created, preview, expired, profile
+
+    server, created, preview, expired, profile = run(scenario())
+
+    assert profile == "legacy"
+    assert server.requests[1]["json"] == {
+        "password": {"kind": "text", "payload": "s3cret", "note": "db"}
+    }
+    assert preview["url"] == "https://x/p/tok1"
+    # Without url or retrieval_step in the create response, the share URL
+    # comes from the preview.
+    assert created.url == "https://x/p/tok1"
+    assert expired == {"expired": True}
+
+
+def test_audit_and_request_operations():
+    async def scenario():
+        async with FakeInstance() as server:
+            server.chunked = True
+            server.route(
+                "GET",
+                "/api/v2/pushes/tok1/audit",
+                body={
+                    "logs": [
+                        {
+                            "ip": "1.2.3.4",
+                            "kind": "view",
+                            "created_at": "2024-01-15T10:30:00Z",
+                        }
+                    ]
+                },
+            )
+            server.route("POST", "/api/v2/requests", 201, {"url_token": "req1"})
+            server.route("GET", "/api/v2/requests/req1/preview", body={"url": "u"})
+            async with AsyncPushClient(server.url, api_profile="v2") as client:
+                events = await client.audit_push("tok1")
+                created = await client.create_request(
+                    "Send the key", views=2, notify="a@test.com"
+                )
+                preview = await client.preview_request(created["url_token"])
+            return server, events, preview
+
+    server, events, preview = run(scenario())
+
+    assert events[0]["kind"] == "View"
+    assert events[0]["timestamp"] == "2024-01-15T10:30:00Z"
+    assert server.requests[1]["json"] == {
+        "request": {
+            "request": "Send the key",
+            "expire_after_views": 2,
+            "notify_emails_to": "a@test.com",
+        }
+    }
+    assert preview == {"url": "u"}
+    assert server.connections == 1
+
+
+def test_list_pushes_pages_until_short_page():
+    async def scenario():
+        async with FakeInstance() as server:
+            page = [{"url_token": f"tok{i}"} for i in range(3)]
+            paged = {"X-Per-Page": "3"}
+            server.route("GET", "/api/v2/pushes/active", body=page, headers=paged)
+            server.route(
+                "GET",
+                "/api/v2/pushes/active?page=2",
+                body=[{"url_token": "tok2"}, {"url_token": "tok3"}],
+                headers=paged,
+            )
+            async with AsyncPushClient(server.url, api_profile="v2") as client:
+                tokens = [push.url_token async for push in client.list_pushes()]
+            return server, tokens
+
+    server, tokens = run(scenario())
+
+    assert tokens == ["tok0", "tok1", "tok2", "tok3"]
+    assert [r["target"] for r in server.requests] == [
+        "/api/v2/pushes/active",
+        "/api/v2/pushes/active?page=2",
+    ]
+
+
+def test_many_concurrent_operations_share_a_bounded_pool():
+    async def scenario():
+        async with FakeInstance() as server:
+            server.route(
+                "POST",
+                "/api/v2/pushes",
+                201,
+                {"url_token": "tok", "retrieval_step": False},
+            )
+            async with AsyncPushClient(
+                server.url, api_profile="v2", pool_size=4
+            ) as client:
+                results = await asyncio.gather(
+                    *(client.create_push(f"secret-{i}") for i in range(200))
+                )
+            return server, results
+
+    server, results = run(scenario())
+
+    assert len(results) == 200
+    assert len(server.requests) == 200
+    assert server.connections <= 4
+
+
+def test_closed_keep_alive_connections_are_replaced():
+    async def scenario():
+        async with FakeInstance() as server:
+            server.close_after_response = True
+            server.route("GET", "/api/v2/pushes/tok1/preview", body={"url": "u"})
+            async with AsyncPushClient(server.url, api_profile="v2") as client:
+                first = await client.preview_push("tok1")
+                second = await client.preview_push("tok1")
+            return server, first, second
+
+    server, first, second = run(scenario())
+
+    assert first == second == {"url": "u"}
+    assert server.connections == 2
+
+
+def test_dropped_requests_are_replayed_only_when_idempotent():
+    async def scenario():
+        async with FakeInstance() as server:
+            server.route("GET", "/api/v2/pushes/tok1/preview", body={"url": "u"})
+            server.route("POST", "/api/v2/pushes", 201, {"url_token": "tok2"})
+            async with AsyncPushClient(server.url, api_profile="v2") as client:
+                await client.preview_push("tok1")
+                server.drop_next_request = True
+                preview = await client.preview_push("tok1")
+                server.drop_next_request = True
+                with pytest.raises(PwpushConnectionResetError):
+                    await client.create_push("s3cret")
+            return server, preview
+
+    server, preview = run(scenario())
+
+    assert preview == {"url": "u"}
+    assert [r["method"] for r in server.requests] == ["GET", "GET", "GET", "POST"]
+
+
+def test_interim_responses_are_skipped():
+    async def scenario():
+        async with FakeInstance() as server:
+            server.interim_response = True
+            server.route("GET", "/api/v2/pushes/tok1/preview", body={"url": "u"})
+            async with AsyncPushClient(server.url, api_profile="v2") as client:
+                first = await client.preview_push("tok1")
+                second = await client.preview_push("tok1")
+            return server, first, second
+
+    server, first, second = run(scenario())
+
+    assert first == second == {"url": "u"}
+    assert server.connections == 1
+
+
+def test_redirects_are_followed_within_the_instance():
+    async def scenario():
+        async with FakeInstance() as server:
+            server.route(
+                "POST",
+                "/api/v2/pushes",
+                307,
+                b"",
+                {"Location": f"{server.url}/api/v2/pushes/new"},
+            )
+            server.route(
+                "POST",
+                "/api/v2/pushes/new",
+                201,
+                {"url_token": "tok1", "url": "https://x/p/tok1"},
+            )
+            server.route(
+                "GET",
+                "/api/v2/pushes/tok1/preview",
+                303,
+                b"",
+                {"Location": "/api/v2/pushes/tok1/shown"},
+            )
+            server.route("GET", "/api/v2/pushes/tok1/shown", body={"url": "u"})
+            server.route(
+                "GET",
+                "/api/v2/pushes/tok2/preview",
+                302,
+                b"",
+                {"Location": "https://elsewhere.test/p/tok2"},
+            )
+            async with AsyncPushClient(server.url, api_profile="v2") as client:
+                created = await client.create_push("s3cret")
+                preview = await client.preview_push("tok1")
+                elsewhere = await client.request("GET", "/api/v2/pushes/tok2/preview")
+            return server, created, preview, elsewhere
+
+    server, created, preview, elsewhere = run(scenario())
+
+    assert created.url == "https://x/p/tok1"
+    assert preview == {"url": "u"}
+    assert elsewhere.status_code == 302
+    assert [(r["method"], r["target"]) for r in server.requests] == [
+        ("POST", "/api/v2/pushes"),
+        ("POST", "/api/v2/pushes/new"),
+        ("GET", "/api/v2/pushes/tok1/preview"),
+        ("GET", "/api/v2/pushes/tok1/shown"),
+        ("GET", "/api/v2/pushes/tok2/preview"),
+    ]
+    assert server.requests[1]["json"] == server.requests[0]["json"]
+
+
+def test_http_proxy_from_the_environment_is_used(monkeypatch):
+    async def scenario():
+        async with FakeInstance() as proxy:
+            proxy.route(
+                "GET",
+                "http://pwpush.test/api/v2/pushes/tok1/preview",
+                body={"url": "u"},
+            )
+            monkeypatch.setenv("HTTP_PROXY", f"http://user:p%40ss@{proxy.url[7:]}")
+            monkeypatch.delenv("NO_PROXY", raising=False)
+            monkeypatch.delenv("no_proxy", raising=False)
+            async with AsyncPushClient(
+                "http://pwpush.test", api_profile="v2"
+            ) as client:
+                preview = await client.preview_push("tok1")
+            return proxy, preview
+
+    proxy, preview = run(scenario())
+
+    assert preview == {"url": "u"}
+    request = proxy.requests[0]
+    assert request["headers"]["host"] == "pwpush.test"
+    assert request["headers"]["proxy-authorization"] == "Basic dXNlcjpwQHNz"
+
+
+def test_proxy_refusing_the_tunnel_raises_connection_error(monkeypatch):
+    async def scenario():
+        async with FakeInstance() as proxy:
+            monkeypatch.setenv("HTTPS_PROXY", proxy.url)
+            monkeypatch.delenv("NO_PROXY", raising=False)
+            monkeypatch.delenv("no_proxy", raising=False)
+            async with AsyncPushClient(
+                "https://pwpush.test", api_profile="v2"
+            ) as client:
+                await client.preview_push("tok1")
+
+    with pytest.raises(PwpushConnectionError):
+        run(scenario())
+
+
+def test_no_proxy_bypasses_the_environment_proxy(monkeypatch):
+    monkeypatch.setenv("HTTP_PROXY", "http://proxy.test:3128")
+    monkeypatch.setenv("NO_PROXY", "pwpush.test")
+
+    assert AsyncPushClient("http://pwpush.test")._proxy is None
+    assert AsyncPushClient("http://other.test")._proxy is not None
+
+
+def test_connect_and_tls_handshake_are_within_the_timeout():
+    async def scenario():
+        # Accepts TCP connections but never answers the TLS handshake.
+        server = await asyncio.start_server(lambda r, w: None, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            async with AsyncPushClient(
+                f"https://127.0.0.1:{port}", api_profile="v2", timeout=0.2
+            ) as client:
+                await asyncio.wait_for(client.preview_push("tok1"), 5)
+        finally:
+            server.close()
+
+    with pytest.raises(PwpushTimeoutError):
+        run(scenario())
+
+
+def test_shared_rate_limiter_runs_off_the_event_loop():
+    threads = []
+
+    async def scenario():
+        async with FakeInstance() as server:
+            server.route("GET", "/api/v2/pushes/tok1/preview", body={"url": "u"})
+            async with AsyncPushClient(
+                server.url, api_profile="v2", rate_limit=100
+            ) as client:
+                assert client._limiter is not None and client._limiter.shared
+
+                def reserve() -> float:
+                    threads.append(threading.get_ident())
+                    return 0.0
+
+                with patch.object(client._limiter, "reserve", side_effect=reserve):
+                    await client.preview_push("tok1")
+
+    run(scenario())
+
+    assert len(threads) == 1
+    assert threads[0] != threading.get_ident()
+
+
+def test_rate_limited_requests_are_retried():
+    responses = iter(
+        [
+            (403, {"error": "Rate limit exceeded"}, {"Retry-After": "0"}),
+            (200, {"url": "u"}, {}),
+        ]
+    )
+
+    async def scenario():
+        async with FakeInstance() as server:
+            server.route(
+                "GET", "/api/v2/pushes/tok1/preview", body=lambda: next(responses)
+            )
+            async with AsyncPushClient(server.url, api_profile="v2") as client:
+                return await client.preview_push("tok1")
+
+    assert run(scenario()) == {"url": "u"}
+
+
+def test_gateway_errors_follow_the_retry_policy():
+    responses: Iterator[tuple[int, dict[str, str], dict[str, str]]] = iter(
+        [(503, {"error": "Unavailable"}, {}), (200, {"url": "u"}, {})]
+    )
+
+    async def scenario():
+        async with FakeInstance() as server:
+            server.route(
+                "GET", "/api/v2/pushes/tok1/preview", body=lambda: next(responses)
+            )
+            server.route("POST", "/api/v2/pushes", 503, {"error": "Unavailable"})
+            policy = RetryPolicy(base_delay=0.01)
+            async with AsyncPushClient(
+                server.url, api_profile="v2", retry_policy=policy
+            ) as client:
+                preview = await client.preview_push("tok1")
+                with pytest.raises(PwpushAPIError):
+                    await client.create_push("s3cret")
+            return server, preview
+
+    server, preview = run(scenario())
+
+    assert preview == {"url": "u"}
+    assert [r["method"] for r in server.requests] == ["GET", "GET", "POST"]
+
+
+def test_error_status_raises_api_error():
+    async def scenario():
+        async with FakeInstance() as server:
+            server.route("DELETE", "/api/v2/pushes/tok1", 403, {"error": "Forbidden"})
+            async with AsyncPushClient(server.url, api_profile="v2") as client:
+                await client.expire_push("tok1")
+
+    with pytest.raises(PwpushAPIError) as excinfo:
+        run(scenario())
+
+    assert excinfo.value.status_code == 403
+    assert excinfo.value.message == "Forbidden"
+
+
+def test_unreachable_instance_raises_connection_error():
+    async def scenario():
+        server = await asyncio.start_server(lambda r, w: None, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        server.close()
+        await server.wait_closed()
+        async with AsyncPushClient(
+            f"http://127.0.0.1:{port}", api_profile="v2"
+        ) as client:
+            await client.preview_push("tok1")
+
+    with pytest.raises(PwpushConnectionError):
+        run(scenario())
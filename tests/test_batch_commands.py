@@ -0,0 +1,211 @@
+"""Tests for batch push commands."""
+
+from typing import Any
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from pwpush.__main__ import app
+from pwpush.api.errors import PwpushConnectionError
+from pwpush.commands.config import user_config
+from pwpush.utils import map_bounded
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def mock_batch_make_request():
+    """Mock make_request so every create returns a distinct url_token."""
+    created: list[dict[str, Any]] = []
+
+    def fake_make_request(method, path, post_data=None, **kwargs):
+        response = MagicMock()
+        if method == "POST":
+            token = f"token-{len(created)}"
+            created.append(post_data)
+            response.status_code = 201
+            response.json.return_value = {
+                "url_token": token,
+                "url": f"https://pwpush.test/p/{token}",
+            }
+        else:
+            response.status_code = 200
+            response.json.return_value = {"url": f"https://pwpush.test{path}"}
+        return response
+
+    with (
+        patch("pwpush.__main__.current_api_profile", return_value="legacy"),
+        patch("pwpush.__main__.make_request", side_effect=fake_make_request) as mock,
+    ):
+        mock.created = created
+        yield mock
+
+
+def _result_lines(output: str) -> list[dict[str, Any]]:
+    return [json.loads(line) for line in output.splitlines() if line.strip()]
+
+
+def test_push_batch_jsonl_from_stdin(mock_batch_make_request):
+    """Test JSONL records on stdin produce one result line each."""
+    records = "\n".join(
+        [
+            json.dumps({"secret": "one", "name": "first", "days": 3}),
+            json.dumps({"secret": "two", "views": "5", "kind": "url"}),
+        ]
+    )
+
+    result = runner.invoke(app, ["push-batch", "--concurrency", "2"], input=records)
+
+    assert result.exit_code == 0
+    lines = sorted(_result_lines(result.output), key=lambda line: line["index"])
+    assert [line["index"] for line in lines] == [0, 1]
+    assert lines[0]["name"] == "first"
+    assert all(line["url"].startswith("https://pwpush.test/") for line in lines)
+    payloads = sorted(
+        mock_batch_make_request.created, key=lambda data: data["password"]["payload"]
+    )
+    assert payloads[0]["password"]["expire_after_days"] == 3
+    assert payloads[1]["password"]["expire_after_views"] == 5
+    assert payloads[1]["password"]["kind"] == "url"
+
+
+def test_push_batch_csv_file(mock_batch_make_request, tmp_path):
+    """Test CSV input is detected by file extension."""
+    source = tmp_path / "secrets.csv"
+    source.write_text("secret,note,retrieval_step\nalpha,ticket-1,true\nbeta,,\n")
+
+    result = runner.invoke(app, ["push-batch", str(source)])
+
+    assert result.exit_code == 0
+    assert len(_result_lines(result.output)) == 2
+    alpha = next(
+        data
+        for data in mock_batch_make_request.created
+        if data["password"]["payload"] == "alpha"
+    )
+    assert alpha["password"]["note"] == "ticket-1"
+    assert alpha["password"]["retrieval_step"] is True
+
+
+def test_push_batch_reports_invalid_records(mock_batch_make_request):
+    """Test invalid records are reported per line and set a failing exit code."""
+    records = "\n".join(
+        [
+            json.dumps({"secret": "ok"}),
+            "not json",
+            json.dumps({"name": "missing secret"}),
+            json.dumps({"secret": "x", "kind": "file"}),
+        ]
+    )
+
+    result = runner.invoke(app, ["push-batch"], input=records)
+
+    assert result.exit_code == 1
+    lines = {line["index"]: line for line in _result_lines(result.output)}
+    assert "url" in lines[0]
+    assert "Invalid JSON" in lines[1]["error"]
+    assert "missing a secret" in lines[2]["error"]
+    assert "Invalid kind" in lines[3]["error"]
+    assert len(mock_batch_make_request.created) == 1
+
+
+def test_push_batch_rejects_non_integer_counts(mock_batch_make_request):
+    """Test days and views must be whole numbers, not truncated or coerced."""
+    records = "\n".join(
+        [
+            json.dumps({"secret": "a", "days": 2.9}),
+            json.dumps({"secret": "b", "views": True}),
+            json.dumps({"secret": "c", "views": "2.5"}),
+            json.dumps({"secret": "d", "days": 4.0, "views": " 6 "}),
+        ]
+    )
+
+    result = runner.invoke(app, ["push-batch"], input=records)
+
+    assert result.exit_code == 1
+    lines = {line["index"]: line for line in _result_lines(result.output)}
+    assert "Invalid days '2.9'" in lines[0]["error"]
+    assert "Invalid views 'True'" in lines[1]["error"]
+    assert "Invalid views '2.5'" in lines[2]["error"]
+    assert "url" in lines[3]
+    created = mock_batch_make_request.created
+    assert len(created) == 1
+    assert created[0]["password"]["expire_after_days"] == 4
+    assert created[0]["password"]["expire_after_views"] == 6
+
+
+def test_push_batch_uses_config_defaults(mock_batch_make_request, monkeypatch):
+    """Test configured expiration defaults apply to batch records."""
+    monkeypatch.setitem(user_config["expiration"], "expire_after_views", "7")
+
+    result = runner.invoke(app, ["push-batch"], input='{"secret": "s"}\n')
+
+    assert result.exit_code == 0
+    assert mock_batch_make_request.created[0]["password"]["expire_after_views"] == "7"
+
+
+def test_push_batch_reports_request_errors_per_record():
+    """Test connection failures and unreadable responses stay per-record."""
+
+    def fake_perform_request(method, *, path, post_data=None, **kwargs):
+        if method == "GET":
+            return MagicMock(status_code=200, **{"json.return_value": {"url": "u"}})
+        payload = post_data["password"]["payload"]
+        if payload == "unreachable":
+            raise PwpushConnectionError("Could not connect to https://pwpush.test")
+        response = MagicMock(status_code=201)
+        if payload == "garbled":
+            response.json.side_effect = ValueError("Expecting value")
+        else:
+            response.json.return_value = {"url_token": "tok", "url": "u"}
+        return response
+
+    records = "\n".join(
+        json.dumps({"secret": secret}) for secret in ("unreachable", "garbled", "ok")
+    )
+    with (
+        patch("pwpush.__main__.current_api_profile", return_value="legacy"),
+        patch("pwpush.__main__.perform_request", side_effect=fake_perform_request),
+        patch("pwpush.__main__.send_request") as mock_send_request,
+    ):
+        result = runner.invoke(app, ["push-batch"], input=records)
+
+    assert result.exit_code == 1
+    mock_send_request.assert_not_called()
+    lines = {line["index"]: line for line in _result_lines(result.output)}
+    assert lines[0] == {
+        "index": 0,
+        "error": "Could not connect to https://pwpush.test",
+    }
+    assert lines[1] == {
+        "index": 1,
+        "error": "Unreadable response from server.",
+        "status_code": 201,
+    }
+    assert lines[2]["url_token"] == "tok"
+
+
+def test_map_bounded_limits_in_flight_calls():
+    """Test map_bounded never runs more than `concurrency` calls at once."""
+    import threading
+    import time
+
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def work(item):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.01)
+        with lock:
+            state["active"] -= 1
+        return item * 2
+
+    results = dict(map_bounded(work, range(20), concurrency=3))
+
+    assert results == {item: item * 2 for item in range(20)}
+    assert state["peak"] <= 3
@@ -0,0 +1,234 @@
+"""Tests for adaptive (AIMD) concurrency."""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from pwpush.__main__ import app
+from pwpush.api import concurrency
+from pwpush.api.client import perform_request
+from pwpush.api.concurrency import (
+    AdaptiveConcurrency,
+    adaptive_concurrency,
+    load_level,
+    rate_limit_headers,
+    save_level,
+)
+from pwpush.utils import map_bounded
+
+runner = CliRunner()
+
+
+def _response(status_code=200, headers=None, text=""):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.text = text
+    return response
+
+
+@pytest.mark.parametrize(
+    "headers,expected",
+    [
+        ({}, (None, None)),
+        ({"X-RateLimit-Remaining": "7", "X-RateLimit-Reset": "30"}, (7, 30.0)),
+        ({"RateLimit-Remaining": "0"}, (0, None)),
+        ({"RateLimit": "limit=100, remaining=50, reset=12"}, (50, 12.0)),
+        ({"RateLimit": '"default";r=3;t=5'}, (3, 5.0)),
+        ({"X-RateLimit-Remaining": "many", "X-RateLimit-Reset": "soon"}, (None, None)),
+    ],
+)
+def test_rate_limit_headers(headers, expected):
+    assert rate_limit_headers(_response(headers=headers)) == expected
+
+
+def test_rate_limit_reset_accepts_unix_timestamps():
+    reset_at = str(int(time.time()) + 60)
+    _, reset = rate_limit_headers(_response(headers={"X-RateLimit-Reset": reset_at}))
+
+    assert reset == pytest.approx(60, abs=2)
+
+
+def test_successes_increase_level_additively():
+    controller = AdaptiveConcurrency("https://pwpush.test", initial=4, maximum=16)
+
+    # About one more slot per round of `level` successful responses
+    for _ in range(5):
+        controller.observe(_response(200), time.monotonic(), False)
+
+    assert controller.limit() == 5
+
+
+def test_rate_limit_halves_level_once_per_round():
+    controller = AdaptiveConcurrency("https://pwpush.test", initial=8, maximum=16)
+    started = time.monotonic()
+
+    # Every request that was in flight when the server pushed back
+    for _ in range(8):
+        controller.observe(_response(403), started, True)
+    assert controller.limit() == 4
+
+    controller.observe(_response(429, {"Retry-After": "2"}), time.monotonic(), False)
+    assert controller.limit() == 2
+
+
+def test_bare_too_many_requests_decreases_level():
+    controller = AdaptiveConcurrency("https://pwpush.test", initial=8, maximum=16)
+
+    # No Retry-After and not a recognised 403 rate-limit body
+    controller.observe(_response(429), time.monotonic(), False)
+
+    assert controller.level == 4
+
+
+def test_level_stays_between_minimum_and_maximum():
+    controller = AdaptiveConcurrency("https://pwpush.test", initial=2, maximum=3)
+
+    for _ in range(5):
+        controller.observe(_response(403), time.monotonic(), True)
+    assert controller.limit() == 1
+
+    for _ in range(50):
+        controller.observe(_response(200), time.monotonic(), False)
+    assert controller.limit() == 3
+
+
+def test_server_errors_do_not_change_level():
+    controller = AdaptiveConcurrency("https://pwpush.test", initial=4)
+
+    controller.observe(_response(502), time.monotonic(), False)
+
+    assert controller.level == 4
+
+
+def test_remaining_quota_caps_level_until_reset():
+    controller = AdaptiveConcurrency("https://pwpush.test", initial=8, maximum=16)
+    headers = {"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": "0.05"}
+
+    controller.observe(_response(200, headers), time.monotonic(), False)
+    assert controller.limit() == 2
+
+    time.sleep(0.06)
+    assert controller.limit() == 8
+
+
+def test_exhausted_quota_decreases_level():
+    controller = AdaptiveConcurrency("https://pwpush.test", initial=8)
+
+    controller.observe(
+        _response(200, {"X-RateLimit-Remaining": "0"}), time.monotonic(), False
+    )
+
+    assert controller.level == 4
+
+
+def test_level_is_saved_per_instance():
+    with adaptive_concurrency("https://pwpush.test") as controller:
+        assert controller.limit() == concurrency.DEFAULT_CONCURRENCY
+        controller.observe(_response(403), time.monotonic(), True)
+    save_level("https://other.test", 9)
+
+    assert load_level("https://pwpush.test") == 2
+    with adaptive_concurrency("https://pwpush.test") as controller:
+        assert controller.limit() == 2
+    with adaptive_concurrency("https://other.test", maximum=6) as controller:
+        assert controller.limit() == 6
+
+
+def test_corrupt_level_file_is_ignored():
+    concurrency.concurrency_file.write_text("{not json", encoding="utf-8")
+
+    assert load_level("https://pwpush.test") is None
+    with adaptive_concurrency("https://pwpush.test") as controller:
+        assert controller.limit() == concurrency.DEFAULT_CONCURRENCY
+
+
+def test_perform_request_reports_to_active_controller():
+    session = MagicMock()
+    session.get.side_effect = [
+        _response(403, text="Rate limit exceeded"),
+        _response(200),
+    ]
+
+    with (
+        patch("pwpush.api.client.get_session", return_value=session),
+        patch("pwpush.api.client.time.sleep"),
+        adaptive_concurrency("https://pwpush.test") as controller,
+    ):
+        perform_request(
+            "GET",
+            base_url="https://pwpush.test/",
+            path="/api/v2/version",
+            email="Not Set",
+            token="Not Set",
+        )
+
+    assert controller.level == pytest.approx(2.5)
+
+
+def test_map_bounded_follows_changing_limit():
+    controller = AdaptiveConcurrency("https://pwpush.test", initial=4, maximum=8)
+    lock = threading.Lock()
+    in_flight = 0
+    peaks = []
+
+    def work(item):
+        nonlocal in_flight
+        with lock:
+            in_flight += 1
+            peaks.append((item, in_flight))
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        if item == 5:
+            controller.observe(_response(403), float("inf"), True)
+        return item
+
+    results = dict(map_bounded(work, range(40), 8, limit=controller.limit))
+
+    assert sorted(results) == list(range(40))
+    assert max(peak for _, peak in peaks) <= 4
+    assert max(peak for item, peak in peaks if item >= 20) <= 2
+
+
+def test_push_batch_without_concurrency_adapts_and_saves_level():
+    created = _response(201, {"X-RateLimit-Remaining": "100"})
+    created.json.return_value = {"url_token": "tok", "url": "https://x/p/tok"}
+    preview = _response(200)
+    preview.json.return_value = {"url": "https://x/p/tok"}
+    session = MagicMock()
+    session.post.return_value = created
+    session.get.return_value = preview
+    records = "\n".join(json.dumps({"secret": f"s{i}"}) for i in range(10))
+
+    with (
+        patch("pwpush.__main__.current_api_profile", return_value="legacy"),
+        patch("pwpush.api.client.get_session", return_value=session),
+    ):
+        result = runner.invoke(app, ["push-batch"], input=records)
+
+    assert result.exit_code == 0, result.output
+    assert len(result.output.splitlines()) == 10
+    level = load_level("https://eu.pwpush.com")
+    assert level is not None and level > concurrency.DEFAULT_CONCURRENCY
+
+
+def test_explicit_concurrency_is_not_adaptive():
+    with patch("pwpush.__main__.adaptive_concurrency") as adaptive:
+        from pwpush.__main__ import map_requests
+
+        results = list(map_requests(lambda item: item * 2, range(3), 2))
+
+    adaptive.assert_not_called()
+    assert sorted(result for _, result in results) == [0, 2, 4]
+
+
+def test_config_show_lists_max_concurrency():
+    result = runner.invoke(app, ["config", "show"])
+
+    assert result.exit_code == 0
+    assert "max_concurrency" in result.stdout
@@ -52,7 +52,7 @@ class TestNormalizeInstanceUrl:
 class TestFetchAccounts:
     """Tests for fetch_accounts function."""
 
-    @patch("pwpush.config_wizard.requests.get")
+    @patch("requests.Session.get")
     def test_fetch_accounts_success_list(self, mock_get):
         """Test fetching accounts when API returns a list."""
         mock_response = MagicMock()
@@ -68,7 +68,7 @@ class TestFetchAccounts:
         assert len(result) == 2
         assert result[0]["id"] == 1
 
-    @patch("pwpush.config_wizard.requests.get")
+    @patch("requests.Session.get")
     def test_fetch_accounts_success_wrapped(self, mock_get):
         """Test fetching accounts when API returns wrapped object."""
         mock_response = MagicMock()
@@ -85,7 +85,7 @@ class TestFetchAccounts:
         assert len(result) == 1
         assert result[0]["id"] == 1
 
-    @patch("pwpush.config_wizard.requests.get")
+    @patch("requests.Session.get")
     def test_fetch_accounts_non_200_status(self, mock_get):
         """Test fetching accounts when API returns non-200 status."""
         mock_response = MagicMock()
@@ -96,7 +96,7 @@ class TestFetchAccounts:
 
         assert result == []
 
-    @patch("pwpush.config_wizard.requests.get")
+    @patch("requests.Session.get")
     def test_fetch_accounts_request_exception(self, mock_get):
         """Test fetching accounts when request raises exception."""
         import requests
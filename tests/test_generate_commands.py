@@ -0,0 +1,119 @@
+"""Tests for bulk secret generation."""
+
+import io
+from collections import Counter
+from unittest.mock import patch
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from pwpush.__main__ import app
+from pwpush.commands.generate import generate_cmd
+from pwpush.utils import (
+    check_secret_conditions,
+    count_valid_secrets,
+    generate_secret,
+    generate_secrets,
+    unrank_secret,
+)
+
+runner = CliRunner()
+
+
+def test_count_valid_secrets_matches_brute_force_for_short_lengths() -> None:
+    # Four characters, one from each class, in any order.
+    assert count_valid_secrets(4) == 24 * 26 * 26 * 10 * 32
+    assert count_valid_secrets(3) == 0
+
+
+def test_unrank_secret_maps_distinct_ranks_to_distinct_valid_secrets() -> None:
+    total = count_valid_secrets(4)
+    ranks = list(range(0, total, 211)) + [total - 1]
+    secrets_seen = {unrank_secret(rank, 4) for rank in ranks}
+
+    assert len(secrets_seen) == len(ranks)
+    assert all(check_secret_conditions(s, length=4) for s in secrets_seen)
+
+
+def test_unrank_secret_covers_longer_lengths() -> None:
+    total = count_valid_secrets(30)
+    for rank in (0, 1, total // 3, total // 2, total - 1):
+        secret = unrank_secret(rank, 30)
+        assert check_secret_conditions(secret, length=30)
+
+
+def test_generate_secrets_uses_one_bulk_draw_per_batch() -> None:
+    with patch(
+        "pwpush.utils.secrets.token_bytes", wraps=__import__("secrets").token_bytes
+    ) as mock_token_bytes:
+        results = list(generate_secrets(300, 20))
+
+    assert len(results) == 300
+    assert all(check_secret_conditions(s, length=20) for s in results)
+    # 300 secrets in batches of 256 -> two draws.
+    assert mock_token_bytes.call_count == 2
+
+
+def test_generate_secrets_is_roughly_uniform_over_characters() -> None:
+    counts = Counter("".join(generate_secrets(2000, 50)))
+
+    # 100k characters over 94 symbols: every symbol appears, none dominates.
+    assert len(counts) == 94
+    assert max(counts.values()) < 2 * min(counts.values())
+
+
+def test_generate_secret_rejects_too_short_length() -> None:
+    with pytest.raises(ValueError):
+        generate_secret(3)
+
+
+def test_generate_command_streams_requested_count() -> None:
+    result = runner.invoke(app, ["generate", "--count", "600", "--length", "16"])
+
+    assert result.exit_code == 0
+    lines = result.stdout.splitlines()
+    assert len(lines) == 600
+    assert all(check_secret_conditions(line, length=16) for line in lines)
+
+
+def test_generate_command_defaults_to_one_secret() -> None:
+    result = runner.invoke(app, ["generate"])
+
+    assert result.exit_code == 0
+    assert len(result.stdout.splitlines()) == 1
+    assert len(result.stdout.strip("\n")) == 50
+
+
+@pytest.mark.parametrize(
+    "args,message",
+    [
+        (["--count", "0"], "--count must be at least 1"),
+        (["--length", "3"], "--length must be at least 4"),
+    ],
+)
+def test_generate_command_rejects_invalid_options(
+    args: list[str], message: str
+) -> None:
+    result = runner.invoke(app, ["generate", *args])
+
+    assert result.exit_code == 1
+    assert message in result.stdout
+
+
+class _ClosedClientStream(io.TextIOBase):
+    """A stdout without a file descriptor whose reader has gone away."""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        raise BrokenPipeError
+
+
+def test_generate_command_stops_quietly_on_stream_without_descriptor() -> None:
+    with patch("sys.stdout", _ClosedClientStream()):
+        with pytest.raises(typer.Exit) as exit_info:
+            generate_cmd(count=3)
+
+    assert exit_info.value.exit_code == 0
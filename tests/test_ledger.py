@@ -0,0 +1,416 @@
+"""Tests for the opt-in local push ledger."""
+
+import json
+import os
+import sqlite3
+import stat
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from pwpush import ledger
+from pwpush.__main__ import app
+from pwpush.commands.config import user_config
+from pwpush.ledger import find_pushes, mark_expired, record_push, resolve_name
+
+# import the mocks
+from tests import *
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def enabled(monkeypatch):
+    monkeypatch.setitem(user_config["cli"], "ledger", "True")
+    monkeypatch.setitem(user_config["instance"], "url", "https://pwpush.test")
+    monkeypatch.setitem(user_config["instance"], "email", "user@test.com")
+    monkeypatch.setitem(user_config["instance"], "token", "valid-token")
+
+
+def _record(token, name=None, note=None, created_at="2024-01-15T10:30:00Z"):
+    record_push(
+        {"url_token": token, "created_at": created_at},
+        {"name": name, "note": note, "expire_after_days": "7"},
+        "text",
+    )
+
+
+class TestLedgerStorage:
+    """Tests for recording and querying pushes."""
+
+    def test_disabled_ledger_records_nothing(self):
+        _record("tok1", name="db")
+
+        assert not ledger.ledger_file.exists()
+
+    def test_find_by_prefix_is_case_insensitive(self, enabled):
+        _record("tok1", name="Prod DB", created_at="2024-01-01T00:00:00Z")
+        _record("tok2", name="prod api", created_at="2024-01-02T00:00:00Z")
+        _record("tok3", note="PRODUCTION rollout")
+        _record("tok4", name="staging")
+
+        by_name = find_pushes(name="PROD")
+        assert [push["url_token"] for push in by_name] == ["tok2", "tok1"]
+        assert by_name[0]["expire_after_days"] == 7
+        assert by_name[0]["kind"] == "text"
+
+        either = find_pushes("prod")
+        assert {push["url_token"] for push in either} == {"tok1", "tok2", "tok3"}
+        assert [push["url_token"] for push in find_pushes(note="prod")] == ["tok3"]
+
+    def test_find_is_scoped_to_instance(self, enabled, monkeypatch):
+        _record("tok1", name="db")
+        monkeypatch.setitem(user_config["instance"], "url", "https://other.test")
+
+        assert find_pushes("db") == []
+
+    def test_lookups_use_indexes(self, enabled):
+        _record("tok1", name="db")
+        with sqlite3.connect(ledger.ledger_file) as connection:
+            plans = [
+                " ".join(str(part) for part in row)
+                for sql in (
+                    "SELECT url_token FROM pushes WHERE instance = 'x' AND name = 'db'",
+                    "SELECT url_token FROM pushes WHERE instance = 'x'"
+                    " AND note >= 'a' AND note < 'b'",
+                )
+                for row in connection.execute("EXPLAIN QUERY PLAN " + sql)
+            ]
+
+        assert "USING INDEX pushes_instance_name" in plans[0]
+        assert "USING INDEX pushes_instance_note" in plans[1]
+
+    def test_older_ledger_gains_sync_columns(self, enabled):
+        ledger.ledger_file.parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(ledger.ledger_file) as connection:
+            connection.execute(
+                "CREATE TABLE pushes (url_token TEXT PRIMARY KEY, instance TEXT,"
+                " name TEXT, note TEXT, kind TEXT, expire_after_days INTEGER,"
+                " expire_after_views INTEGER, created_at TEXT NOT NULL,"
+                " expired_at TEXT)"
+            )
+        connection.close()
+
+        _record("tok1", name="db")
+
+        [push] = find_pushes("db")
+        assert push["views_remaining"] is None
+        assert push["synced_at"] is None
+
+    def test_ledger_files_are_private(self, enabled):
+        old_umask = os.umask(0o022)
+        try:
+            _record("tok1", name="db")
+        finally:
+            os.umask(old_umask)
+
+        files = [
+            ledger.ledger_file,
+            ledger.ledger_file.with_name("ledger.db-wal"),
+            ledger.ledger_file.with_name("ledger.db-shm"),
+        ]
+        assert all(path.exists() for path in files)
+        assert [stat.S_IMODE(path.stat().st_mode) for path in files] == [0o600] * 3
+
+    def test_existing_ledger_is_made_private(self, enabled):
+        ledger.ledger_file.parent.mkdir(parents=True, exist_ok=True)
+        ledger.ledger_file.touch(mode=0o644)
+        os.chmod(ledger.ledger_file, 0o644)
+
+        _record("tok1", name="db")
+
+        assert stat.S_IMODE(ledger.ledger_file.stat().st_mode) == 0o600
+
+    def test_resolve_name_skips_expired_pushes(self, enabled):
+        _record("tok1", name="db")
+        assert resolve_name("DB") == "tok1"
+
+        mark_expired("tok1")
+
+        with pytest.raises(ValueError, match="No active push named 'DB'"):
+            resolve_name("DB")
+        assert find_pushes("db", include_expired=True)[0]["expired_at"]
+
+    def test_resolve_name_rejects_ambiguous_names(self, enabled):
+        _record("tok1", name="db")
+        _record("tok2", name="db")
+
+        with pytest.raises(ValueError, match="Several active pushes"):
+            resolve_name("db")
+
+    def test_resolve_name_requires_enabled_ledger(self):
+        with pytest.raises(ValueError, match="ledger is disabled"):
+            resolve_name("db")
+
+
+class TestLedgerCommands:
+    """Tests for commands that write to or read from the ledger."""
+
+    def test_push_records_created_push(self, enabled, mock_make_request):
+        result = runner.invoke(
+            app, ["push", "--secret", "s3cret", "--name", "Vendor VPN", "--days", "3"]
+        )
+
+        assert result.exit_code == 0
+        [push] = find_pushes("vendor")
+        assert push["url_token"] == "super-token"
+        assert push["name"] == "Vendor VPN"
+        assert push["expire_after_days"] == 3
+        assert push["instance"] == "https://pwpush.test"
+
+    def test_expire_by_name_resolves_locally(self, enabled):
+        _record("tok1", name="db")
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"expired": True}
+
+        with (
+            patch("pwpush.__main__.current_api_profile", return_value="v2"),
+            patch("pwpush.__main__.make_request", return_value=response) as mock,
+        ):
+            result = runner.invoke(app, ["expire", "--name", "db"])
+
+        assert result.exit_code == 0
+        assert [call.args[:2] for call in mock.call_args_list] == [
+            ("DELETE", "/api/v2/pushes/tok1")
+        ]
+        assert find_pushes("db") == []
+
+    def test_audit_by_name_resolves_locally(self, enabled):
+        _record("tok1", name="db")
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"logs": []}
+
+        with (
+            patch("pwpush.__main__.current_api_profile", return_value="v2"),
+            patch("pwpush.__main__.make_request", return_value=response) as mock,
+        ):
+            result = runner.invoke(app, ["audit", "--name", "db"])
+
+        assert result.exit_code == 0
+        assert mock.call_args.args[1] == "/api/v2/pushes/tok1/audit"
+
+    def test_expire_unknown_name_fails_without_request(self, enabled):
+        with patch("pwpush.__main__.make_request") as mock:
+            result = runner.invoke(app, ["expire", "--name", "missing"])
+
+        assert result.exit_code == 1
+        assert "No active push named 'missing'" in result.stdout
+        mock.assert_not_called()
+
+    def test_ledger_find_json(self, enabled):
+        _record("tok1", name="db", note="rotate monthly")
+
+        result = runner.invoke(app, ["ledger", "find", "rot", "--json"])
+
+        assert result.exit_code == 0
+        [push] = json.loads(result.stdout)
+        assert push["url_token"] == "tok1"
+        assert push["note"] == "rotate monthly"
+
+    def test_ledger_find_table(self, enabled):
+        _record("tok1", name="db")
+
+        result = runner.invoke(app, ["ledger", "find"])
+
+        assert result.exit_code == 0
+        assert "tok1" in result.stdout
+        assert "01/15/2024" in result.stdout
+
+    def test_ledger_find_requires_enabled_ledger(self):
+        result = runner.invoke(app, ["ledger", "find", "db"])
+
+        assert result.exit_code == 1
+        assert "ledger is disabled" in result.stdout
+
+    def test_ledger_clear(self, enabled):
+        _record("tok1", name="db")
+
+        result = runner.invoke(app, ["ledger", "clear", "--yes"])
+
+        assert result.exit_code == 0
+        assert not ledger.ledger_file.exists()
+        assert find_pushes("db") == []
+
+
+class TestLedgerSync:
+    """Tests for reconciling the ledger with the server's push lists."""
+
+    ACTIVE = "/api/v2/pushes/active"
+    EXPIRED = "/api/v2/pushes/expired"
+    PAGED = {"X-Per-Page": "1"}
+
+    @staticmethod
+    def _push(token, views_remaining=5, **fields):
+        return {
+            "url_token": token,
+            "name": None,
+            "note": "",
+            "expire_after_views": 5,
+            "views_remaining": views_remaining,
+            "expire_after_days": 7,
+            "days_remaining": 7,
+            "created_at": "2024-01-15T10:30:00Z",
+            **fields,
+        }
+
+    @pytest.fixture
+    def server(self, enabled, fake_server):
+        return fake_server
+
+    @staticmethod
+    def _requests(mock):
+        return [
+            (call.args[1], call.kwargs.get("headers")) for call in mock.call_args_list
+        ]
+
+    def _sync(self):
+        result = runner.invoke(app, ["ledger", "sync", "--json"])
+        assert result.exit_code == 0, result.stdout
+        return {summary["list"]: summary for summary in json.loads(result.stdout)}
+
+    def test_first_sync_adds_server_pushes(self, server):
+        served, _ = server
+        served[self.ACTIVE] = (200, [self._push("tok1", 3)], {})
+        served[self.EXPIRED] = (
+            200,
+            [self._push("tok2", 0, expired_on="2024-01-16T00:00:00Z")],
+            {},
+        )
+
+        summaries = self._sync()
+
+        assert summaries["active"]["added"] == 1
+        assert summaries["expired"]["added"] == 1
+        [active] = find_pushes("", include_expired=False)
+        assert active["url_token"] == "tok1"
+        assert active["views_remaining"] == 3
+        expired = find_pushes("", include_expired=True)
+        assert {push["url_token"] for push in expired} == {"tok1", "tok2"}
+        assert [p for p in expired if p["url_token"] == "tok2"][0][
+            "expired_at"
+        ] == "2024-01-16T00:00:00Z"
+
+    def test_views_consumed_are_recorded(self, server):
+        served, _ = server
+        _record("tok1", name="db")
+        served[self.ACTIVE] = (200, [self._push("tok1", 4)], {})
+        served[self.EXPIRED] = (200, [], {})
+        self._sync()
+
+        served[self.ACTIVE] = (200, [self._push("tok1", 2)], {})
+        summaries = self._sync()
+
+        assert summaries["active"]["changed"] == 1
+        [push] = find_pushes("db")
+        assert push["views_remaining"] == 2
+        assert push["name"] == "db"
+
+    def test_pushes_missing_from_active_list_are_expired(self, server):
+        served, _ = server
+        _record("tok1", name="db")
+        _record("tok2", name="api")
+        served[self.ACTIVE] = (200, [self._push("tok2")], {})
+        served[self.EXPIRED] = (200, [], {})
+
+        summaries = self._sync()
+
+        assert summaries["active"]["expired"] == 1
+        assert find_pushes("db") == []
+        assert find_pushes("db", include_expired=True)[0]["expired_at"]
+        assert resolve_name("api") == "tok2"
+
+    def test_creation_times_are_compared_as_times(self, enabled):
+        _record("old", created_at="2024-01-15T10:29:59Z")
+        _record("same_second", created_at="2024-01-15T10:30:00Z")
+        _record("fraction", created_at="2024-01-15T10:30:00.900Z")
+        # Rows written by older versions kept the +00:00 form.
+        _record("legacy")
+        with sqlite3.connect(ledger.ledger_file) as connection:
+            connection.execute(
+                "UPDATE pushes SET created_at = '2024-01-15T10:30:00+00:00'"
+                " WHERE url_token = 'legacy'"
+            )
+        connection.close()
+
+        expired = ledger.expire_missing_pushes(set(), started_at="2024-01-15T10:30:00Z")
+
+        assert expired == 1
+        remaining = {push["url_token"] for push in find_pushes("")}
+        assert remaining == {"same_second", "fraction", "legacy"}
+
+    def test_timestamps_are_stored_in_utc_z_form(self, enabled):
+        _record("tok1", name="db", created_at="2024-01-15T12:30:00+02:00")
+
+        [push] = find_pushes("db")
+        assert push["created_at"] == "2024-01-15T10:30:00Z"
+
+    def test_unchanged_lists_are_not_walked_again(self, server):
+        served, mock = server
+        served[self.ACTIVE] = (200, [self._push("tok1")], {"ETag": '"a1"'})
+        served[self.EXPIRED] = (
+            200,
+            [],
+            {"Last-Modified": "Tue, 16 Jan 2024 00:00:00 GMT"},
+        )
+        self._sync()
+        mock.reset_mock()
+        served[self.ACTIVE] = (304, {}, {})
+        served[self.EXPIRED] = (304, {}, {})
+
+        summaries = self._sync()
+
+        assert summaries["active"]["not_modified"]
+        assert summaries["expired"]["not_modified"]
+        assert self._requests(mock) == [
+            (self.ACTIVE, {"If-None-Match": '"a1"'}),
+            (self.EXPIRED, {"If-Modified-Since": "Tue, 16 Jan 2024 00:00:00 GMT"}),
+        ]
+        assert find_pushes("", include_expired=False)[0]["url_token"] == "tok1"
+
+    def test_multi_page_active_list_is_always_walked(self, server):
+        served, mock = server
+        served[self.ACTIVE] = (
+            200,
+            [self._push("tok1")],
+            {"ETag": '"a1"', **self.PAGED},
+        )
+        served[self.ACTIVE + "?page=2"] = (200, [self._push("tok2")], self.PAGED)
+        served[self.EXPIRED] = (200, [], {})
+        self._sync()
+        mock.reset_mock()
+
+        self._sync()
+
+        assert self._requests(mock)[0] == (self.ACTIVE, None)
+
+    def test_expired_list_stops_at_first_known_page(self, server):
+        served, mock = server
+        served[self.ACTIVE] = (200, [], {})
+        served[self.EXPIRED] = (200, [self._push("tok1", 0)], self.PAGED)
+        served[self.EXPIRED + "?page=2"] = (200, [self._push("tok2", 0)], self.PAGED)
+        served[self.EXPIRED + "?page=3"] = (200, [self._push("tok3", 0)], self.PAGED)
+        self._sync()
+        mock.reset_mock()
+        served[self.EXPIRED] = (200, [self._push("tok4", 0)], self.PAGED)
+        served[self.EXPIRED + "?page=2"] = (200, [self._push("tok1", 0)], self.PAGED)
+
+        summaries = self._sync()
+
+        assert summaries["expired"] == {
+            "list": "expired",
+            "not_modified": False,
+            "pages": 2,
+            "added": 1,
+            "changed": 0,
+            "expired": 0,
+        }
+        assert self.EXPIRED + "?page=3" not in [
+            path for path, _ in self._requests(mock)
+        ]
+
+    def test_sync_requires_enabled_ledger(self):
+        result = runner.invoke(app, ["ledger", "sync"])
+
+        assert result.exit_code == 1
+        assert "ledger is disabled" in result.stdout
@@ -1,12 +1,17 @@
 """Tests for manage.py command error handling."""
 
+import json
+from datetime import timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
+from rich.cells import cell_len
 from typer.testing import CliRunner
 
 from pwpush.__main__ import app
+from pwpush.api.errors import PwpushConnectionError
 from pwpush.commands.config import user_config
+from pwpush.commands.manage import parse_age
 
 runner = CliRunner()
 
@@ -416,3 +421,573 @@ class TestAuditCommandJSONOutput:
         assert result.exit_code == 0
         # Pretty JSON should have indentation
         assert "  " in result.output or "{\n" in result.output
+
+
+class TestBulkExpire:
+    """Tests for expiring many pushes in one invocation."""
+
+    @pytest.fixture(autouse=True)
+    def logged_in(self, monkeypatch):
+        monkeypatch.setitem(user_config["instance"], "email", "user@test.com")
+        monkeypatch.setitem(user_config["instance"], "token", "valid-token")
+
+    @pytest.fixture
+    def mock_delete(self):
+        def fake_make_request(method, path, **kwargs):
+            response = MagicMock()
+            if "missing" in path:
+                response.status_code = 404
+                response.text = "Not found"
+                response.json.return_value = {"error": "Push not found"}
+            else:
+                response.status_code = 200
+                response.json.return_value = {"expired": True}
+            return response
+
+        with (
+            patch("pwpush.__main__.current_api_profile", return_value="v2"),
+            patch(
+                "pwpush.__main__.make_request", side_effect=fake_make_request
+            ) as mock,
+        ):
+            yield mock
+
+    @staticmethod
+    def _results(output):
+        return {
+            line["url_token"]: line
+            for line in (json.loads(text) for text in output.splitlines())
+        }
+
+    def test_expire_many_tokens_from_arguments(self, mock_delete):
+        result = runner.invoke(app, ["expire", "tok1", "tok2", "tok3", "-c", "2"])
+
+        assert result.exit_code == 0
+        results = self._results(result.stdout)
+        assert set(results) == {"tok1", "tok2", "tok3"}
+        assert all(line["expired"] for line in results.values())
+        paths = sorted(call.args[1] for call in mock_delete.call_args_list)
+        assert paths == [
+            "/api/v2/pushes/tok1",
+            "/api/v2/pushes/tok2",
+            "/api/v2/pushes/tok3",
+        ]
+
+    def test_expire_reads_list_json_from_stdin(self, mock_delete):
+        listing = json.dumps(
+            [{"url_token": "tok1", "note": ""}, {"url_token": "tok2", "note": ""}],
+            indent=2,
+        )
+
+        result = runner.invoke(app, ["expire", "--from", "-"], input=listing)
+
+        assert result.exit_code == 0
+        assert set(self._results(result.stdout)) == {"tok1", "tok2"}
+
+    def test_expire_reads_token_file_and_skips_duplicates(self, mock_delete, tmp_path):
+        token_file = tmp_path / "tokens.txt"
+        token_file.write_text('# revoked\ntok1\n\n{"url_token": "tok2"}\ntok1\n')
+
+        result = runner.invoke(app, ["expire", "--from", str(token_file)])
+
+        assert result.exit_code == 0
+        assert set(self._results(result.stdout)) == {"tok1", "tok2"}
+        assert mock_delete.call_count == 2
+
+    def test_expire_dash_argument_reads_stdin(self, mock_delete):
+        result = runner.invoke(app, ["expire", "-"], input="tok1\ntok2\n")
+
+        assert result.exit_code == 0
+        assert set(self._results(result.stdout)) == {"tok1", "tok2"}
+
+    def test_expire_many_reports_failures(self, mock_delete):
+        result = runner.invoke(app, ["expire", "tok1", "missing1"])
+
+        assert result.exit_code == 1
+        results = self._results(result.stdout)
+        assert results["tok1"]["expired"] is True
+        assert results["missing1"]["error"] == "Push not found"
+        assert results["missing1"]["status_code"] == 404
+
+    def test_expire_many_reports_connection_errors_per_token(self):
+        def fake_perform_request(method, *, path, **kwargs):
+            if "unreachable" in path:
+                raise PwpushConnectionError("Connection reset by peer")
+            return MagicMock(status_code=200)
+
+        with (
+            patch("pwpush.__main__.current_api_profile", return_value="v2"),
+            patch("pwpush.__main__.perform_request", side_effect=fake_perform_request),
+        ):
+            result = runner.invoke(app, ["expire", "tok1", "unreachable1"])
+
+        assert result.exit_code == 1
+        results = self._results(result.stdout)
+        assert results["tok1"]["expired"] is True
+        assert results["unreachable1"] == {
+            "url_token": "unreachable1",
+            "error": "Connection reset by peer",
+        }
+
+    def test_expire_missing_token_file_fails(self, mock_delete, tmp_path):
+        result = runner.invoke(app, ["expire", "--from", str(tmp_path / "absent.txt")])
+
+        assert result.exit_code == 1
+        assert "Token file" in result.stdout
+        mock_delete.assert_not_called()
+
+
+class TestSweep:
+    """Tests for filtered mass-expiry driven by the active list."""
+
+    ACTIVE = [
+        {
+            "url_token": "old1",
+            "name": "Contractor creds",
+            "note": "",
+            "kind": "text",
+            "created_at": "2020-01-01T00:00:00Z",
+            "views_remaining": 5,
+        },
+        {
+            "url_token": "old2",
+            "name": "",
+            "note": "db backup",
+            "kind": "file",
+            "created_at": "2020-01-02T00:00:00Z",
+            "views_remaining": 1,
+        },
+        {
+            "url_token": "new1",
+            "name": "contractor vpn",
+            "note": "",
+            "kind": "url",
+            "created_at": "2999-01-01T00:00:00Z",
+            "views_remaining": 1,
+        },
+    ]
+
+    @pytest.fixture(autouse=True)
+    def logged_in(self, monkeypatch):
+        monkeypatch.setitem(user_config["instance"], "email", "user@test.com")
+        monkeypatch.setitem(user_config["instance"], "token", "valid-token")
+
+    @pytest.fixture
+    def mock_api(self):
+        def fake_make_request(method, path, **kwargs):
+            response = MagicMock()
+            response.status_code = 200
+            if method == "GET":
+                response.json.return_value = self.ACTIVE
+            else:
+                response.json.return_value = {"expired": True}
+            return response
+
+        with (
+            patch("pwpush.__main__.current_api_profile", return_value="v2"),
+            patch(
+                "pwpush.__main__.make_request", side_effect=fake_make_request
+            ) as mock,
+        ):
+            yield mock
+
+    @staticmethod
+    def _deleted(mock):
+        return sorted(
+            call.args[1] for call in mock.call_args_list if call.args[0] == "DELETE"
+        )
+
+    def test_sweep_requires_a_filter(self, mock_api):
+        result = runner.invoke(app, ["sweep", "--yes"])
+
+        assert result.exit_code == 1
+        assert "at least one filter" in result.stdout
+        mock_api.assert_not_called()
+
+    def test_sweep_rejects_invalid_age(self, mock_api):
+        result = runner.invoke(app, ["sweep", "--older-than", "soon", "--yes"])
+
+        assert result.exit_code == 1
+        assert "Invalid age" in result.stdout
+        mock_api.assert_not_called()
+
+    def test_sweep_dry_run_lists_matches_without_expiring(self, mock_api):
+        result = runner.invoke(app, ["sweep", "--older-than", "30d", "--dry-run"])
+
+        assert result.exit_code == 0
+        lines = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [line["url_token"] for line in lines] == ["old1", "old2"]
+        assert all(line["dry_run"] for line in lines)
+        assert self._deleted(mock_api) == []
+        assert mock_api.call_args_list[0].args == ("GET", "/api/v2/pushes/active")
+
+    def test_sweep_combines_filters(self, mock_api):
+        result = runner.invoke(
+            app,
+            ["sweep", "--match", "(?i)contractor", "--max-views-remaining", "1", "-y"],
+        )
+
+        assert result.exit_code == 0
+        assert self._deleted(mock_api) == ["/api/v2/pushes/new1"]
+        assert json.loads(result.stdout) == {"url_token": "new1", "expired": True}
+
+    def test_sweep_filters_by_kind(self, mock_api):
+        result = runner.invoke(app, ["sweep", "--kind", "file", "--yes"])
+
+        assert result.exit_code == 0
+        assert self._deleted(mock_api) == ["/api/v2/pushes/old2"]
+
+    def test_sweep_declined_confirmation_expires_nothing(self, mock_api):
+        result = runner.invoke(app, ["sweep", "--older-than", "7d"], input="n\n")
+
+        assert result.exit_code == 1
+        assert self._deleted(mock_api) == []
+
+    def test_sweep_confirmed_expires_matches(self, mock_api):
+        result = runner.invoke(
+            app, ["sweep", "--older-than", "7d", "-c", "2"], input="y\n"
+        )
+
+        assert result.exit_code == 0
+        assert self._deleted(mock_api) == [
+            "/api/v2/pushes/old1",
+            "/api/v2/pushes/old2",
+        ]
+
+
+class TestParseAge:
+    """Tests for sweep age parsing."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("30m", timedelta(minutes=30)),
+            ("12h", timedelta(hours=12)),
+            ("7d", timedelta(days=7)),
+            ("2W", timedelta(weeks=2)),
+            ("3", timedelta(days=3)),
+        ],
+    )
+    def test_valid_ages(self, value, expected):
+        assert parse_age(value) == expected
+
+    @pytest.mark.parametrize("value", ["", "d", "-1d", "7y", "infd"])
+    def test_invalid_ages(self, value):
+        with pytest.raises(ValueError):
+            parse_age(value)
+
+
+class TestMultiAudit:
+    """Tests for auditing many pushes in one invocation."""
+
+    LOGS = {
+        "tok1": {
+            "logs": [
+                {"ip": "10.0.0.1", "created_at": "2024-01-15T12:00:00Z", "kind": "a"},
+                {"ip": "10.0.0.1", "created_at": "2024-01-15T09:00:00Z", "kind": "b"},
+            ]
+        },
+        "tok2": {
+            # Offsets are normalized to UTC before ordering.
+            "logs": [
+                {
+                    "ip": "10.0.0.2",
+                    "created_at": "2024-01-15T12:30:00+02:00",
+                    "kind": "c",
+                },
+            ]
+        },
+    }
+
+    @pytest.fixture(autouse=True)
+    def logged_in(self, monkeypatch):
+        monkeypatch.setitem(user_config["instance"], "email", "user@test.com")
+        monkeypatch.setitem(user_config["instance"], "token", "valid-token")
+
+    @pytest.fixture
+    def mock_api(self):
+        def fake_make_request(method, path, **kwargs):
+            response = MagicMock()
+            token = path.split("/")[-2]
+            if path == "/api/v2/pushes/active":
+                response.status_code = 200
+                response.json.return_value = [
+                    {"url_token": "tok1"},
+                    {"url_token": "tok2"},
+                ]
+            elif token in self.LOGS:
+                response.status_code = 200
+                response.json.return_value = self.LOGS[token]
+            else:
+                response.status_code = 404
+                response.text = "Not found"
+                response.json.return_value = {"error": "Push not found"}
+            return response
+
+        with (
+            patch("pwpush.__main__.current_api_profile", return_value="v2"),
+            patch(
+                "pwpush.__main__.make_request", side_effect=fake_make_request
+            ) as mock,
+        ):
+            yield mock
+
+    def test_audit_many_merges_events_by_time(self, mock_api):
+        result = runner.invoke(app, ["audit", "--json", "tok1", "tok2", "-c", "2"])
+
+        assert result.exit_code == 0
+        lines = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [(line["url_token"], line["kind"]) for line in lines] == [
+            ("tok1", "B"),
+            ("tok2", "C"),
+            ("tok1", "A"),
+        ]
+        assert lines[1]["timestamp"] == "2024-01-15T10:30:00Z"
+        assert lines[0]["successful"] is True
+
+    def test_audit_all_active_pushes(self, mock_api):
+        result = runner.invoke(app, ["audit", "--json", "--all"])
+
+        assert result.exit_code == 0
+        assert len(result.stdout.splitlines()) == 3
+        paths = sorted(call.args[1] for call in mock_api.call_args_list)
+        assert paths == [
+            "/api/v2/pushes/active",
+            "/api/v2/pushes/tok1/audit",
+            "/api/v2/pushes/tok2/audit",
+        ]
+
+    def test_audit_many_reports_failures(self, mock_api):
+        result = runner.invoke(app, ["audit", "--json", "tok1", "missing"])
+
+        assert result.exit_code == 1
+        lines = [json.loads(line) for line in result.stdout.splitlines()]
+        assert lines[0] == {
+            "url_token": "missing",
+            "error": "Push not found",
+            "status_code": 404,
+        }
+        assert len(lines) == 3
+
+    def test_audit_many_reports_connection_errors_per_token(self):
+        def fake_perform_request(method, *, path, **kwargs):
+            if "unreachable" in path:
+                raise PwpushConnectionError("Connection reset by peer")
+            response = MagicMock(status_code=200)
+            response.json.return_value = self.LOGS["tok1"]
+            return response
+
+        with (
+            patch("pwpush.__main__.current_api_profile", return_value="v2"),
+            patch("pwpush.__main__.perform_request", side_effect=fake_perform_request),
+        ):
+            result = runner.invoke(app, ["audit", "--json", "tok1", "unreachable"])
+
+        assert result.exit_code == 1
+        lines = [json.loads(line) for line in result.stdout.splitlines()]
+        assert lines[0] == {
+            "url_token": "unreachable",
+            "error": "Connection reset by peer",
+        }
+        assert [line["url_token"] for line in lines[1:]] == ["tok1", "tok1"]
+
+    def test_audit_many_table_output(self, mock_api):
+        result = runner.invoke(app, ["audit", "--from", "-"], input="tok1\ntok2\n")
+
+        assert result.exit_code == 0
+        assert "Push" in result.stdout
+        assert "tok2" in result.stdout
+        assert result.stdout.index("09:00:00") < result.stdout.index("10:30:00")
+
+
+class TestListPagination:
+    """Tests for paginated, streaming list output."""
+
+    NEXT = {"Link": '<https://x.test/api/v2/pushes/active?page=2>; rel="next"'}
+
+    @staticmethod
+    def _push(token):
+        return {
+            "url_token": token,
+            "note": "",
+            "expire_after_views": 5,
+            "views_remaining": 5,
+            "expire_after_days": 7,
+            "days_remaining": 7,
+            "deletable_by_viewer": False,
+            "retrieval_step": False,
+            "created_at": "2024-01-15T10:30:00Z",
+        }
+
+    @pytest.fixture(autouse=True)
+    def logged_in(self, monkeypatch):
+        monkeypatch.setitem(user_config["instance"], "email", "user@test.com")
+        monkeypatch.setitem(user_config["instance"], "token", "valid-token")
+
+    @pytest.fixture
+    def pages(self, fake_server):
+        return fake_server
+
+    @staticmethod
+    def _paths(mock):
+        return [call.args[1] for call in mock.call_args_list]
+
+    def test_list_follows_pages_until_short_page(self, pages):
+        served, mock = pages
+        served["/api/v2/pushes/active"] = (
+            200,
+            [self._push("a"), self._push("b")],
+            self.NEXT,
+        )
+        served["/api/v2/pushes/active?page=2"] = (200, [self._push("c")], {})
+
+        result = runner.invoke(app, ["list", "--ndjson"])
+
+        assert result.exit_code == 0
+        tokens = [json.loads(line)["url_token"] for line in result.stdout.splitlines()]
+        assert tokens == ["a", "b", "c"]
+        assert self._paths(mock) == [
+            "/api/v2/pushes/active",
+            "/api/v2/pushes/active?page=2",
+        ]
+
+    def test_list_without_pagination_headers_fetches_one_page(self, pages):
+        served, mock = pages
+        everything = [self._push("a"), self._push("b")]
+        served["/api/v2/pushes/active"] = (200, everything, {})
+        served["/api/v2/pushes/active?page=2"] = (200, everything, {})
+
+        result = runner.invoke(app, ["list", "--json"])
+
+        assert result.exit_code == 0
+        assert [push["url_token"] for push in json.loads(result.stdout)] == ["a", "b"]
+        assert self._paths(mock) == ["/api/v2/pushes/active"]
+
+    def test_list_stops_when_server_ignores_page(self, pages):
+        served, mock = pages
+        everything = [self._push("a"), self._push("b")]
+        served["/api/v2/pushes/active"] = (200, everything, {"X-Per-Page": "2"})
+        served["/api/v2/pushes/active?page=2"] = (200, everything, {"X-Per-Page": "2"})
+
+        result = runner.invoke(app, ["list", "--json"])
+
+        assert result.exit_code == 0
+        assert [push["url_token"] for push in json.loads(result.stdout)] == ["a", "b"]
+        assert len(self._paths(mock)) == 2
+
+    def test_list_follows_total_pages_header(self, pages):
+        served, mock = pages
+        served["/api/v2/pushes/active"] = (
+            200,
+            [self._push("a")],
+            {"X-Total-Pages": "2"},
+        )
+        served["/api/v2/pushes/active?page=2"] = (
+            200,
+            [self._push("b")],
+            {"X-Total-Pages": "2"},
+        )
+
+        result = runner.invoke(app, ["list", "--ndjson"])
+
+        assert [
+            json.loads(line)["url_token"] for line in result.stdout.splitlines()
+        ] == ["a", "b"]
+        assert len(self._paths(mock)) == 2
+
+    def test_list_skips_pushes_shifted_between_pages(self, pages):
+        served, _ = pages
+        served["/api/v2/pushes/active"] = (
+            200,
+            [self._push("a"), self._push("b")],
+            self.NEXT,
+        )
+        served["/api/v2/pushes/active?page=2"] = (
+            200,
+            [self._push("b"), self._push("c")],
+            {},
+        )
+
+        result = runner.invoke(app, ["list", "--ndjson"])
+
+        tokens = [json.loads(line)["url_token"] for line in result.stdout.splitlines()]
+        assert tokens == ["a", "b", "c"]
+
+    def test_list_honours_link_header(self, pages):
+        served, mock = pages
+        served["/api/v2/pushes/active"] = (
+            200,
+            [self._push("a")],
+            {"Link": '<https://x.test/api/v2/pushes/active?page=1>; rel="first"'},
+        )
+
+        result = runner.invoke(app, ["list", "--ndjson"])
+
+        assert result.exit_code == 0
+        assert self._paths(mock) == ["/api/v2/pushes/active"]
+
+    def test_list_limit_stops_fetching(self, pages):
+        served, mock = pages
+        served["/api/v2/pushes/active"] = (200, [self._push("a"), self._push("b")], {})
+
+        result = runner.invoke(app, ["list", "--ndjson", "--limit", "1"])
+
+        assert result.exit_code == 0
+        assert [
+            json.loads(line)["url_token"] for line in result.stdout.splitlines()
+        ] == ["a"]
+        assert self._paths(mock) == ["/api/v2/pushes/active"]
+
+    def test_list_rejects_invalid_limit(self, pages):
+        _, mock = pages
+
+        result = runner.invoke(app, ["list", "--limit", "0"])
+
+        assert result.exit_code == 1
+        mock.assert_not_called()
+
+    def test_list_table_streams_every_page(self, pages):
+        served, _ = pages
+        served["/api/v2/pushes/active"] = (
+            200,
+            [self._push("a"), self._push("b")],
+            self.NEXT,
+        )
+        served["/api/v2/pushes/active?page=2"] = (200, [self._push("c")], {})
+
+        result = runner.invoke(app, ["list"])
+
+        assert result.exit_code == 0
+        lines = result.stdout.splitlines()
+        assert any(line.startswith("Secret URL Token") for line in lines)
+        rows = [line.split()[0] for line in lines if "01/15/2024" in line]
+        assert rows == ["a", "b", "c"]
+
+    def test_list_table_ends_long_notes_with_an_ellipsis(self, pages):
+        served, _ = pages
+        push = {**self._push("a"), "note": "x" * 30}
+        wide = {**self._push("b"), "note": "日本語" * 6}
+        served["/api/v2/pushes/active"] = (200, [push, wide], {})
+
+        result = runner.invoke(app, ["list"])
+
+        assert result.exit_code == 0
+        rows = [line for line in result.stdout.splitlines() if "01/15/2024" in line]
+        assert rows[0].split()[1] == "x" * 23 + "…"
+        assert "…" in rows[1] and "日本語" * 6 not in rows[1]
+        # Both rows line up in terminal cells, however wide their characters
+        assert len({cell_len(row[: row.index("01/15/2024")]) for row in rows}) == 1
+
+    def test_list_error_on_later_page(self, pages):
+        served, _ = pages
+        served["/api/v2/pushes/active"] = (
+            200,
+            [self._push("a"), self._push("b")],
+            self.NEXT,
+        )
+        served["/api/v2/pushes/active?page=2"] = (500, {"error": "Boom"}, {})
+
+        result = runner.invoke(app, ["list", "--ndjson"])
+
+        assert result.exit_code == 1
+        assert "Boom" in result.stdout
@@ -10,11 +10,11 @@ from pwpush.__main__ import app
 from pwpush.api.client import (
     _sanitize_headers,
     build_auth_headers,
-    get_retry_delay,
     is_rate_limit_error,
     normalize_base_url,
     send_request,
 )
+from pwpush.api.retry import RetryPolicy
 
 runner = CliRunner()
 
@@ -99,7 +99,7 @@ class TestBuildAuthHeaders:
 class TestSendRequestErrors:
     """Tests for send_request error handling."""
 
-    @patch("pwpush.api.client.requests.get")
+    @patch("requests.Session.get")
     @patch("pwpush.api.client.rprint")
     def test_timeout_error(self, mock_rprint, mock_get):
         """Test that timeout raises typer.Exit."""
@@ -119,7 +119,7 @@ class TestSendRequestErrors:
         mock_rprint.assert_called_once()
         assert "timed out" in str(mock_rprint.call_args).lower()
 
-    @patch("pwpush.api.client.requests.get")
+    @patch("requests.Session.get")
     @patch("pwpush.api.client.rprint")
     def test_connection_error(self, mock_rprint, mock_get):
         """Test that connection error raises typer.Exit."""
@@ -139,7 +139,7 @@ class TestSendRequestErrors:
         mock_rprint.assert_called_once()
         assert "could not connect" in str(mock_rprint.call_args).lower()
 
-    @patch("pwpush.api.client.requests.get")
+    @patch("requests.Session.get")
     @patch("pwpush.api.client.rprint")
     def test_generic_request_exception(self, mock_rprint, mock_get):
         """Test that generic request exception raises typer.Exit."""
@@ -165,7 +165,7 @@ class TestSendRequestErrors:
 class TestSendRequestDebugOutput:
     """Tests for send_request debug output."""
 
-    @patch("pwpush.api.client.requests.get")
+    @patch("requests.Session.get")
     @patch("pwpush.api.client.rprint")
     def test_debug_output_with_auth(self, mock_rprint, mock_get):
         """Test that debug output shows redacted headers."""
@@ -187,7 +187,7 @@ class TestSendRequestDebugOutput:
         assert any("Communicating with" in str(call) for call in debug_calls)
         assert any("***REDACTED***" in str(call) for call in debug_calls)
 
-    @patch("pwpush.api.client.requests.get")
+    @patch("requests.Session.get")
     @patch("pwpush.api.client.rprint")
     def test_debug_output_ssl_warning(self, mock_rprint, mock_get):
         """Test that debug output shows SSL warning when verify=False."""
@@ -294,58 +294,59 @@ class TestRateLimitDetection:
 class TestRetryDelayCalculation:
     """Tests for retry delay calculation."""
 
-    def test_get_retry_delay_uses_retry_after_header(self):
+    def test_retry_delay_uses_retry_after_header(self):
         """Test that Retry-After header value is used when present."""
         mock_response = MagicMock()
         mock_response.headers = {"retry-after": "10"}
 
-        delay = get_retry_delay(mock_response, attempt=0)
+        delay = RetryPolicy().next_delay(mock_response, 0, 0, 0)
 
         assert delay == 10.0
 
-    def test_get_retry_delay_caps_at_max_delay(self):
-        """Test that Retry-After values above max are capped."""
+    def test_retry_delay_caps_at_max_delay(self):
+        """Test that Retry-After values above max are capped without a deadline."""
         mock_response = MagicMock()
         mock_response.headers = {"retry-after": "100"}  # Above MAX_BACKOFF_DELAY (30)
 
-        delay = get_retry_delay(mock_response, attempt=0)
+        delay = RetryPolicy().next_delay(mock_response, 0, 0, 0)
 
         assert delay == 30.0  # Should be capped
 
-    def test_get_retry_delay_exponential_backoff(self):
-        """Test exponential backoff calculation without header."""
+    def test_retry_delay_honours_retry_after_within_deadline(self):
+        """Test that a deadline lets a long Retry-After be waited in full."""
         mock_response = MagicMock()
-        mock_response.headers = {}
+        mock_response.headers = {"retry-after": "100"}
+
+        assert RetryPolicy(deadline=120).next_delay(mock_response, 0, 0, 0) == 100.0
+        assert RetryPolicy(deadline=60).next_delay(mock_response, 0, 0, 0) is None
 
-        # Test that delay increases with attempt number
-        delay_0 = get_retry_delay(mock_response, attempt=0, base_delay=1.0)
-        delay_1 = get_retry_delay(mock_response, attempt=1, base_delay=1.0)
-        delay_2 = get_retry_delay(mock_response, attempt=2, base_delay=1.0)
+    def test_retry_delay_exponential_backoff(self):
+        """Test exponential backoff calculation without header."""
+        policy = RetryPolicy(base_delay=1.0)
+
+        # Delays grow from the previous one, with jitter, within the bounds
+        delay_0 = policy.backoff(0, 0)
+        delay_1 = policy.backoff(1, delay_0)
+        delay_2 = policy.backoff(2, delay_1)
 
-        # Delay should generally increase (with jitter, so we check ranges)
         assert 1.0 <= delay_0 <= 30.0
         assert 1.0 <= delay_1 <= 30.0
         assert 1.0 <= delay_2 <= 30.0
 
-        # Higher attempts should have higher potential delay
-        # (1 * 2^0 = 1, 1 * 2^1 = 2, 1 * 2^2 = 4)
-        assert delay_0 < delay_2 + 1  # Allow for jitter variance
-
-    def test_get_retry_delay_minimum_is_base_delay(self):
+    def test_retry_delay_minimum_is_base_delay(self):
         """Test that delay is at least the base delay."""
         mock_response = MagicMock()
         mock_response.headers = {}
 
-        # With full jitter, delay could be very small, but we enforce minimum
-        delay = get_retry_delay(mock_response, attempt=0, base_delay=2.0)
+        delay = RetryPolicy(base_delay=2.0).next_delay(mock_response, 0, 0, 0)
 
-        assert delay >= 2.0
+        assert delay is not None and delay >= 2.0
 
 
 class TestRateLimitRetryLogic:
     """Tests for rate limit retry behavior in send_request."""
 
-    @patch("pwpush.api.client.requests.post")
+    @patch("requests.Session.post")
     @patch("pwpush.api.client.time.sleep")
     def test_retries_on_rate_limit_and_succeeds(self, mock_sleep, mock_post):
         """Test that request is retried on rate limit and eventually succeeds."""
@@ -378,7 +379,7 @@ class TestRateLimitRetryLogic:
         assert mock_post.call_count == 3
         assert mock_sleep.call_count == 2  # Slept between retries
 
-    @patch("pwpush.api.client.requests.post")
+    @patch("requests.Session.post")
     @patch("pwpush.api.client.time.sleep")
     def test_rate_limit_callback_invoked(self, mock_sleep, mock_post):
         """Test that on_rate_limit_retry callback is called."""
@@ -412,7 +413,7 @@ class TestRateLimitRetryLogic:
         assert callback_calls[0][1] == 1.0  # delay from retry-after header
         assert callback_calls[0][2] == 403  # response status
 
-    @patch("pwpush.api.client.requests.post")
+    @patch("requests.Session.post")
     @patch("pwpush.api.client.time.sleep")
     @patch("pwpush.api.client.rprint")
     def test_returns_final_rate_limit_response_after_exhausting_retries(
@@ -446,7 +447,7 @@ class TestRateLimitRetryLogic:
         assert response.status_code == 403
         assert mock_sleep.call_count == 2
 
-    @patch("pwpush.api.client.requests.get")
+    @patch("requests.Session.get")
     @patch("pwpush.api.client.time.sleep")
     def test_no_retry_on_non_rate_limit_403(self, mock_sleep, mock_get):
         """Test that non-rate-limit 403 errors are not retried."""
@@ -469,7 +470,7 @@ class TestRateLimitRetryLogic:
         assert mock_get.call_count == 1  # Only one request, no retries
         assert mock_sleep.call_count == 0  # No sleep, no retries
 
-    @patch("pwpush.api.client.requests.post")
+    @patch("requests.Session.post")
     @patch("pwpush.api.client.time.sleep")
     def test_respects_max_retries_parameter(self, mock_sleep, mock_post):
         """Test that max_retries parameter controls retry count."""
@@ -498,8 +499,8 @@ class TestRateLimitRetryLogic:
 class TestRateLimitCLIIntegration:
     """Tests for CLI integration with rate limit handling."""
 
-    @patch("pwpush.api.client.requests.post")
-    @patch("pwpush.api.client.requests.get")
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
     @patch("pwpush.api.client.time.sleep")
     def test_push_exits_with_code_1_on_rate_limit_after_retries(
         self, mock_sleep, mock_get, mock_post
@@ -523,8 +524,8 @@ class TestRateLimitCLIIntegration:
         # Should have made multiple requests (initial + retries)
         assert mock_post.call_count > 1
 
-    @patch("pwpush.api.client.requests.post")
-    @patch("pwpush.api.client.requests.get")
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
     @patch("pwpush.api.client.time.sleep")
     def test_push_outputs_error_to_stderr_on_rate_limit(
         self, mock_sleep, mock_get, mock_post
@@ -551,8 +552,8 @@ class TestRateLimitCLIIntegration:
             or "error" in result.output.lower()
         )
 
-    @patch("pwpush.api.client.requests.post")
-    @patch("pwpush.api.client.requests.get")
+    @patch("requests.Session.post")
+    @patch("requests.Session.get")
     @patch("pwpush.api.client.time.sleep")
     def test_push_success_after_rate_limit_retry(self, mock_sleep, mock_get, mock_post):
         """Test that push succeeds when rate limit clears on retry."""
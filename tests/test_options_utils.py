@@ -1,5 +1,6 @@
 """Tests for options.py and utils.py missing coverage."""
 
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -16,9 +17,15 @@ from pwpush.options import (
 )
 from pwpush.utils import (
     check_secret_conditions,
+    clear_wordlist_cache,
+    format_timestamp,
+    generate_passphrase,
     generate_secret,
     mask_sensitive_value,
     parse_boolean,
+    parse_timestamp,
+    passphrase_wordlist,
+    utc_timestamp,
 )
 
 
@@ -139,6 +146,126 @@ class TestGenerateSecretRetry:
         assert check_secret_conditions(secret, length=20) is True
 
 
+class TestPassphraseWordlist:
+    """Tests for the cached passphrase wordlist."""
+
+    def setup_method(self):
+        clear_wordlist_cache()
+
+    def teardown_method(self):
+        clear_wordlist_cache()
+
+    def test_wordlist_is_filtered_and_cached_on_disk(self, tmp_path):
+        words = passphrase_wordlist()
+
+        assert words == sorted(words)
+        assert all(5 <= len(word) <= 9 for word in words)
+        cache_files = list(tmp_path.glob("wordlist-*.txt"))
+        assert len(cache_files) == 1
+        assert cache_files[0].read_text(encoding="utf-8").split("\n") == words
+
+    def test_wordlist_is_built_once_per_process(self):
+        with patch(
+            "xkcdpass.xkcd_password.generate_wordlist", return_value=["alpha"]
+        ) as mock_generate:
+            first = passphrase_wordlist()
+            second = passphrase_wordlist()
+
+        assert first is second
+        mock_generate.assert_called_once()
+
+    def test_wordlist_loads_from_disk_cache(self, tmp_path):
+        passphrase_wordlist()
+        cache_file = next(tmp_path.glob("wordlist-*.txt"))
+        cache_file.write_text("cached\nwords", encoding="utf-8")
+        clear_wordlist_cache()
+
+        with patch("xkcdpass.xkcd_password.generate_wordlist") as mock_generate:
+            assert passphrase_wordlist() == ["cached", "words"]
+        mock_generate.assert_not_called()
+
+    def test_wordlist_cache_is_keyed_by_xkcdpass_version(self, tmp_path):
+        passphrase_wordlist()
+        clear_wordlist_cache()
+
+        with patch("importlib.metadata.version", return_value="99.0"):
+            passphrase_wordlist()
+
+        names = sorted(path.name for path in tmp_path.glob("wordlist-*.txt"))
+        assert len(names) == 2
+        assert names[1].startswith("wordlist-99.0-")
+
+    def test_generate_passphrase_uses_cached_wordlist(self):
+        with patch("xkcdpass.xkcd_password.generate_wordlist", return_value=["apple"]):
+            passphrase = generate_passphrase(3)
+
+        assert passphrase.lower().count("apple") == 3
+
+
+class TestTimestamps:
+    """Tests for the fast ISO-8601 timestamp helpers."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2024-01-15T10:30:00Z",
+            "2024-01-15T10:30:00.5Z",
+            "2024-01-15T10:30:00.000100Z",
+            "2024-01-15T10:30:00.123456789Z",
+            "2024-01-15T12:30:00+02:00",
+            "2024-01-15T05:00:00-05:30",
+            "2024-01-15 10:30:00",
+            "20240115T103000Z",
+            "2024-01-15",
+        ],
+    )
+    def test_matches_dateutil(self, value):
+        from dateutil import parser
+
+        expected = parser.isoparse(value)
+        if expected.tzinfo is None:
+            expected = expected.replace(tzinfo=timezone.utc)
+        expected = expected.astimezone(timezone.utc)
+
+        assert parse_timestamp(value) == expected
+        assert format_timestamp(value) == expected.strftime("%m/%d/%Y, %H:%M:%S UTC")
+        assert utc_timestamp(value) == (expected.replace(tzinfo=None).isoformat() + "Z")
+
+    def test_server_shape_skips_dateutil(self):
+        parse_timestamp.cache_clear()
+        with patch("dateutil.parser.isoparse") as mock_isoparse:
+            when = parse_timestamp("2031-02-03T04:05:06.789Z")
+            format_timestamp("2031-02-03T04:05:06.789+01:00")
+
+        assert when == datetime(2031, 2, 3, 4, 5, 6, 789000, tzinfo=timezone.utc)
+        mock_isoparse.assert_not_called()
+
+    def test_out_of_range_fields_fall_back_to_dateutil(self):
+        assert parse_timestamp("2024-01-15T24:00:00Z") == datetime(
+            2024, 1, 16, tzinfo=timezone.utc
+        )
+
+    @pytest.mark.parametrize(
+        "value", ["2024-13-15T10:30:00Z", "2024-02-30T10:30:00Z", "2024-01-15T10:61:00"]
+    )
+    def test_formatting_rejects_out_of_range_fields(self, value):
+        with pytest.raises(ValueError):
+            format_timestamp(value)
+        with pytest.raises(ValueError):
+            utc_timestamp(value)
+
+    def test_formatting_hour_24_matches_parsing(self):
+        value = "2024-01-15T24:00:00Z"
+
+        assert format_timestamp(value) == "01/16/2024, 00:00:00 UTC"
+        assert utc_timestamp(value) == "2024-01-16T00:00:00Z"
+
+    @pytest.mark.parametrize("value", ["", "yesterday", "2024-13-45T10:30:00"])
+    def test_invalid_timestamps_raise_value_error(self, value):
+        with pytest.raises(ValueError):
+            parse_timestamp(value)
+
+
 class TestValidateUserConfig:
     """Tests for validate_user_config function."""
 
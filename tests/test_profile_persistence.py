@@ -1,10 +1,16 @@
 """Tests for API profile caching."""
 
+from typing import Any
+
 import time
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from pwpush.__main__ import app, current_api_profile, wait_for_profile_refresh
+from pwpush.options import config_lock, user_config
 
-from pwpush.__main__ import current_api_profile
-from pwpush.options import user_config
+runner = CliRunner()
 
 
 def _instance_backup() -> dict[str, str]:
@@ -60,3 +66,147 @@ def test_current_api_profile_refreshes_expired_persisted_profile() -> None:
             assert user_config["instance"]["api_profile"] == "v2"
     finally:
         _restore_instance(backup)
+
+
+def test_current_api_profile_serves_stale_profile_while_refreshing() -> None:
+    backup = _instance_backup()
+    try:
+        user_config["instance"]["url"] = "https://example.test"
+        user_config["instance"]["api_profile"] = "legacy"
+        user_config["instance"]["api_profile_checked_at"] = str(int(time.time()) - 7200)
+        user_config["instance"]["api_profile_ttl_seconds"] = "60"
+        user_config["instance"]["api_profile_background_refresh"] = "True"
+
+        with (
+            patch(
+                "pwpush.__main__.detect_api_profile", return_value="v2"
+            ) as detect_mock,
+            patch("pwpush.__main__.save_config") as save_mock,
+        ):
+            profile = current_api_profile()
+            wait_for_profile_refresh(timeout=5)
+
+            assert profile == "legacy"
+            detect_mock.assert_called_once()
+            save_mock.assert_called_once()
+            assert user_config["instance"]["api_profile"] == "v2"
+    finally:
+        user_config["instance"]["api_profile_background_refresh"] = "False"
+        _restore_instance(backup)
+
+
+def test_background_refresh_waits_for_the_config_lock() -> None:
+    backup = _instance_backup()
+    try:
+        user_config["instance"]["url"] = "https://example.test"
+        user_config["instance"]["api_profile"] = "legacy"
+        user_config["instance"]["api_profile_checked_at"] = str(int(time.time()) - 7200)
+        user_config["instance"]["api_profile_ttl_seconds"] = "60"
+        user_config["instance"]["api_profile_background_refresh"] = "True"
+
+        with (
+            patch("pwpush.__main__.detect_api_profile", return_value="v2"),
+            patch("pwpush.__main__.save_config") as save_mock,
+        ):
+            with config_lock:
+                assert current_api_profile() == "legacy"
+                wait_for_profile_refresh(timeout=0.2)
+
+                save_mock.assert_not_called()
+                assert user_config["instance"]["api_profile"] == "legacy"
+
+            wait_for_profile_refresh(timeout=5)
+            save_mock.assert_called_once()
+            assert user_config["instance"]["api_profile"] == "v2"
+    finally:
+        user_config["instance"]["api_profile_background_refresh"] = "False"
+        _restore_instance(backup)
+
+
+def test_current_api_profile_blocks_when_no_profile_recorded() -> None:
+    backup = _instance_backup()
+    try:
+        user_config["instance"]["url"] = "https://example.test"
+        user_config["instance"]["api_profile"] = "Not Set"
+        user_config["instance"]["api_profile_checked_at"] = "0"
+        user_config["instance"]["api_profile_background_refresh"] = "True"
+
+        with (
+            patch("pwpush.__main__.detect_api_profile", return_value="v2"),
+            patch("pwpush.__main__.save_config"),
+        ):
+            assert current_api_profile() == "v2"
+    finally:
+        user_config["instance"]["api_profile_background_refresh"] = "False"
+        _restore_instance(backup)
+
+
+def _speculative_response(
+    status_code: int, body: dict[str, Any] | None = None
+) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = body or {}
+    return response
+
+
+def test_speculative_push_falls_back_to_legacy_and_records_profile() -> None:
+    backup = _instance_backup()
+    try:
+        user_config["instance"]["url"] = "https://example.test"
+        user_config["instance"]["api_profile"] = "Not Set"
+        user_config["instance"]["api_profile_checked_at"] = "0"
+        user_config["instance"]["api_profile_speculative"] = "True"
+
+        responses = {
+            "/api/v2/pushes": _speculative_response(404),
+            "/p.json": _speculative_response(201, {"url_token": "tok"}),
+            "/p/tok/preview.json": _speculative_response(
+                200, {"url": "https://example.test/p/tok"}
+            ),
+        }
+
+        with (
+            patch("pwpush.__main__.detect_api_profile") as detect_mock,
+            patch(
+                "pwpush.__main__.make_request",
+                side_effect=lambda method, path, **kwargs: responses[path],
+            ) as request_mock,
+        ):
+            result = runner.invoke(app, ["push", "--secret", "s3cret"])
+
+        assert result.exit_code == 0
+        assert "https://example.test/p/tok" in result.output
+        detect_mock.assert_not_called()
+        paths = [call.args[1] for call in request_mock.call_args_list]
+        assert paths == ["/api/v2/pushes", "/p.json", "/p/tok/preview.json"]
+        legacy_post = request_mock.call_args_list[1].kwargs["post_data"]
+        assert legacy_post["password"]["payload"] == "s3cret"
+        assert user_config["instance"]["api_profile"] == "legacy"
+    finally:
+        user_config["instance"]["api_profile_speculative"] = "False"
+        _restore_instance(backup)
+
+
+def test_speculative_expire_records_v2_on_success() -> None:
+    backup = _instance_backup()
+    try:
+        user_config["instance"]["url"] = "https://example.test"
+        user_config["instance"]["token"] = "token-value"
+        user_config["instance"]["api_profile"] = "Not Set"
+        user_config["instance"]["api_profile_checked_at"] = "0"
+        user_config["instance"]["api_profile_speculative"] = "True"
+
+        with patch(
+            "pwpush.__main__.make_request",
+            return_value=_speculative_response(200, {"expired": True}),
+        ) as request_mock:
+            result = runner.invoke(app, ["expire", "tok"])
+
+        assert result.exit_code == 0
+        request_mock.assert_called_once()
+        assert request_mock.call_args.args[1] == "/api/v2/pushes/tok"
+        assert user_config["instance"]["api_profile"] == "v2"
+    finally:
+        user_config["instance"]["api_profile_speculative"] = "False"
+        _restore_instance(backup)
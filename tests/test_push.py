@@ -1,5 +1,7 @@
 """Tests for push commands."""
 
+import json
+import os
 from unittest.mock import patch
 
 import pytest
@@ -8,6 +10,7 @@ from typer.testing import CliRunner
 
 import pwpush
 from pwpush.__main__ import app
+from pwpush.api.errors import PwpushTimeoutError
 from pwpush.commands.config import user_config
 from pwpush.utils import check_secret_conditions, generate_passphrase, generate_secret
 
@@ -33,10 +36,10 @@ def test_push_auto(mock_make_request):
 
 def test_basic_push_passphrase(monkeypatch):
     monkeypatch.setattr(
-        requests, "post", build_request_mock({"url_token": "super-token"})
+        requests.Session, "post", build_request_mock({"url_token": "super-token"})
     )
     monkeypatch.setattr(
-        requests,
+        requests.Session,
         "get",
         build_request_mock({"url": "https://pwpush.test/en/p/text-password-url"}),
     )
@@ -55,10 +58,10 @@ def test_file_push(monkeypatch):
     monkeypatch.setitem(user_config["instance"], "token", "token-value")
 
     monkeypatch.setattr(
-        requests, "post", build_request_mock({"url_token": "super-token"})
+        requests.Session, "post", build_request_mock({"url_token": "super-token"})
     )
     monkeypatch.setattr(
-        requests,
+        requests.Session,
         "get",
         build_request_mock({"url": "https://pwpush.test/en/f/secret-file-url"}),
     )
@@ -466,3 +469,154 @@ def test_push_file_with_name(mock_make_request, monkeypatch):
     assert post_call is not None
     # For file pushes, the data structure uses "file_push" key
     assert post_call[1]["post_data"]["file_push"]["name"] == "Q4 Financial Report"
+
+
+def test_push_skip_preview_uses_create_response(mock_make_request, monkeypatch):
+    """Test skip_preview mode prints the share URL without a preview request."""
+    monkeypatch.setitem(user_config["cli"], "skip_preview", "True")
+
+    result = runner.invoke(app, ["push", "--secret", "test-secret"])
+
+    assert result.exit_code == 0
+    assert "https://pwpush.test/en/p/text-password-url" in result.stdout
+    methods = [call.args[0] for call in mock_make_request.call_args_list]
+    assert methods == ["POST"]
+
+
+def test_push_skip_preview_falls_back_when_url_unknown(mock_make_request, monkeypatch):
+    """Test skip_preview mode still previews when the URL cannot be derived."""
+    monkeypatch.setitem(user_config["cli"], "skip_preview", "True")
+    mock_make_request.return_value.json.side_effect = [
+        {"url_token": "super-token"},
+        {"url": "https://pwpush.test/en/p/previewed"},
+    ]
+
+    result = runner.invoke(app, ["push", "--secret", "test-secret"])
+
+    assert result.exit_code == 0
+    assert "https://pwpush.test/en/p/previewed" in result.stdout
+    methods = [call.args[0] for call in mock_make_request.call_args_list]
+    assert methods == ["POST", "GET"]
+
+
+def test_push_file_multiple_paths_share_one_push(
+    mock_make_request, monkeypatch, tmp_path
+):
+    """Test push-file with several paths uploads them all in one request."""
+    monkeypatch.setitem(user_config["instance"], "token", "token-value")
+    for file_name in ("a.txt", "b.txt"):
+        (tmp_path / file_name).write_text(file_name)
+
+    result = runner.invoke(
+        app, ["push-file", str(tmp_path / "a.txt"), str(tmp_path / "b.txt")]
+    )
+
+    assert result.exit_code == 0
+    post_call = _get_post_call(mock_make_request)
+    uploads = post_call[1]["upload_files"]["file_push[files][]"]
+    assert [os.path.basename(fd.name) for fd in uploads] == ["a.txt", "b.txt"]
+    assert "https://pwpush.test/en/p/text-password-url" in result.stdout
+
+
+def test_push_file_each_creates_one_push_per_glob_match(
+    mock_make_request, monkeypatch, tmp_path
+):
+    """Test push-file --each expands globs and prints one JSON line per file."""
+    monkeypatch.setitem(user_config["instance"], "token", "token-value")
+    for file_name in ("one.log", "two.log", "skip.txt"):
+        (tmp_path / file_name).write_text(file_name)
+
+    result = runner.invoke(
+        app, ["push-file", str(tmp_path / "*.log"), "--each", "-c", "2"]
+    )
+
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert sorted(os.path.basename(line["file"]) for line in lines) == [
+        "one.log",
+        "two.log",
+    ]
+    assert all(line["url_token"] == "super-token" for line in lines)
+    posts = [c for c in mock_make_request.call_args_list if c.args[0] == "POST"]
+    assert len(posts) == 2
+
+
+def test_push_file_each_with_one_file_prints_one_json_line(
+    mock_make_request, monkeypatch, tmp_path
+):
+    """Test push-file --each keeps its JSON-lines output for a single match."""
+    monkeypatch.setitem(user_config["instance"], "token", "token-value")
+    (tmp_path / "only.log").write_text("only")
+
+    result = runner.invoke(app, ["push-file", str(tmp_path / "*.log"), "--each"])
+
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert len(lines) == 1
+    assert os.path.basename(lines[0]["file"]) == "only.log"
+    assert lines[0]["url_token"] == "super-token"
+
+
+def test_push_file_each_reports_failures_per_file(
+    mock_make_request, monkeypatch, tmp_path
+):
+    """Test push-file --each keeps going when a file is missing."""
+    monkeypatch.setitem(user_config["instance"], "token", "token-value")
+    (tmp_path / "present.txt").write_text("data")
+
+    result = runner.invoke(
+        app,
+        [
+            "push-file",
+            str(tmp_path / "present.txt"),
+            str(tmp_path / "missing.txt"),
+            "--each",
+        ],
+    )
+
+    assert result.exit_code == 1
+    lines = {
+        os.path.basename(line["file"]): line
+        for line in map(json.loads, result.stdout.splitlines())
+    }
+    assert lines["present.txt"]["url_token"] == "super-token"
+    assert "not found" in lines["missing.txt"]["error"]
+
+
+def test_push_file_each_reports_connection_errors_per_file(monkeypatch, tmp_path):
+    """Test push-file --each reports the real error and keeps stdout JSON-only."""
+    monkeypatch.setitem(user_config["instance"], "token", "token-value")
+    for file_name in ("a.txt", "b.txt"):
+        (tmp_path / file_name).write_text(file_name)
+
+    with (
+        patch("pwpush.__main__.current_api_profile", return_value="legacy"),
+        patch(
+            "pwpush.commands.push.detect_api_capabilities",
+            return_value={"api_version": None, "features": {}},
+        ),
+        patch(
+            "pwpush.__main__.perform_request",
+            side_effect=PwpushTimeoutError("Request timed out after 30 seconds"),
+        ),
+    ):
+        result = runner.invoke(app, ["push-file", str(tmp_path / "*.txt"), "--each"])
+
+    assert result.exit_code == 1
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert sorted(line["file"] for line in lines) == [
+        str(tmp_path / "a.txt"),
+        str(tmp_path / "b.txt"),
+    ]
+    assert all(line["error"] == "Request timed out after 30 seconds" for line in lines)
+
+
+def test_push_file_glob_without_matches_fails(mock_make_request, monkeypatch, tmp_path):
+    """Test push-file reports a glob that matches nothing."""
+    monkeypatch.setitem(user_config["instance"], "token", "token-value")
+
+    result = runner.invoke(app, ["push-file", str(tmp_path / "*.none")])
+
+    assert result.exit_code == 1
+    assert "No files match" in result.stdout
+    mock_make_request.assert_not_called()
@@ -0,0 +1,213 @@
+"""Tests for the synchronous PushClient library class."""
+
+import os
+import subprocess
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from pwpush.api.errors import PwpushAPIError, PwpushConnectionError
+from pwpush.api.push_client import PushClient
+from pwpush.api.results import AuditEvent, Push
+
+
+def _response(status_code=200, body=None, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = body
+    response.text = str(body)
+    response.headers = headers or {}
+    return response
+
+
+@pytest.fixture
+def client():
+    return PushClient(
+        "https://pwpush.test/",
+        email="user@test.com",
+        token="valid-token",
+        api_profile="v2",
+    )
+
+
+def test_create_push_returns_typed_push(client):
+    created = _response(
+        201,
+        {
+            "url_token": "tok1",
+            "kind": "text",
+            "expire_after_views": 3,
+            "views_remaining": 3,
+            "retrieval_step": False,
+            "created_at": "2024-01-15T10:30:00Z",
+        },
+    )
+
+    with patch("pwpush.api.push_client.perform_request", return_value=created) as mock:
+        push = client.create_push("s3cret", views=3, name="db")
+
+    assert push == Push(
+        url_token="tok1",
+        url="https://pwpush.test/p/tok1",
+        kind="text",
+        name=None,
+        note=None,
+        expire_after_days=None,
+        expire_after_views=3,
+        days_remaining=None,
+        views_remaining=3,
+        expired=False,
+        created_at="2024-01-15T10:30:00Z",
+    )
+    assert mock.call_count == 1
+    assert mock.call_args.kwargs["path"] == "/api/v2/pushes"
+    assert mock.call_args.kwargs["post_data"] == {
+        "push": {
+            "payload": "s3cret",
+            "kind": "text",
+            "expire_after_views": 3,
+            "name": "db",
+        }
+    }
+    assert mock.call_args.kwargs["base_url"] == "https://pwpush.test"
+
+
+def test_create_push_falls_back_to_preview_for_url(client):
+    responses = [
+        _response(201, {"url_token": "tok1"}),
+        _response(200, {"url": "https://pwpush.test/p/tok1/r"}),
+    ]
+
+    with patch("pwpush.api.push_client.perform_request", side_effect=responses) as mock:
+        push = client.create_push("s3cret")
+
+    assert push.url == "https://pwpush.test/p/tok1/r"
+    assert mock.call_args.kwargs["path"] == "/api/v2/pushes/tok1/preview"
+
+
+def test_account_id_is_added_to_created_pushes():
+    client = PushClient("https://pwpush.test", api_profile="legacy", account_id="7")
+    created = _response(201, {"url_token": "tok1", "url": "u"})
+
+    with patch("pwpush.api.push_client.perform_request", return_value=created) as mock:
+        client.create_push("s3cret")
+
+    assert mock.call_args.kwargs["path"] == "/p.json"
+    assert mock.call_args.kwargs["post_data"]["account_id"] == "7"
+
+
+def test_audit_push_returns_events_in_order(client):
+    body = {
+        "logs": [
+            {"ip": "1.1.1.1", "kind": "view", "created_at": "2024-01-16T00:00:00Z"},
+            {"ip": "2.2.2.2", "kind": "view", "created_at": "2024-01-15T00:00:00Z"},
+        ]
+    }
+
+    with patch(
+        "pwpush.api.push_client.perform_request", return_value=_response(200, body)
+    ):
+        events = client.audit_push("tok1")
+
+    assert [event.ip for event in events] == ["2.2.2.2", "1.1.1.1"]
+    assert isinstance(events[0], AuditEvent)
+    assert events[0].successful is True
+    assert events[0].timestamp == "2024-01-15T00:00:00Z"
+
+
+def test_list_pushes_pages_lazily(client):
+    link = {"Link": '<https://pwpush.test/api/v2/pushes/active?page=2>; rel="next"'}
+    responses = [
+        _response(200, [{"url_token": "tok1"}, {"url_token": "tok2"}], link),
+        _response(200, [{"url_token": "tok3"}]),
+    ]
+
+    with patch("pwpush.api.push_client.perform_request", side_effect=responses) as mock:
+        pushes = client.list_pushes()
+        first = next(pushes)
+        assert mock.call_count == 1
+        rest = list(pushes)
+
+    assert [push.url_token for push in [first, *rest]] == ["tok1", "tok2", "tok3"]
+    assert mock.call_args.kwargs["path"] == "/api/v2/pushes/active?page=2"
+
+
+def test_list_pushes_without_pagination_headers_fetches_one_page(client):
+    with patch(
+        "pwpush.api.push_client.perform_request",
+        return_value=_response(200, [{"url_token": "tok1"}, {"url_token": "tok2"}]),
+    ) as mock:
+        pushes = list(client.list_pushes())
+
+    assert [push.url_token for push in pushes] == ["tok1", "tok2"]
+    assert mock.call_count == 1
+
+
+def test_error_status_raises_api_error(client):
+    with patch(
+        "pwpush.api.push_client.perform_request",
+        return_value=_response(404, {"error": "Push not found"}),
+    ):
+        with pytest.raises(PwpushAPIError) as excinfo:
+            client.expire_push("missing")
+
+    assert excinfo.value.status_code == 404
+    assert excinfo.value.message == "Push not found"
+
+
+def test_network_errors_raise_instead_of_exiting(client):
+    session = MagicMock()
+    session.get.side_effect = requests.exceptions.ConnectionError("refused")
+
+    with patch("pwpush.api.client.get_session", return_value=session):
+        with pytest.raises(PwpushConnectionError, match="Could not connect"):
+            client.preview_push("tok1")
+
+
+def test_profile_is_detected_once():
+    client = PushClient("https://pwpush.test")
+
+    with patch(
+        "pwpush.api.push_client.detect_api_profile", return_value="legacy"
+    ) as detect:
+        assert client.api_profile == "legacy"
+        assert client.api_profile == "legacy"
+
+    detect.assert_called_once()
+
+
+def test_import_does_not_load_cli_or_config(tmp_path):
+    env = {**os.environ, "HOME": str(tmp_path), "XDG_CONFIG_HOME": str(tmp_path)}
+    code = (
+        "import sys; import pwpush.api.push_client; "
+        "from pwpush.options import user_config; "
+        "print('pwpush.__main__' in sys.modules, user_config.sections())"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False []"
+
+
+def test_import_does_not_load_typer_or_rich():
+    code = (
+        "import sys; import pwpush.api.push_client, pwpush.api.async_client; "
+        "print(sorted(m for m in ('typer', 'rich') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
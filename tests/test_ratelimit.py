@@ -0,0 +1,172 @@
+"""Tests for the client-side token-bucket rate limiter."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from pwpush.__main__ import app, make_request, rate_limit
+from pwpush.api import ratelimit
+from pwpush.api.client import normalize_base_url, perform_request
+from pwpush.api.ratelimit import RateLimiter, get_rate_limiter
+from pwpush.options import user_config
+
+runner = CliRunner()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_limiters():
+    ratelimit._limiters.clear()
+    yield
+    ratelimit._limiters.clear()
+
+
+@pytest.fixture
+def clock():
+    """Freeze time.time() for the limiter; advance it with clock.now += s."""
+    fake = MagicMock()
+    fake.now = 1000.0
+    with patch("pwpush.api.ratelimit.time.time", side_effect=lambda: fake.now):
+        yield fake
+
+
+@pytest.mark.parametrize("shared", [True, False])
+def test_burst_then_evenly_spaced_reservations(clock, shared):
+    limiter = RateLimiter("https://pwpush.test", rate=10, burst=2, shared=shared)
+
+    waits = [limiter.reserve() for _ in range(5)]
+
+    assert waits == pytest.approx([0, 0, 0.1, 0.2, 0.3])
+
+
+def test_bucket_refills_over_time(clock):
+    limiter = RateLimiter("https://pwpush.test", rate=2, burst=2)
+    limiter.reserve()
+    limiter.reserve()
+
+    assert limiter.reserve() == pytest.approx(0.5)
+    clock.now += 10
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 0
+
+
+def test_limiters_share_the_bucket_through_the_file(clock):
+    first = RateLimiter("https://pwpush.test", rate=1, burst=1)
+    second = RateLimiter("https://pwpush.test", rate=1, burst=1)
+    other_instance = RateLimiter("https://other.test", rate=1, burst=1)
+
+    assert first.reserve() == 0
+    assert second.reserve() == pytest.approx(1)
+    assert other_instance.reserve() == 0
+
+
+def test_other_process_consumes_the_shared_bucket(tmp_path):
+    env = {**os.environ, "HOME": str(tmp_path), "XDG_CONFIG_HOME": str(tmp_path)}
+    code = (
+        "from pwpush.api.ratelimit import RateLimiter, rate_limit_file; "
+        "limiter = RateLimiter('https://pwpush.test', rate=0.01, burst=3); "
+        "[limiter.reserve() for _ in range(3)]; "
+        "print(rate_limit_file)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+
+    with patch("pwpush.api.ratelimit.rate_limit_file", Path(result.stdout.strip())):
+        limiter = RateLimiter("https://pwpush.test", rate=0.01, burst=3)
+        assert limiter.reserve() > 90
+
+
+def test_corrupt_state_file_is_replaced(clock, tmp_path):
+    state = tmp_path / "ratelimit.json"
+    state.write_text("not json{", encoding="utf-8")
+    limiter = RateLimiter("https://pwpush.test", rate=1, burst=1)
+
+    with patch("pwpush.api.ratelimit.rate_limit_file", state):
+        assert limiter.reserve() == 0
+        assert limiter.reserve() == pytest.approx(1)
+
+    assert '"https://pwpush.test"' in state.read_text(encoding="utf-8")
+
+
+def test_unwritable_state_file_falls_back_to_process_bucket(clock, tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("", encoding="utf-8")
+    limiter = RateLimiter("https://pwpush.test", rate=1, burst=1)
+
+    with patch("pwpush.api.ratelimit.rate_limit_file", blocker / "ratelimit.json"):
+        assert limiter.reserve() == 0
+        assert limiter.reserve() == pytest.approx(1)
+
+
+def test_get_rate_limiter_is_disabled_by_default():
+    assert get_rate_limiter("https://pwpush.test", 0, 5) is None
+    limiter = get_rate_limiter("https://pwpush.test", 2, 5)
+    assert limiter is get_rate_limiter("https://pwpush.test", 2, 5)
+
+
+def test_perform_request_paces_every_attempt(clock):
+    limited = MagicMock(status_code=403, headers={}, text="Rate limit exceeded")
+    ok = MagicMock(status_code=200)
+    session = MagicMock()
+    session.get.side_effect = [limited, ok]
+
+    with (
+        patch("pwpush.api.client.get_session", return_value=session),
+        patch("pwpush.api.ratelimit.time.sleep") as sleep,
+    ):
+        response = perform_request(
+            "GET",
+            base_url="https://pwpush.test/",
+            path="/api/v2/version",
+            email="Not Set",
+            token="Not Set",
+            rate_limit=4,
+            rate_burst=1,
+        )
+
+    assert response is ok
+    assert session.get.call_count == 2
+    assert pytest.approx(0.25) in [call.args[0] for call in sleep.call_args_list]
+
+
+def test_make_request_uses_configured_rate_limit(monkeypatch):
+    monkeypatch.setitem(user_config["cli"], "rate_limit", "2.5")
+    monkeypatch.setitem(user_config["cli"], "rate_burst", "3")
+    session = MagicMock()
+    session.get.return_value = MagicMock(status_code=200)
+
+    with (
+        patch("pwpush.api.client.get_session", return_value=session),
+        patch("pwpush.api.client.get_rate_limiter", return_value=None) as get_limiter,
+    ):
+        make_request("GET", "/api/v2/version")
+
+    get_limiter.assert_called_once_with(
+        normalize_base_url(user_config["instance"]["url"]), 2.5, 3
+    )
+
+
+@pytest.mark.parametrize(
+    "value,expected", [("abc", "0.0"), ("-1", "0.0"), ("inf", "0.0"), ("3", "3.0")]
+)
+def test_rate_limit_setting_is_validated(value, expected):
+    with patch.dict(user_config["cli"], {"rate_limit": value}):
+        assert str(rate_limit()) == expected
+
+
+def test_config_show_lists_rate_settings():
+    result = runner.invoke(app, ["config", "show"])
+
+    assert result.exit_code == 0
+    assert "rate_limit" in result.stdout
+    assert "rate_burst" in result.stdout
@@ -0,0 +1,343 @@
+"""Tests for the retry policy and Retry-After handling."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from typer.testing import CliRunner
+from urllib3.exceptions import NewConnectionError, ProtocolError
+
+from pwpush.__main__ import app, retry_policy
+from pwpush.api.client import perform_request
+from pwpush.api.errors import PwpushConnectionError, PwpushConnectionResetError
+from pwpush.api.retry import (
+    RetryBudget,
+    RetryPolicy,
+    parse_retry_statuses,
+    retry_after_seconds,
+)
+from pwpush.options import user_config
+
+runner = CliRunner()
+
+
+def _response(status_code=200, headers=None, text=""):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.text = text
+    return response
+
+
+def _http_date(seconds_from_now):
+    moment = datetime.now(timezone.utc) + timedelta(seconds=seconds_from_now)
+    return format_datetime(moment, usegmt=True)
+
+
+def _request(method="GET", **kwargs):
+    return perform_request(
+        method,
+        base_url="https://pwpush.test",
+        path="/api/v2/pushes/tok1",
+        email="Not Set",
+        token="Not Set",
+        **kwargs,
+    )
+
+
+class TestRetryAfter:
+    def test_seconds(self):
+        assert retry_after_seconds(_response(headers={"retry-after": "12"})) == 12
+
+    def test_http_date(self):
+        response = _response(headers={"retry-after": _http_date(20)})
+
+        assert retry_after_seconds(response) == pytest.approx(20, abs=2)
+
+    def test_http_date_in_the_past_means_now(self):
+        response = _response(headers={"retry-after": _http_date(-60)})
+
+        assert retry_after_seconds(response) == 0
+
+    @pytest.mark.parametrize("value", [None, "", "soon", "nan"])
+    def test_missing_or_invalid(self, value):
+        headers = {} if value is None else {"retry-after": value}
+
+        assert retry_after_seconds(_response(headers=headers)) is None
+
+    def test_next_delay_uses_http_date(self):
+        response = _response(headers={"retry-after": _http_date(8)})
+
+        delay = RetryPolicy().next_delay(response, 0, 0, 0)
+
+        assert delay == pytest.approx(8, abs=2)
+
+
+def test_parse_retry_statuses():
+    assert parse_retry_statuses(" 429, 503 ,") == frozenset({429, 503})
+    with pytest.raises(ValueError):
+        parse_retry_statuses("200")
+    with pytest.raises(ValueError):
+        parse_retry_statuses("abc")
+
+
+class TestRetryPolicy:
+    @pytest.mark.parametrize(
+        "method,status,idempotent_only,expected",
+        [
+            ("GET", 503, True, True),
+            ("DELETE", 502, True, True),
+            ("POST", 503, True, False),
+            ("POST", 503, False, True),
+            ("POST", 429, True, True),
+            ("GET", 404, True, False),
+            ("GET", 500, True, False),
+        ],
+    )
+    def test_retries_response(self, method, status, idempotent_only, expected):
+        policy = RetryPolicy(idempotent_only=idempotent_only)
+
+        assert policy.retries_response(method, _response(status), False) is expected
+
+    def test_rate_limited_403_is_always_retried(self):
+        policy = RetryPolicy(statuses=frozenset())
+
+        assert policy.retries_response("POST", _response(403), True) is True
+
+    def test_decorrelated_backoff_grows_within_bounds(self):
+        policy = RetryPolicy(base_delay=1, max_delay=10)
+        previous = 0.0
+        for attempt in range(20):
+            delay = policy.backoff(attempt, previous)
+            assert 1 <= delay <= min(max(previous * 3, 1), 10)
+            previous = delay
+
+    def test_full_jitter_backoff(self):
+        policy = RetryPolicy(jitter="full", base_delay=1, max_delay=10)
+
+        assert all(1 <= policy.backoff(5, 0) <= 10 for _ in range(20))
+
+    def test_stops_after_max_retries(self):
+        policy = RetryPolicy(max_retries=2)
+
+        assert policy.next_delay(_response(503), 1, 1.0, 0) is not None
+        assert policy.next_delay(_response(503), 2, 1.0, 0) is None
+
+    def test_long_retry_after_is_capped_without_a_deadline(self):
+        policy = RetryPolicy(max_delay=30)
+
+        assert policy.next_delay(_response(429, {"retry-after": "5"}), 0, 0, 0) == 5
+        assert policy.next_delay(_response(429, {"retry-after": "60"}), 0, 0, 0) == 30
+
+    def test_long_retry_after_is_honoured_within_the_deadline(self):
+        policy = RetryPolicy(max_delay=30, deadline=90)
+        response = _response(429, {"retry-after": "60"})
+
+        assert policy.next_delay(response, 0, 0, 0) == 60
+        assert policy.next_delay(response, 1, 60, elapsed=45) is None
+
+    def test_deadline(self):
+        policy = RetryPolicy(deadline=10)
+        response = _response(503, {"retry-after": "4"})
+
+        assert policy.next_delay(response, 0, 0, elapsed=5) == 4
+        assert policy.next_delay(response, 1, 4, elapsed=7) is None
+
+    def test_budget_is_shared_and_only_charged_for_granted_retries(self):
+        budget = RetryBudget(2)
+        first = RetryPolicy(budget=budget)
+        second = RetryPolicy(budget=budget, deadline=1)
+
+        assert second.next_delay(_response(503, {"retry-after": "5"}), 0, 0, 0) is None
+        assert first.next_delay(_response(503), 0, 0, 0) is not None
+        assert second.next_delay(_response(503), 0, 0, 0) is not None
+        assert first.next_delay(_response(503), 0, 0, 0) is None
+        assert budget.remaining == 0
+
+
+class TestPerformRequestRetries:
+    @patch("pwpush.api.client.time.sleep")
+    def test_gateway_errors_are_retried_for_get(self, mock_sleep):
+        session = MagicMock()
+        session.get.side_effect = [_response(502), _response(504), _response(200)]
+
+        with patch("pwpush.api.client.get_session", return_value=session):
+            response = _request("GET")
+
+        assert response.status_code == 200
+        assert session.get.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    @patch("pwpush.api.client.time.sleep")
+    def test_gateway_errors_are_not_retried_for_post_by_default(self, mock_sleep):
+        session = MagicMock()
+        session.post.return_value = _response(503)
+
+        with patch("pwpush.api.client.get_session", return_value=session):
+            response = _request("POST", post_data={"push": {}})
+
+        assert response.status_code == 503
+        assert session.post.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("pwpush.api.client.time.sleep")
+    def test_too_many_requests_is_retried_for_post(self, mock_sleep):
+        session = MagicMock()
+        session.post.side_effect = [
+            _response(429, {"retry-after": _http_date(3)}),
+            _response(201),
+        ]
+
+        with patch("pwpush.api.client.get_session", return_value=session):
+            response = _request("POST", post_data={"push": {}})
+
+        assert response.status_code == 201
+        assert mock_sleep.call_args.args[0] == pytest.approx(3, abs=2)
+
+    @patch("pwpush.api.client.time.sleep")
+    def test_connection_resets_are_retried(self, mock_sleep):
+        reset = requests.exceptions.ConnectionError(
+            ProtocolError("Connection aborted.", ConnectionResetError(104, "reset"))
+        )
+        session = MagicMock()
+        session.delete.side_effect = [reset, _response(200)]
+
+        with patch("pwpush.api.client.get_session", return_value=session):
+            response = _request("DELETE")
+
+        assert response.status_code == 200
+        assert session.delete.call_count == 2
+
+    @patch("pwpush.api.client.time.sleep")
+    def test_connection_resets_raise_after_retries(self, mock_sleep):
+        reset = requests.exceptions.ConnectionError(
+            ProtocolError("Connection aborted.", ConnectionResetError(104, "reset"))
+        )
+        session = MagicMock()
+        session.get.side_effect = reset
+
+        with patch("pwpush.api.client.get_session", return_value=session):
+            with pytest.raises(PwpushConnectionResetError):
+                _request("GET", retry_policy=RetryPolicy(max_retries=2))
+
+        assert session.get.call_count == 3
+
+    @patch("pwpush.api.client.time.sleep")
+    def test_refused_connections_are_not_retried(self, mock_sleep):
+        refused = requests.exceptions.ConnectionError(
+            NewConnectionError(MagicMock(), "Connection refused")
+        )
+        session = MagicMock()
+        session.get.side_effect = refused
+
+        with patch("pwpush.api.client.get_session", return_value=session):
+            with pytest.raises(PwpushConnectionError) as excinfo:
+                _request("GET")
+
+        assert not isinstance(excinfo.value, PwpushConnectionResetError)
+        assert session.get.call_count == 1
+        mock_sleep.assert_not_called()
+
+
+class TestCliRetryPolicy:
+    def test_policy_comes_from_config(self, monkeypatch):
+        monkeypatch.setitem(user_config["cli"], "max_retries", "5")
+        monkeypatch.setitem(user_config["cli"], "retry_statuses", "503")
+        monkeypatch.setitem(user_config["cli"], "retry_methods", "all")
+        monkeypatch.setitem(user_config["cli"], "retry_deadline", "60")
+        monkeypatch.setitem(user_config["cli"], "retry_jitter", "full")
+
+        policy = retry_policy()
+
+        assert policy == RetryPolicy(
+            max_retries=5,
+            statuses=frozenset({503}),
+            idempotent_only=False,
+            deadline=60,
+            jitter="full",
+        )
+
+    def test_invalid_config_values_fall_back_to_defaults(self, monkeypatch):
+        monkeypatch.setitem(user_config["cli"], "max_retries", "many")
+        monkeypatch.setitem(user_config["cli"], "retry_statuses", "oops")
+        monkeypatch.setitem(user_config["cli"], "retry_jitter", "wild")
+
+        assert retry_policy() == RetryPolicy()
+
+    @patch("pwpush.api.client.time.sleep")
+    def test_command_line_overrides_config(self, mock_sleep, monkeypatch):
+        monkeypatch.setitem(user_config["instance"], "token", "secret-token")
+        session = MagicMock()
+        session.delete.return_value = _response(503)
+
+        with (
+            patch("pwpush.__main__.current_api_profile", return_value="v2"),
+            patch("pwpush.api.client.get_session", return_value=session),
+        ):
+            result = runner.invoke(
+                app, ["--retries", "1", "--retry-on", "503", "expire", "tok1"]
+            )
+
+        assert result.exit_code == 1
+        assert session.delete.call_count == 2
+
+    @patch("pwpush.api.client.time.sleep")
+    def test_long_retry_after_waits_the_capped_delay(self, mock_sleep, monkeypatch):
+        monkeypatch.setitem(user_config["instance"], "token", "secret-token")
+        session = MagicMock()
+        session.delete.side_effect = [
+            _response(429, {"retry-after": "120"}),
+            _response(200, text="{}"),
+        ]
+
+        with (
+            patch("pwpush.__main__.current_api_profile", return_value="v2"),
+            patch("pwpush.api.client.get_session", return_value=session),
+        ):
+            runner.invoke(app, ["expire", "tok1"])
+
+        assert session.delete.call_count == 2
+        mock_sleep.assert_called_once_with(30.0)
+
+    def test_invalid_command_line_values_are_rejected(self):
+        result = runner.invoke(app, ["--retry-on", "ok", "expire", "tok1"])
+
+        assert result.exit_code == 1
+        assert "Invalid --retry-on" in result.output
+
+    @patch("pwpush.api.client.time.sleep")
+    def test_budget_caps_retries_across_a_batch(self, mock_sleep):
+        session = MagicMock()
+        session.post.return_value = _response(503)
+        records = "\n".join(json.dumps({"secret": f"s{i}"}) for i in range(4))
+
+        with (
+            patch("pwpush.__main__.current_api_profile", return_value="legacy"),
+            patch("pwpush.api.client.get_session", return_value=session),
+        ):
+            result = runner.invoke(
+                app,
+                [
+                    "--retry-methods",
+                    "all",
+                    "--retry-budget",
+                    "2",
+                    "push-batch",
+                    "--concurrency",
+                    "1",
+                ],
+                input=records,
+            )
+
+        assert result.exit_code == 1
+        assert session.post.call_count == 4 + 2
+
+    def test_config_show_lists_retry_settings(self):
+        result = runner.invoke(app, ["config", "show"])
+
+        assert result.exit_code == 0
+        for key in ("max_retries", "retry_statuses", "retry_budget", "retry_jitter"):
+            assert key in result.stdout
@@ -0,0 +1,141 @@
+"""Tests for the local daemon and its thin client."""
+
+import io
+import stat
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pwpush.api import capabilities
+from pwpush.commands.config import user_config
+from pwpush.commands.serve import _Daemon, make_server
+from pwpush.daemon import forward
+
+
+class _UnreadableStdin(io.StringIO):
+    def read(self, *args):
+        raise AssertionError("stdin was read")
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """Run a daemon on a temporary socket and return the socket path."""
+    socket_path = tmp_path / "pwpush.sock"
+    server = make_server(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield socket_path
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def _forward(socket_path, argv, stdin=None):
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = forward(
+        argv,
+        str(socket_path),
+        stdin=stdin or _UnreadableStdin(),
+        stdout=stdout,
+        stderr=stderr,
+    )
+    return exit_code, stdout.getvalue(), stderr.getvalue()
+
+
+def test_forwarded_command_streams_output(daemon):
+    exit_code, stdout, _ = _forward(daemon, ["generate", "-n", "3", "-l", "12"])
+
+    assert exit_code == 0
+    assert [len(line) for line in stdout.splitlines()] == [12, 12, 12]
+
+
+def test_forwarded_command_reports_exit_code(daemon):
+    exit_code, stdout, _ = _forward(daemon, ["--json", "generate", "-n", "0"])
+
+    assert exit_code == 1
+    assert '"error": "--count must be at least 1."' in stdout
+
+
+def test_usage_errors_go_to_stderr(daemon):
+    exit_code, stdout, stderr = _forward(daemon, ["no-such-command"])
+
+    assert exit_code == 2
+    assert stdout == ""
+    assert "No such command" in stderr
+
+
+def test_global_options_do_not_leak_between_commands(daemon):
+    _forward(daemon, ["--json", "generate", "-n", "0"])
+
+    exit_code, stdout, _ = _forward(daemon, ["generate", "-n", "0"])
+
+    assert exit_code == 1
+    assert stdout.startswith("Error: --count")
+
+
+def test_stdin_is_sent_when_the_command_reads_it(daemon, monkeypatch):
+    monkeypatch.setitem(user_config["instance"], "token", "valid-token")
+    response = MagicMock(status_code=200)
+    response.json.return_value = {"expired": True}
+
+    with (
+        patch("pwpush.__main__.current_api_profile", return_value="v2"),
+        patch("pwpush.__main__.make_request", return_value=response) as mock,
+    ):
+        exit_code, _, _ = _forward(
+            daemon,
+            ["expire", "--from", "-", "--json"],
+            stdin=io.StringIO("tok1\ntok2\n"),
+        )
+
+    assert exit_code == 0
+    assert sorted(call.args[1] for call in mock.call_args_list) == [
+        "/api/v2/pushes/tok1",
+        "/api/v2/pushes/tok2",
+    ]
+
+
+def test_forward_without_daemon_returns_none(tmp_path):
+    assert forward(["generate"], str(tmp_path / "missing.sock")) is None
+
+
+def test_socket_is_private_and_not_shared(daemon):
+    assert stat.S_IMODE(daemon.stat().st_mode) == 0o600
+
+    with pytest.raises(ValueError, match="already listening"):
+        make_server(daemon)
+
+
+def test_stale_socket_is_replaced(tmp_path):
+    socket_path = tmp_path / "pwpush.sock"
+    make_server(socket_path).server_close()
+
+    server = make_server(socket_path)
+    server.server_close()
+
+
+def test_refuses_to_replace_other_files(tmp_path):
+    socket_path = tmp_path / "pwpush.sock"
+    socket_path.write_text("not a socket")
+
+    with pytest.raises(ValueError, match="not a socket"):
+        make_server(socket_path)
+
+
+def test_config_change_drops_cached_discovery(tmp_path, monkeypatch):
+    config_file = tmp_path / "config.ini"
+    config_file.write_text("")
+    monkeypatch.setattr("pwpush.commands.serve.user_config_file", config_file)
+    server = _Daemon()
+    capabilities._discovery_cache["https://old.test"] = (0.0, {"profile": "v2"})
+
+    server._refresh_config()
+    assert "https://old.test" in capabilities._discovery_cache
+
+    config_file.write_text("[instance]\nurl = https://new.test\n")
+    with patch("pwpush.commands.serve.load_config") as load_config:
+        server._refresh_config()
+
+    load_config.assert_called_once()
+    assert capabilities._discovery_cache == {}
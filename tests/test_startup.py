@@ -0,0 +1,82 @@
+"""Import-time budget tests for CLI cold start."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Generous ceiling for the summed import time of a non-network command; a
+# cold start is ~200ms locally. Override on slow CI runners if needed.
+IMPORT_BUDGET_MS = float(os.environ.get("PWPUSH_IMPORT_BUDGET_MS", "500"))
+
+# Dependencies that only network, date-formatting or passphrase commands need.
+HEAVY_MODULES = ("requests", "urllib3", "dateutil", "xkcdpass")
+
+COMMON_COMMANDS = [
+    ["--version"],
+    ["--help"],
+    ["config", "show"],
+    ["push", "--help"],
+]
+
+
+def _import_times(args: list[str], home: str) -> dict[str, int]:
+    """Run the CLI under -X importtime and return self-time (us) per module."""
+    env = {**os.environ, "HOME": home, "XDG_CONFIG_HOME": home}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "pwpush", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+
+@pytest.mark.parametrize("args", COMMON_COMMANDS, ids=" ".join)
+def test_common_commands_skip_heavy_imports(args: list[str], tmp_path: Path) -> None:
+    times = _import_times(args, str(tmp_path))
+
+    loaded = sorted(name for name in times if name.split(".")[0] in HEAVY_MODULES)
+    assert loaded == []
+
+
+@pytest.mark.parametrize("args", COMMON_COMMANDS, ids=" ".join)
+def test_common_commands_stay_within_import_budget(
+    args: list[str], tmp_path: Path
+) -> None:
+    times = _import_times(args, str(tmp_path))
+
+    total_ms = sum(times.values()) / 1000
+    assert total_ms < IMPORT_BUDGET_MS, (
+        f"Imports took {total_ms:.0f}ms for 'pwpush {' '.join(args)}' "
+        f"(budget {IMPORT_BUDGET_MS:.0f}ms)"
+    )
+
+
+def test_importing_options_does_not_read_config(tmp_path: Path) -> None:
+    env = {**os.environ, "HOME": str(tmp_path), "XDG_CONFIG_HOME": str(tmp_path)}
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from pwpush.options import user_config; print(user_config.sections())",
+        ],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,78 @@
+"""Microbenchmark for timestamp formatting in audit and list rendering."""
+
+from typing import Any
+
+import os
+import time
+from datetime import timezone
+from unittest.mock import patch
+
+from pwpush.api.endpoints import normalize_audit_events
+from pwpush.utils import format_timestamp, parse_timestamp, utc_timestamp
+
+EVENT_COUNT = 100_000
+
+# Generous ceiling for normalizing EVENT_COUNT audit events; this takes well
+# under a second locally. Override on slow CI runners if needed.
+NORMALIZE_BUDGET_MS = float(os.environ.get("PWPUSH_NORMALIZE_BUDGET_MS", "5000"))
+
+
+def _audit_body() -> dict[str, Any]:
+    """A v2 audit log with EVENT_COUNT distinct millisecond timestamps."""
+    return {
+        "logs": [
+            {
+                "ip": "10.0.0.1",
+                "user_agent": "curl/8.0",
+                "created_at": (
+                    f"2024-01-{i % 28 + 1:02d}T{i // 3600 % 24:02d}:"
+                    f"{i // 60 % 60:02d}:{i % 60:02d}.{i % 1000:03d}Z"
+                ),
+                "kind": "password_viewed",
+            }
+            for i in range(EVENT_COUNT)
+        ]
+    }
+
+
+def _clear_caches() -> None:
+    parse_timestamp.cache_clear()
+    format_timestamp.cache_clear()
+    utc_timestamp.cache_clear()
+
+
+def test_normalize_100k_audit_events_within_budget() -> None:
+    body = _audit_body()
+    _clear_caches()
+
+    with patch("dateutil.parser.isoparse") as mock_isoparse:
+        start = time.perf_counter()
+        events = normalize_audit_events(body)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+    assert len(events) == EVENT_COUNT
+    mock_isoparse.assert_not_called()
+    assert elapsed_ms < NORMALIZE_BUDGET_MS, (
+        f"Normalizing {EVENT_COUNT} events took {elapsed_ms:.0f}ms "
+        f"(budget {NORMALIZE_BUDGET_MS:.0f}ms)"
+    )
+
+
+def test_fast_path_matches_dateutil() -> None:
+    from dateutil import parser
+
+    values = [event["created_at"] for event in _audit_body()["logs"]]
+
+    def dateutil_times(value: str) -> tuple[str, str]:
+        when = parser.isoparse(value).astimezone(timezone.utc)
+        return (
+            when.strftime("%m/%d/%Y, %H:%M:%S UTC"),
+            when.replace(tzinfo=None).isoformat() + "Z",
+        )
+
+    expected = [dateutil_times(value) for value in values]
+
+    _clear_caches()
+    actual = [(format_timestamp(value), utc_timestamp(value)) for value in values]
+
+    assert actual == expected